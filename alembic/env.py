@@ -16,6 +16,14 @@ if config.config_file_name is not None:
 # Tell Alembic about our models
 target_metadata = Base.metadata
 
+# Search objects created by raw DDL (models/task.TASK_SEARCH_DDL), not the metadata
+UNMANAGED_PREFIXES = ("tasks_fts", "ix_tasks_search")
+
+def include_object(obj, name, type_, reflected, compare_to):
+    if reflected and compare_to is None and name and name.startswith(UNMANAGED_PREFIXES):
+        return False
+    return True
+
 def run_migrations_offline():
     """Run migrations in 'offline' mode'."""
     url = str(engine.url)
@@ -25,6 +33,7 @@ def run_migrations_offline():
         literal_binds=True,
         compare_type=True,
         compare_server_default=True,
+        include_object=include_object,
     )
     with context.begin_transaction():
         context.run_migrations()
@@ -38,6 +47,7 @@ def run_migrations_online():
             target_metadata=target_metadata,
             compare_type=True,
             compare_server_default=True,
+            include_object=include_object,
         )
         with context.begin_transaction():
             context.run_migrations()
@@ -0,0 +1,35 @@
+"""composite indexes for task filters
+
+Revision ID: 1e963c63b6f1
+Revises: 5878646d9371
+Create Date: 2026-10-18 13:55:02.871634
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1e963c63b6f1'
+down_revision: Union[str, Sequence[str], None] = '5878646d9371'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_tasks_assignee_status_due', 'tasks', ['assignee_id', 'status', 'due_date'], unique=False)
+    op.create_index('ix_tasks_status_due', 'tasks', ['status', 'due_date'], unique=False)
+    op.create_index('ix_tasks_priority_due', 'tasks', ['priority', 'due_date'], unique=False)
+    # assignee_id is the leading column of ix_tasks_assignee_status_due
+    op.drop_index(op.f('ix_tasks_assignee_id'), table_name='tasks')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f('ix_tasks_assignee_id'), 'tasks', ['assignee_id'], unique=False)
+    op.drop_index('ix_tasks_priority_due', table_name='tasks')
+    op.drop_index('ix_tasks_status_due', table_name='tasks')
+    op.drop_index('ix_tasks_assignee_status_due', table_name='tasks')
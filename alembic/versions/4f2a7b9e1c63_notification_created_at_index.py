@@ -0,0 +1,28 @@
+"""notification created_at index
+
+Revision ID: 4f2a7b9e1c63
+Revises: e57a1c9d04b8
+Create Date: 2026-10-18 21:12:08.530174
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4f2a7b9e1c63'
+down_revision: Union[str, Sequence[str], None] = 'e57a1c9d04b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_notifications_created_at', 'notifications', ['created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_notifications_created_at', table_name='notifications')
@@ -0,0 +1,30 @@
+"""keyset pagination indexes
+
+Revision ID: 5878646d9371
+Revises: 5d6f038b6a37
+Create Date: 2026-10-18 12:40:19.337154
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5878646d9371'
+down_revision: Union[str, Sequence[str], None] = '5d6f038b6a37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_tasks_due_date_id', 'tasks', ['due_date', 'id'], unique=False)
+    op.create_index('ix_notifications_user_id_id', 'notifications', ['user_id', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_notifications_user_id_id', table_name='notifications')
+    op.drop_index('ix_tasks_due_date_id', table_name='tasks')
@@ -0,0 +1,28 @@
+"""index tasks.updated_at
+
+Revision ID: 5d6f038b6a37
+Revises: 78d18f28164b
+Create Date: 2026-10-18 11:27:36.502913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d6f038b6a37'
+down_revision: Union[str, Sequence[str], None] = '78d18f28164b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(op.f('ix_tasks_updated_at'), 'tasks', ['updated_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_tasks_updated_at'), table_name='tasks')
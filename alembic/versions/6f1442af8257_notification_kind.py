@@ -0,0 +1,44 @@
+"""notification kind dedupe key
+
+Revision ID: 6f1442af8257
+Revises: aef508f611ff
+Create Date: 2026-10-18 09:12:04.118230
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6f1442af8257'
+down_revision: Union[str, Sequence[str], None] = 'aef508f611ff'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('notifications', sa.Column('kind', sa.Enum('due_soon', name='notificationkind', native_enum=False, length=32), nullable=True))
+
+    # Backfill reminders created by the old text-matching worker. Only the oldest
+    # row per (task, user) gets the kind so the unique index below can be built.
+    op.execute(
+        """
+        UPDATE notifications SET kind = 'due_soon'
+        WHERE id IN (
+            SELECT MIN(id) FROM notifications
+            WHERE message LIKE '%due within 24h%'
+            GROUP BY task_id, user_id
+        )
+        """
+    )
+    op.create_index('uq_notifications_task_user_kind', 'notifications', ['task_id', 'user_id', 'kind'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('uq_notifications_task_user_kind', table_name='notifications')
+    with op.batch_alter_table('notifications') as batch_op:
+        batch_op.drop_column('kind')
@@ -0,0 +1,30 @@
+"""unread notifications index
+
+Revision ID: 9a0e5d3c7f21
+Revises: c41d7e9a2b58
+Create Date: 2026-10-18 19:05:47.219306
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a0e5d3c7f21'
+down_revision: Union[str, Sequence[str], None] = 'c41d7e9a2b58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_notifications_user_unread', 'notifications', ['user_id', 'read_at'], unique=False,
+                    sqlite_where=sa.text('read_at IS NULL'), postgresql_where=sa.text('read_at IS NULL'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_notifications_user_unread', table_name='notifications',
+                  sqlite_where=sa.text('read_at IS NULL'), postgresql_where=sa.text('read_at IS NULL'))
@@ -0,0 +1,51 @@
+"""deferred fts indexing
+
+Revision ID: c41d7e9a2b58
+Revises: 7cc72204ee47
+Create Date: 2026-10-18 17:40:12.804193
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41d7e9a2b58'
+down_revision: Union[str, Sequence[str], None] = '7cc72204ee47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Copied from models/task.TASK_SEARCH_DDL at the time of this revision
+INSERT_TRIGGER = """
+    CREATE TRIGGER tasks_fts_ai AFTER INSERT ON tasks
+    WHEN NOT EXISTS (SELECT 1 FROM tasks_fts_deferred) BEGIN
+        INSERT INTO tasks_fts(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+"""
+PREVIOUS_INSERT_TRIGGER = """
+    CREATE TRIGGER tasks_fts_ai AFTER INSERT ON tasks BEGIN
+        INSERT INTO tasks_fts(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != "sqlite":
+        return
+    op.execute("CREATE TABLE IF NOT EXISTS tasks_fts_deferred (id INTEGER PRIMARY KEY)")
+    op.execute("DROP TRIGGER IF EXISTS tasks_fts_ai")
+    op.execute(INSERT_TRIGGER)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "sqlite":
+        return
+    op.execute("DROP TRIGGER IF EXISTS tasks_fts_ai")
+    op.execute(PREVIOUS_INSERT_TRIGGER)
+    op.execute("DROP TABLE IF EXISTS tasks_fts_deferred")
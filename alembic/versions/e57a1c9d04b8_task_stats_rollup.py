@@ -0,0 +1,43 @@
+"""task stats rollup
+
+Revision ID: e57a1c9d04b8
+Revises: 2d8b6f41c0e3
+Create Date: 2026-10-18 20:31:26.904518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e57a1c9d04b8'
+down_revision: Union[str, Sequence[str], None] = '2d8b6f41c0e3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('task_stats',
+    sa.Column('assignee_id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('status', sa.String(length=32), nullable=False),
+    sa.Column('priority', sa.String(length=32), nullable=False),
+    sa.Column('task_count', sa.Integer(), nullable=False),
+    sa.Column('progress_sum', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('assignee_id', 'status', 'priority')
+    )
+    # Backfill from existing tasks (unassigned tasks are grouped under assignee_id 0)
+    op.execute("""
+        INSERT INTO task_stats (assignee_id, status, priority, task_count, progress_sum)
+        SELECT COALESCE(assignee_id, 0), CAST(status AS VARCHAR(32)), CAST(priority AS VARCHAR(32)),
+               COUNT(*), COALESCE(SUM(progress), 0)
+        FROM tasks
+        GROUP BY COALESCE(assignee_id, 0), status, priority
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('task_stats')
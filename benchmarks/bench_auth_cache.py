@@ -0,0 +1,88 @@
+"""
+Authenticated request load test: queries and latency per request with the
+user/token caches on and off.
+
+Drives GET /users/me and GET /tasks/ through an in-process client against a
+temporary SQLite file and counts statements with an engine event hook.
+
+    python benchmarks/bench_auth_cache.py --requests 2000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import sessionmaker
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from task_manager_app.core import database
+from task_manager_app.core.database import Base, make_async_engine
+from task_manager_app.core.security import token_cache
+from task_manager_app.routers import auth, users, tasks, notifications
+from task_manager_app.routers.users import user_cache
+
+
+def build_client(path: str):
+    url = f"sqlite:///{path}"
+    engine = create_engine(url, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    database.engine = engine
+    database.SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+    # requests query through the async engine
+    async_engine = make_async_engine(url)
+    database.AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False,
+                                                    expire_on_commit=False)
+
+    app = FastAPI()
+    for module in (auth, users, tasks, notifications):
+        app.include_router(module.router)
+    return async_engine.sync_engine, TestClient(app)
+
+
+def run(client, engine, headers, path: str, n: int):
+    statements = []
+    listener = lambda *args: statements.append(1)  # noqa: E731
+    event.listen(engine, "before_cursor_execute", listener)
+    start = time.perf_counter()
+    for _ in range(n):
+        client.get(path, headers=headers)
+    elapsed = time.perf_counter() - start
+    event.remove(engine, "before_cursor_execute", listener)
+    return len(statements) / n, elapsed / n * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    tmp = tempfile.TemporaryDirectory()
+    engine, client = build_client(os.path.join(tmp.name, "bench.db"))
+    creds = {"email": "bench@example.com", "password": "secret123"}
+    client.post("/auth/signup", json=creds)
+    token = client.post("/auth/login", data={"username": creds["email"],
+                                             "password": creds["password"]}).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    print(f"{'endpoint':>12} {'cache':>6} {'queries/req':>12} {'ms/req':>8}")
+    for path in ("/users/me", "/tasks/"):
+        for enabled in (False, True):
+            size = 10_000 if enabled else 0
+            user_cache.maxsize = token_cache.maxsize = size
+            user_cache.clear()
+            token_cache.clear()
+            queries, ms = run(client, engine, headers, path, args.requests)
+            print(f"{path:>12} {'on' if enabled else 'off':>6} {queries:>12.2f} {ms:>8.3f}")
+    print("user cache:", user_cache.stats())
+    print("token cache:", token_cache.stats())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Bulk vs single-item task writes.
+
+Creates N tasks through ``POST /tasks/`` one request at a time and through
+``POST /tasks/bulk``, then updates them through ``PATCH /tasks/{id}`` and
+``PATCH /tasks/bulk``, counting SQL statements along the way. Runs in-process
+against a file-backed SQLite database, so HTTP cost is the ASGI overhead only.
+
+    python benchmarks/bench_bulk.py --tasks 50000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from task_manager_app.core.database import Base, make_async_engine
+from task_manager_app.core.deps import get_async_db
+from task_manager_app.core.hashing import password_hasher
+from task_manager_app.routers import auth, tasks
+
+PASSWORD = "bench-password"
+
+
+def build_client(path: str):
+    engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    async_engine = make_async_engine(f"sqlite:///{path}")
+    AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False,
+                                           expire_on_commit=False)
+    statements = []
+    event.listen(async_engine.sync_engine, "before_cursor_execute",
+                 lambda conn, cursor, stmt, *args: statements.append(stmt))
+
+    async def override_get_async_db():
+        async with AsyncSessionLocal() as db:
+            yield db
+
+    app = FastAPI()
+    app.include_router(auth.router)
+    app.include_router(tasks.router)
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    return TestClient(app), statements
+
+
+def timed(label: str, n: int, statements: list, fn) -> None:
+    statements.clear()
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:>22}: {elapsed:8.2f}s  {n / elapsed:9.0f} tasks/s  {len(statements):>7} statements")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=5_000)
+    args = parser.parse_args()
+    n = args.tasks
+    password_hasher.workers = 0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        client, statements = build_client(os.path.join(tmp, "bulk.db"))
+        client.post("/auth/signup", json={"email": "bench@example.com", "password": PASSWORD})
+        token = client.post("/auth/login", data={"username": "bench@example.com",
+                                                 "password": PASSWORD}).json()["access_token"]
+        headers = {"Authorization": f"Bearer {token}"}
+        items = [{"title": f"task-{i}", "due_date": "2026-06-01"} for i in range(n)]
+        batch = tasks.BULK_MAX_ITEMS
+
+        single_ids = []
+        timed("single create", n, statements, lambda: single_ids.extend(
+            client.post("/tasks/", json=item, headers=headers).json()["id"] for item in items))
+
+        bulk_ids = []
+        timed("bulk create", n, statements, lambda: [
+            bulk_ids.extend(client.post("/tasks/bulk", json=items[i:i + batch],
+                                        headers=headers).json()["ids"])
+            for i in range(0, n, batch)])
+
+        timed("single update", n, statements, lambda: [
+            client.patch(f"/tasks/{task_id}", json={"status": "in_progress"}, headers=headers)
+            for task_id in single_ids])
+
+        updates = [{"id": task_id, "status": "in_progress"} for task_id in bulk_ids]
+        timed("bulk update", n, statements, lambda: [
+            client.patch("/tasks/bulk", json=updates[i:i + batch], headers=headers)
+            for i in range(0, n, batch)])
+
+
+if __name__ == "__main__":
+    main()
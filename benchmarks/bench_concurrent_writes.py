@@ -0,0 +1,110 @@
+"""
+Write throughput under concurrent requests on a file-backed SQLite database.
+
+Fires N ``POST /tasks/`` requests at the app in-process (httpx ASGI transport,
+so the sync endpoints run on the threadpool) with a given concurrency, while
+readers page through ``GET /tasks/``. Reports writes/s, reads/s and failed
+requests, once with the engine as ``core/database.make_async_engine``
+configures it (WAL, synchronous=NORMAL, busy_timeout, sized pool) and once with
+a plain ``create_async_engine``.
+
+    python benchmarks/bench_concurrent_writes.py --writes 2000 --concurrency 32 --readers 4
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from task_manager_app.core.database import Base, async_url, make_async_engine
+from task_manager_app.core.deps import get_async_db
+from task_manager_app.models.user import User, Role
+from task_manager_app.routers import tasks
+from task_manager_app.routers.users import get_current_user
+
+
+async def build_app(engine) -> FastAPI:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    AsyncSessionLocal = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+    async with AsyncSessionLocal() as db:
+        await db.execute(insert(User), [{"email": "bench@example.com", "hashed_password": "x",
+                                         "role": Role.user}])
+        await db.commit()
+        user = await db.get(User, 1)
+
+    async def override_get_async_db():
+        async with AsyncSessionLocal() as db:
+            yield db
+
+    app = FastAPI()
+    app.include_router(tasks.router)
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    app.dependency_overrides[get_current_user] = lambda: user
+    return app
+
+
+async def run(engine, n_writes: int, concurrency: int, n_readers: int) -> None:
+    app = await build_app(engine)
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        gate = asyncio.Semaphore(concurrency)
+        failed = 0
+        reads = 0
+        done = asyncio.Event()
+
+        async def write(i: int):
+            nonlocal failed
+            async with gate:
+                res = await client.post("/tasks/", json={"title": f"task {i}", "progress": i % 101})
+                failed += res.status_code != 201
+
+        async def read():
+            nonlocal failed, reads
+            while not done.is_set():
+                res = await client.get("/tasks/", params={"limit": 50})
+                failed += res.status_code != 200
+                reads += 1
+
+        readers = [asyncio.create_task(read()) for _ in range(n_readers)]
+        start = time.perf_counter()
+        await asyncio.gather(*(write(i) for i in range(n_writes)))
+        elapsed = time.perf_counter() - start
+        done.set()
+        await asyncio.gather(*readers)
+
+    await engine.dispose()
+    print(f"  {(n_writes - failed) / elapsed:8.1f} writes/s  {reads / elapsed:8.1f} reads/s  "
+          f"{failed} failed  ({elapsed:.2f}s)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--writes", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--readers", type=int, default=4)
+    args = parser.parse_args()
+
+    engines = {
+        "plain create_async_engine": lambda url: create_async_engine(async_url(url)),
+        "make_async_engine": make_async_engine,
+    }
+    for label, build in engines.items():
+        with tempfile.TemporaryDirectory() as tmp:
+            engine = build(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+            print(f"{label}: {args.writes} writes, concurrency {args.concurrency}, "
+                  f"{args.readers} readers")
+            asyncio.run(run(engine, args.writes, args.concurrency, args.readers))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Task export memory benchmark.
+
+Seeds a file-backed SQLite database with N tasks, drains the streaming body of
+``export_tasks`` for each size and reports throughput and peak Python memory
+(tracemalloc). Peak memory should stay roughly constant as N grows. (Going
+through TestClient would not show this: it buffers the whole response.)
+
+    python benchmarks/bench_export.py --sizes 10000 100000 500000
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from task_manager_app.core.database import Base, make_async_engine
+from task_manager_app.models.user import User, Role
+from task_manager_app.models.task import Task, Status, Priority
+from task_manager_app.routers.tasks import export_tasks
+
+NOW = datetime(2026, 1, 10, 12, 0)
+
+
+def seed(path: str, n_tasks: int, batch: int = 50_000):
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False, future=True)
+    with SessionLocal() as db:
+        db.execute(insert(User), [{"email": "admin@example.com", "hashed_password": "x",
+                                   "role": Role.admin}])
+        for start in range(0, n_tasks, batch):
+            db.execute(insert(Task), [
+                {"title": f"task-{i}", "description": "exported " * 8,
+                 "priority": Priority.medium, "status": Status.not_started, "progress": 0,
+                 "assignee_id": 1, "created_at": NOW, "updated_at": NOW}
+                for i in range(start, min(start + batch, n_tasks))
+            ])
+        db.commit()
+
+
+async def export(path: str, format: str) -> int:
+    """Run ``export_tasks`` as the admin and drain its body; returns bytes received."""
+    engine = make_async_engine(f"sqlite:///{path}")
+    try:
+        async with AsyncSession(engine) as db:
+            admin = await db.get(User, 1)
+            response = await export_tasks(db=db, current=admin, format=format)
+            received = 0
+            async for chunk in response.body_iterator:
+                received += len(chunk)
+            return received
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--format", choices=["ndjson", "csv"], default="ndjson")
+    args = parser.parse_args()
+
+    for n in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "export.db")
+            seed(path, n)
+            tracemalloc.start()
+            start = time.perf_counter()
+            received = asyncio.run(export(path, args.format))
+            elapsed = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(f"{n:>9} tasks: {elapsed:7.2f}s  {n / elapsed:9.0f} rows/s  "
+                  f"{received / 1e6:8.1f} MB sent  peak {peak / 1e6:6.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
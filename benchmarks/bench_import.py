@@ -0,0 +1,95 @@
+"""
+Task import throughput.
+
+Writes an N-row NDJSON and CSV file, then loads each into a fresh file-backed
+SQLite database through ``core.importer`` (what ``POST /tasks/import`` and
+``python -m task_manager_app.cli import-tasks`` run), reporting rows/s and, with
+``--memory``, peak Python memory, which should not grow with N.
+
+    python benchmarks/bench_import.py --rows 100000 500000 [--memory]
+"""
+import argparse
+import csv
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from sqlalchemy import insert
+from sqlalchemy.orm import sessionmaker
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from task_manager_app.core.database import Base, make_engine
+from task_manager_app.core.importer import import_tasks, iter_records
+from task_manager_app.models.user import User, Role
+
+VOCABULARY = ["budget", "review", "launch", "report", "design", "migrate", "invoice",
+              "client", "deploy", "refactor", "roadmap", "audit", "backup", "release"]
+FIELDS = ["title", "description", "priority", "status", "progress", "due_date"]
+
+
+def write_files(tmp: str, n_rows: int) -> dict[str, str]:
+    rng = random.Random(42)
+    paths = {"ndjson": os.path.join(tmp, "tasks.ndjson"), "csv": os.path.join(tmp, "tasks.csv")}
+    with open(paths["ndjson"], "w") as nd, open(paths["csv"], "w", newline="") as cf:
+        writer = csv.DictWriter(cf, FIELDS)
+        writer.writeheader()
+        for i in range(n_rows):
+            row = {
+                "title": " ".join(rng.sample(VOCABULARY, 3)),
+                "description": " ".join(rng.choices(VOCABULARY, k=10)),
+                "priority": rng.choice(["low", "medium", "high"]),
+                "status": "not_started",
+                "progress": 0,
+                "due_date": f"2026-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+            }
+            nd.write(json.dumps(row) + "\n")
+            writer.writerow(row)
+    return paths
+
+
+def run(path: str, format: str, db_path: str, trace_memory: bool) -> None:
+    # the app's engine: the pragmas (WAL, cache size) the CLI and endpoint run with
+    engine = make_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False, future=True)
+    with SessionLocal() as db:
+        db.execute(insert(User), [{"email": "admin@example.com", "hashed_password": "x",
+                                   "role": Role.admin}])
+        db.commit()
+        admin = db.get(User, 1)
+        if trace_memory:
+            tracemalloc.start()
+        start = time.perf_counter()
+        with open(path, "rb") as f:
+            report = import_tasks(db, iter_records(f, format), admin)
+        elapsed = time.perf_counter() - start
+        memory = ""
+        if trace_memory:
+            memory = f"  peak {tracemalloc.get_traced_memory()[1] / 1e6:6.1f} MB"
+            tracemalloc.stop()
+    print(f"{format:>7} {report.rows:>9} rows: {elapsed:6.2f}s  "
+          f"{report.inserted / elapsed:9.0f} rows/s{memory}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[100_000])
+    parser.add_argument("--memory", action="store_true",
+                        help="report peak memory (tracemalloc slows the run several-fold)")
+    args = parser.parse_args()
+
+    for n in args.rows:
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = write_files(tmp, n)
+            for format, path in paths.items():
+                run(path, format, os.path.join(tmp, f"{format}.db"), args.memory)
+
+
+if __name__ == "__main__":
+    main()
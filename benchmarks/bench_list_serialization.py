@@ -0,0 +1,116 @@
+"""
+List endpoint throughput benchmark.
+
+Seeds a temporary SQLite file with N tasks and N notifications for one
+user, then requests full pages (default 1000 rows) of ``GET /tasks/`` and
+``GET /notifications/`` through the ASGI app and reports rows/s per endpoint,
+including query, serialization and response encoding.
+
+    python benchmarks/bench_list_serialization.py --rows 20000 --limit 1000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, date, timedelta
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, insert
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import sessionmaker
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from task_manager_app.core.database import Base, make_async_engine
+from task_manager_app.core.deps import get_async_db
+from task_manager_app.models.user import User, Role
+from task_manager_app.models.task import Task, Status, Priority
+from task_manager_app.models.notification import Notification
+from task_manager_app.routers import tasks, notifications
+from task_manager_app.routers.users import get_current_user
+
+NOW = datetime(2026, 1, 10, 12, 0, 0, 123456)
+
+
+def seed(path: str, n_rows: int):
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False, future=True)
+    with SessionLocal() as db:
+        db.execute(insert(User), [{"email": "user@example.com", "hashed_password": "x",
+                                   "role": Role.user}])
+        db.execute(insert(Task), [
+            {"title": f"task-{i}", "description": "benchmark task " * 4,
+             "priority": list(Priority)[i % 4], "status": list(Status)[i % 4],
+             "progress": i % 101, "due_date": date(2026, 1, 1) + timedelta(days=i % 365),
+             "assignee_id": 1, "created_at": NOW, "updated_at": NOW}
+            for i in range(n_rows)
+        ])
+        db.execute(insert(Notification), [
+            {"user_id": 1, "task_id": i + 1, "message": f"Task 'task-{i}' is due soon.",
+             "created_at": NOW, "read_at": NOW if i % 2 else None}
+            for i in range(n_rows)
+        ])
+        db.commit()
+    return SessionLocal
+
+
+def make_client(path: str, SessionLocal) -> TestClient:
+    app = FastAPI()
+    app.include_router(tasks.router)
+    app.include_router(notifications.router)
+    AsyncSessionLocal = async_sessionmaker(bind=make_async_engine(f"sqlite:///{path}"),
+                                           autoflush=False, expire_on_commit=False)
+
+    async def override_get_async_db():
+        async with AsyncSessionLocal() as db:
+            yield db
+
+    with SessionLocal() as db:
+        user = db.get(User, 1)
+        db.expunge(user)
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    app.dependency_overrides[get_current_user] = lambda: user
+    return TestClient(app)
+
+
+def bench(client: TestClient, path: str, limit: int, total: int) -> tuple[float, int]:
+    """Walk every page of ``path`` by cursor; returns (seconds, bytes received)."""
+    received = 0
+    cursor = None
+    start = time.perf_counter()
+    fetched = 0
+    while fetched < total:
+        params = {"limit": limit, **({"cursor": cursor} if cursor else {})}
+        res = client.get(path, params=params)
+        res.raise_for_status()
+        received += len(res.content)
+        fetched += limit
+        cursor = res.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+    return time.perf_counter() - start, received
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--limit", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    tmp = tempfile.TemporaryDirectory()
+    path = os.path.join(tmp.name, "bench.db")
+    client = make_client(path, seed(path, args.rows))
+    for path in ("/tasks/", "/notifications/"):
+        bench(client, path, args.limit, args.limit)  # warm up
+        best, received = min(bench(client, path, args.limit, args.rows) for _ in range(args.repeat))
+        print(f"GET {path:<16} {args.rows / best:9.0f} rows/s  "
+              f"({args.rows} rows in pages of {args.limit}, {received / 1e6:.1f} MB)")
+
+
+if __name__ == "__main__":
+    main()
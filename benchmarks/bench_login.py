@@ -0,0 +1,115 @@
+"""
+Login throughput under concurrency.
+
+Signs up one user against an in-memory SQLite database, then fires N concurrent
+logins at the app in-process (httpx ASGI transport) while a probe keeps hitting
+``/health``. Reports logins/s, 503 rejections and the health-check latency, which
+shows whether bcrypt is stalling the event loop.
+
+    python benchmarks/bench_login.py --logins 200 --concurrency 50 --workers 4
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from task_manager_app.core.database import Base
+from task_manager_app.core.deps import get_async_db
+from task_manager_app.core.hashing import password_hasher
+from task_manager_app.routers import auth
+from task_manager_app.models import User  # noqa: F401  (register tables)
+
+PASSWORD = "correct horse battery staple"
+
+
+async def build_app() -> FastAPI:
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    AsyncSessionLocal = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+    async def override_get_async_db():
+        async with AsyncSessionLocal() as db:
+            yield db
+
+    app = FastAPI()
+    app.include_router(auth.router)
+    app.dependency_overrides[get_async_db] = override_get_async_db
+
+    @app.get("/health")
+    async def health():
+        return {"status": "ok"}
+
+    return app
+
+
+async def run(n_logins: int, concurrency: int) -> None:
+    app = await build_app()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        await client.post("/auth/signup", json={"email": "bench@example.com", "password": PASSWORD})
+
+        gate = asyncio.Semaphore(concurrency)
+        codes: list[int] = []
+
+        async def login():
+            async with gate:
+                res = await client.post("/auth/login", data={"username": "bench@example.com",
+                                                             "password": PASSWORD})
+                codes.append(res.status_code)
+
+        probes: list[float] = []
+        done = asyncio.Event()
+
+        async def probe():
+            while not done.is_set():
+                start = time.perf_counter()
+                await client.get("/health")
+                probes.append(time.perf_counter() - start)
+                await asyncio.sleep(0.01)
+
+        prober = asyncio.create_task(probe())
+        start = time.perf_counter()
+        await asyncio.gather(*(login() for _ in range(n_logins)))
+        elapsed = time.perf_counter() - start
+        done.set()
+        await prober
+
+    ok = codes.count(200)
+    print(f"{n_logins} logins, concurrency {concurrency}, "
+          f"{password_hasher.workers} hash workers: {elapsed:.2f}s")
+    print(f"  throughput: {ok / elapsed:8.1f} logins/s  ({ok} ok, {codes.count(503)} x 503)")
+    if probes:
+        print(f"  /health   : median {statistics.median(probes) * 1000:.1f} ms, "
+              f"max {max(probes) * 1000:.1f} ms over {len(probes)} probes")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--workers", type=int, default=password_hasher.workers,
+                        help="hashing processes (0 = thread)")
+    parser.add_argument("--max-pending", type=int, default=password_hasher.max_pending)
+    args = parser.parse_args()
+
+    password_hasher.workers = args.workers
+    password_hasher.max_pending = args.max_pending
+    try:
+        asyncio.run(run(args.logins, args.concurrency))
+    finally:
+        password_hasher.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Offset vs keyset pagination benchmark.
+
+Seeds a temporary SQLite file with N tasks and M notifications for one user,
+then times fetching a deep page (default: page 1000 of 100 rows) through
+``list_tasks`` / ``list_my_notifications`` in offset mode and in cursor mode.
+
+    python benchmarks/bench_pagination.py --tasks 200000 --page 1000
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, date, timedelta
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from task_manager_app.core.database import Base, make_async_engine
+from task_manager_app.core.pagination import encode_cursor
+from task_manager_app.models.user import User, Role
+from task_manager_app.models.task import Task, Status, Priority
+from task_manager_app.models.notification import Notification
+from task_manager_app.routers.tasks import list_tasks
+from task_manager_app.routers.notifications import list_my_notifications
+
+NOW = datetime(2026, 1, 10, 12, 0)
+
+
+def seed(path: str, n_tasks: int, n_notifications: int):
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False, future=True)
+    with SessionLocal() as db:
+        db.execute(insert(User), [{"email": "admin@example.com", "hashed_password": "x",
+                                   "role": Role.admin}])
+        db.execute(insert(Task), [
+            {
+                "title": f"task-{i}",
+                "priority": Priority.medium,
+                "status": Status.not_started,
+                "progress": 0,
+                "assignee_id": 1,
+                "due_date": date(2026, 1, 1) + timedelta(days=i % 365),
+                "created_at": NOW,
+                "updated_at": NOW,
+            }
+            for i in range(n_tasks)
+        ])
+        db.execute(insert(Notification), [
+            {"user_id": 1, "message": f"note-{i}", "created_at": NOW}
+            for i in range(n_notifications)
+        ])
+        db.commit()
+
+
+async def best_of(fn, repeat: int = 5) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+async def measure(path: str, args) -> None:
+    engine = make_async_engine(f"sqlite:///{path}")
+    skip = (args.page - 1) * args.limit
+    async with AsyncSession(engine) as db:
+        admin = await db.get(User, 1)
+
+        # The cursor a client would hold after walking to the previous page
+        task_cursor = encode_cursor({"sort": "id", "id": skip})
+        note_cursor = encode_cursor({"id": args.notifications - skip + 1})
+
+        cases = {
+            "tasks offset": lambda: list_tasks(db=db, current=admin,
+                                               limit=args.limit, offset=skip),
+            "tasks cursor": lambda: list_tasks(db=db, current=admin,
+                                               limit=args.limit, cursor=task_cursor),
+            "notifications offset": lambda: list_my_notifications(
+                db=db, current=admin, limit=args.limit, offset=skip),
+            "notifications cursor": lambda: list_my_notifications(
+                db=db, current=admin, limit=args.limit, cursor=note_cursor),
+        }
+        print(f"page {args.page} x {args.limit} rows")
+        for name, fn in cases.items():
+            print(f"{name:>22}: {await best_of(fn) * 1000:8.2f} ms")
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=200_000)
+    parser.add_argument("--notifications", type=int, default=200_000)
+    parser.add_argument("--page", type=int, default=1000)
+    parser.add_argument("--limit", type=int, default=100)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "pagination.db")
+        seed(path, args.tasks, args.notifications)
+        asyncio.run(measure(path, args))
+
+if __name__ == "__main__":
+    main()
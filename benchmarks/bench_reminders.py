@@ -0,0 +1,126 @@
+"""
+Reminder sweep benchmark.
+
+Seeds an in-memory SQLite database with N open tasks (a third of them due within
+24h) and times one reminder sweep with the set-based engine against the old
+per-task dedupe loop, plus a steady-state tick of the incremental engine
+(nothing changed, nothing newly due) which should stay flat as N grows.
+
+    python benchmarks/bench_reminders.py --sizes 1000 10000 50000
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import datetime, date, timedelta
+
+from sqlalchemy import create_engine, select, insert
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from task_manager_app.core.database import Base
+from task_manager_app.core.reminders import (
+    ReminderEngine,
+    reminder_message,
+    sweep_due_reminders,
+)
+from task_manager_app.models.user import User, Role
+from task_manager_app.models.task import Task, Status, Priority
+from task_manager_app.models.notification import Notification
+
+NOW = datetime(2026, 1, 10, 12, 0)
+
+
+def seed(n_tasks: int, n_users: int = 100):
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False, future=True)
+    with SessionLocal() as db:
+        db.execute(insert(User), [
+            {"email": f"user{i}@example.com", "hashed_password": "x", "role": Role.user}
+            for i in range(n_users)
+        ])
+        db.execute(insert(Task), [
+            {
+                "title": f"task-{i}",
+                "priority": Priority.medium,
+                "status": Status.not_started,
+                "progress": 0,
+                "assignee_id": 1 + i % n_users,
+                "due_date": date(2026, 1, 11) if i % 3 == 0 else date(2026, 3, 1),
+                "created_at": NOW,
+                "updated_at": NOW,
+            }
+            for i in range(n_tasks)
+        ])
+        db.commit()
+    return SessionLocal
+
+
+def legacy_sweep(db) -> int:
+    """The original per-task loop from main.reminder_worker, kept for comparison."""
+    soon = NOW + timedelta(hours=24)
+    tasks = db.execute(select(Task).where(
+        Task.due_date != None,           # noqa: E711
+        Task.status != Status.completed,
+        Task.due_date <= soon.date(),
+    )).scalars().all()
+    created = 0
+    for t in tasks:
+        if not t.assignee_id:
+            continue
+        existing = db.execute(select(Notification).where(
+            Notification.user_id == t.assignee_id,
+            Notification.task_id == t.id,
+            Notification.message.like("%due within 24h%"),
+        )).scalar_one_or_none()
+        if existing:
+            continue
+        db.add(Notification(user_id=t.assignee_id, task_id=t.id,
+                            message=reminder_message(t.title, t.due_date)))
+        created += 1
+    db.commit()
+    return created
+
+
+def timed(fn, db):
+    start = time.perf_counter()
+    created = fn(db)
+    return time.perf_counter() - start, created
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 50_000])
+    parser.add_argument("--skip-legacy-above", type=int, default=20_000,
+                        help="don't run the O(N) legacy loop past this many tasks")
+    args = parser.parse_args()
+
+    print(f"{'tasks':>10} {'engine':>8} {'first (s)':>10} {'repeat (s)':>11} {'created':>8}")
+    for n in args.sizes:
+        runs = [("set", lambda db: sweep_due_reminders(db, now=NOW))]
+        if n <= args.skip_legacy_above:
+            runs.append(("legacy", legacy_sweep))
+        for name, fn in runs:
+            SessionLocal = seed(n)
+            with SessionLocal() as db:
+                first, created = timed(fn, db)
+                # steady state: everything is already reminded
+                repeat, _ = timed(fn, db)
+            print(f"{n:>10} {name:>8} {first:>10.3f} {repeat:>11.3f} {created:>8}")
+
+        engine = ReminderEngine()
+        SessionLocal = seed(n)
+        with SessionLocal() as db:
+            first, created = timed(lambda db: engine.run(db, now=NOW), db)
+            repeat, _ = timed(lambda db: engine.run(db, now=NOW + timedelta(minutes=1)), db)
+        print(f"{n:>10} {'incr':>8} {first:>10.3f} {repeat:>11.3f} {created:>8}")
+
+
+if __name__ == "__main__":
+    main()
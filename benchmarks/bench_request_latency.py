@@ -0,0 +1,110 @@
+"""
+Request latency under many concurrent clients.
+
+Seeds a temporary SQLite file (via DATABASE_URL, so the app's own engines are
+used) with tasks and notifications, then runs C concurrent clients against the
+app in-process (httpx ASGI transport). Each client loops over a mix of
+``GET /tasks/``, ``GET /tasks/{id}``, ``GET /notifications/unread_count`` and,
+every tenth request, ``POST /tasks/``. Reports throughput and p50/p95/p99/max
+latency. Sync endpoints queue for Starlette's threadpool (40 threads) at this
+concurrency; async ones only wait on the connection pool.
+
+    python benchmarks/bench_request_latency.py --clients 500 --requests 20000
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+import httpx
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+TASKS = 2_000
+
+
+def build_app():
+    # imported late: DATABASE_URL must be set before the engines are created
+    from fastapi import FastAPI
+    from sqlalchemy import insert
+
+    from task_manager_app.core import database
+    from task_manager_app.models.notification import Notification
+    from task_manager_app.models.task import Task
+    from task_manager_app.models.user import User, Role
+    from task_manager_app.routers import notifications, tasks
+    from task_manager_app.routers.users import CurrentUser, get_current_user
+
+    database.Base.metadata.create_all(bind=database.engine)
+    with database.SessionLocal() as db:
+        db.execute(insert(User), [{"email": "bench@example.com", "hashed_password": "x",
+                                   "role": Role.manager}])
+        db.execute(insert(Task), [{"title": f"task {i}", "description": "load test " * 8,
+                                   "progress": i % 101, "assignee_id": 1}
+                                  for i in range(TASKS)])
+        db.execute(insert(Notification), [{"user_id": 1, "task_id": i + 1,
+                                           "message": f"note {i}"} for i in range(TASKS)])
+        db.commit()
+        user = CurrentUser.from_user(db.get(User, 1))
+
+    app = FastAPI()
+    app.include_router(tasks.router)
+    app.include_router(notifications.router)
+    app.dependency_overrides[get_current_user] = lambda: user
+    return app
+
+
+async def run(app, n_clients: int, n_requests: int) -> None:
+    latencies: list[float] = []
+    failed = 0
+    remaining = n_requests
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench",
+                                 timeout=None) as client:
+
+        async def worker(offset: int) -> None:
+            nonlocal failed, remaining
+            i = offset
+            while remaining > 0:
+                remaining -= 1
+                i += 1
+                start = time.perf_counter()
+                if i % 10 == 0:
+                    res = await client.post("/tasks/", json={"title": f"new {i}"})
+                elif i % 3 == 0:
+                    res = await client.get(f"/tasks/{i % TASKS + 1}")
+                elif i % 3 == 1:
+                    res = await client.get("/tasks/", params={"limit": 20, "status": "not_started"})
+                else:
+                    res = await client.get("/notifications/unread_count")
+                latencies.append(time.perf_counter() - start)
+                failed += res.status_code >= 400
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker(c) for c in range(n_clients)))
+        elapsed = time.perf_counter() - start
+
+    cuts = statistics.quantiles(latencies, n=100)
+    print(f"{n_clients} clients, {len(latencies)} requests in {elapsed:.2f}s: "
+          f"{len(latencies) / elapsed:.0f} req/s, {failed} failed")
+    print(f"  latency ms: p50 {cuts[49] * 1000:.1f}  p95 {cuts[94] * 1000:.1f}  "
+          f"p99 {cuts[98] * 1000:.1f}  max {max(latencies) * 1000:.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=500)
+    parser.add_argument("--requests", type=int, default=20_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+        asyncio.run(run(build_app(), args.clients, args.requests))
+
+
+if __name__ == "__main__":
+    main()
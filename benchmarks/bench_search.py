@@ -0,0 +1,99 @@
+"""
+Task search benchmark: unindexed ILIKE vs the FTS5 index.
+
+Seeds a file-backed SQLite database with N tasks whose titles and descriptions
+are drawn from a vocabulary, then times ``q`` searches through both backends.
+
+    python benchmarks/bench_search.py --tasks 1000000
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import sessionmaker
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from task_manager_app.core.database import Base
+from task_manager_app.core.search import LikeSearch, SqliteFtsSearch
+from task_manager_app.models.task import Task, Status, Priority
+
+NOW = datetime(2026, 1, 10, 12, 0)
+VOCABULARY = [
+    "budget", "review", "launch", "report", "design", "migrate", "invoice", "client",
+    "deploy", "refactor", "interview", "onboarding", "roadmap", "audit", "backup",
+    "release", "survey", "contract", "forecast", "workshop", "sprint", "metrics",
+]
+QUERIES = ["budget", "quarterly", "rev", "launch roadmap", "zzz-no-match"]
+
+
+def seed(path: str, n_tasks: int, batch: int = 50_000):
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False, future=True)
+    rng = random.Random(42)
+    with SessionLocal() as db:
+        for start in range(0, n_tasks, batch):
+            db.execute(insert(Task), [
+                {
+                    "title": " ".join(rng.sample(VOCABULARY, 3)) + ("" if i % 1000 else " quarterly"),
+                    "description": " ".join(rng.choices(VOCABULARY, k=12)),
+                    "priority": Priority.medium,
+                    "status": Status.not_started,
+                    "progress": 0,
+                    "created_at": NOW,
+                    "updated_at": NOW,
+                }
+                for i in range(start, min(start + batch, n_tasks))
+            ])
+            db.commit()
+    return SessionLocal
+
+
+def best_of(fn, repeat: int = 3) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=200_000)
+    parser.add_argument("--limit", type=int, default=100)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        SessionLocal = seed(os.path.join(tmp, "search.db"), args.tasks)
+        print(f"seeded {args.tasks} tasks in {time.perf_counter() - start:.1f}s")
+
+        # (backend, ranked?) -- ranking has to score every match, so both are shown
+        cases = {
+            "like": (LikeSearch(), False),
+            "fts5 by id": (SqliteFtsSearch(), False),
+            "fts5 ranked": (SqliteFtsSearch(), True),
+        }
+        print(f"{'query':>16} " + " ".join(f"{name:>12}" for name in cases))
+        with SessionLocal() as db:
+            for q in QUERIES:
+                cells = []
+                for backend, ranked in cases.values():
+                    stmt = backend.apply(select(Task), q, ranked=ranked)
+                    rank = backend.rank(q) if ranked else None
+                    stmt = stmt.order_by(*([rank] if rank is not None else []), Task.id).limit(args.limit)
+                    elapsed = best_of(lambda: db.execute(stmt).scalars().all())
+                    cells.append(f"{elapsed * 1000:>9.1f} ms")
+                print(f"{q:>16} " + " ".join(cells))
+
+
+if __name__ == "__main__":
+    main()
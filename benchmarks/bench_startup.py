@@ -0,0 +1,158 @@
+"""
+Cold start: where ``import main`` spends its time, and how long a new worker
+takes to answer its first ``GET /health``.
+
+Every measurement starts a fresh interpreter, as a Gunicorn/Uvicorn worker
+would, against a database that already has its schema (by default a
+temporary SQLite file):
+
+- ``python -X importtime -c "import main"``: the total import time and the
+  packages that account for it (self time summed over each package's modules)
+- ``uvicorn main:app`` on a free port, polled until ``/health`` answers 200,
+  once with ``CREATE_TABLES_ON_STARTUP`` on (the default) and once off. On
+  SQLite the table checks take about a millisecond; point ``--database-url``
+  at a server database to see what they cost over the network.
+
+Each figure is the best of ``--runs``, since noise only ever adds time.
+``--baseline``, ``--save-baseline`` and ``--tolerance`` work as in
+``bench_suite.py``; timings only compare on the same machine.
+
+    python benchmarks/bench_startup.py --runs 10
+    python benchmarks/bench_startup.py --baseline benchmarks/startup_baseline.json
+    python benchmarks/bench_startup.py --database-url postgresql://app@db/bench
+"""
+import argparse
+import http.client
+import json
+import os
+import re
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# "import time: <self us> | <cumulative us> | <indent><module>"
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)")
+HEALTH_TIMEOUT_SECONDS = 60
+
+
+def environment(database_url: str, create_tables: bool) -> dict:
+    env = dict(os.environ, DATABASE_URL=database_url,
+               CREATE_TABLES_ON_STARTUP="true" if create_tables else "false")
+    env.pop("ADMIN_EMAIL", None)  # seeding the admin would add a bcrypt hash
+    return env
+
+
+def import_profile(env: dict) -> tuple[float, dict[str, float]]:
+    """Seconds to ``import main`` and the self time of each top-level package."""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", "import main"],
+                            cwd=ROOT, env=env, capture_output=True, text=True, check=True)
+    total = 0.0
+    packages: dict[str, float] = defaultdict(float)
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, module = match.groups()
+        packages[module.split(".")[0]] += int(self_us) / 1e6
+        if module == "main" and not indent:
+            total = int(cumulative_us) / 1e6
+    return total, dict(packages)
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def time_to_health(env: dict) -> float:
+    """Seconds from spawning ``uvicorn main:app`` to its first 200 on ``/health``."""
+    port = free_port()
+    start = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=ROOT, env=env)
+    try:
+        while time.perf_counter() - start < HEALTH_TIMEOUT_SECONDS:
+            if server.poll() is not None:
+                raise SystemExit(f"uvicorn exited with {server.returncode}")
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+            try:
+                conn.request("GET", "/health")
+                if conn.getresponse().status == 200:
+                    return time.perf_counter() - start
+            except OSError:
+                time.sleep(0.005)
+            finally:
+                conn.close()
+        raise SystemExit(f"/health did not answer within {HEALTH_TIMEOUT_SECONDS}s")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Figures of ``results`` more than ``tolerance`` slower than ``baseline``."""
+    regressions = []
+    for name, base in baseline["seconds"].items():
+        current = results["seconds"].get(name)
+        if current is not None and current > base * (1 + tolerance):
+            regressions.append(f"{name}: {current * 1000:.0f} ms, baseline {base * 1000:.0f} ms")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15, help="packages listed by import time")
+    parser.add_argument("--database-url", help="database to start against (default: a temp SQLite file)")
+    parser.add_argument("--baseline", help="JSON results to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.3,
+                        help="allowed slowdown against the baseline (0.3 = 30%%)")
+    parser.add_argument("--save-baseline", help="write this run's results here")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = args.database_url or f"sqlite:///{os.path.join(tmp, 'startup.db')}"
+        with_ddl = environment(database_url, create_tables=True)
+        without_ddl = environment(database_url, create_tables=False)
+        # creates the schema (as Alembic would have) and warms the bytecode cache
+        subprocess.run([sys.executable, "-c", "import main"], cwd=ROOT, env=with_ddl, check=True)
+
+        profiles = [import_profile(without_ddl) for _ in range(args.runs)]
+        import_seconds, packages = min(profiles, key=lambda p: p[0])
+        health = {
+            "first /health": min(time_to_health(with_ddl) for _ in range(args.runs)),
+            "first /health, CREATE_TABLES_ON_STARTUP=false":
+                min(time_to_health(without_ddl) for _ in range(args.runs)),
+        }
+
+    print(f"import main: {import_seconds * 1000:.0f} ms (best of {args.runs})")
+    for package, seconds in sorted(packages.items(), key=lambda p: -p[1])[:args.top]:
+        print(f"  {package:<30} {seconds * 1000:7.1f} ms")
+    for name, seconds in health.items():
+        print(f"{name}: {seconds * 1000:.0f} ms")
+
+    run = {"seconds": {"import main": round(import_seconds, 4),
+                       **{name: round(seconds, 4) for name, seconds in health.items()}}}
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            json.dump(run, f, indent=2, sort_keys=True)
+            f.write("\n")
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(run, json.load(f), args.tolerance)
+        if regressions:
+            print("\n".join(["regressions:", *regressions]))
+            sys.exit(1)
+        print(f"no regressions against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,383 @@
+"""
+Regression benchmark suite: throughput, latency and queries per request.
+
+Seeds a SQLite file with a realistic dataset: tasks with a skewed (Zipf)
+assignee distribution, 5% unassigned, due dates around today and searchable
+titles, plus notifications skewed the same way. It then drives each scenario
+with C concurrent in-process clients (httpx ASGI transport):
+
+- ``GET /tasks/`` as a manager, once per combination of the status, priority,
+  assignee, due-date range and search filters; once more as the busiest user,
+  and a search for a common term by a regular user with a few hundred tasks
+- ``GET /tasks/stats`` and ``GET /notifications/`` (users picked by the skew)
+- ``POST /auth/login`` (real bcrypt hashes, so far fewer requests)
+- the reminder sweep job: the first (cold) tick, then steady-state ticks
+
+For every scenario it reports req/s, p50/p99 latency and SQL statements per
+request (from the ``Server-Timing`` header of ``core/metrics``). Each run works
+on a copy of the seeded file, so ``--db`` can keep a large dataset between runs.
+
+With ``--baseline`` the results are compared against a stored JSON file and the
+script exits 1 when a scenario lost more than ``--tolerance`` of its throughput,
+grew its p99 by more than that, failed more requests or issued more queries per
+request. ``--save-baseline`` writes such a file. Timings only compare on the
+same machine, so record the baseline on the CI runner itself.
+
+    python benchmarks/bench_suite.py --tasks 100000 --baseline benchmarks/baseline.json
+    python benchmarks/bench_suite.py --tasks 10000000 --db /var/tmp/bench-10m.db
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import random
+import re
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+import httpx
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+SEED_CHUNK = 50_000
+# Zipf exponent of the assignee and notification distributions
+SKEW = 1.1
+WORDS = ["deploy", "invoice", "review", "design", "migrate", "report", "customer",
+         "backend", "frontend", "release", "budget", "audit", "onboarding", "security",
+         "database", "roadmap", "hiring", "support", "pricing", "analytics"]
+PASSWORD = "bench-password"
+
+# GET /tasks/ filters; every combination of them is a scenario
+TODAY = date.today()
+TASK_FILTERS = {
+    "status": {"status": "in_progress"},
+    "priority": {"priority": "high"},
+    "assignee": {"assignee_id": 2},
+    "due": {"due_after": TODAY.isoformat(), "due_before": (TODAY + timedelta(days=30)).isoformat()},
+    "q": {"q": "deploy"},
+}
+SWEEP_SCENARIOS = ("reminder sweep (cold)", "reminder sweep (steady)")
+# a regular user far down the skew: the assignee index is far more selective than q
+REGULAR_USER = 50
+# distinct users behind the notification scenario (their cache entries are warmed)
+NOTIFICATION_USERS = 50
+_STATEMENTS = re.compile(r'desc="(\d+) statement')
+
+
+# --- Dataset ----------------------------------------------------------------------
+
+def seed(path: str, n_tasks: int, n_users: int) -> None:
+    from sqlalchemy import insert, text
+    from sqlalchemy.orm import sessionmaker
+
+    from task_manager_app.core import stats
+    from task_manager_app.core.database import Base, make_engine
+    from task_manager_app.core.search import deferred_fts_index
+    from task_manager_app.core.security import hash_password
+    from task_manager_app.models.notification import Notification
+    from task_manager_app.models.task import Priority, Status, Task
+    from task_manager_app.models.user import Role, User
+
+    rng = random.Random(42)
+    engine = make_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(bind=engine, autoflush=False)
+    hashed = hash_password(PASSWORD)
+    users = range(1, n_users + 1)
+    cum_weights = list(itertools.accumulate(1 / rank ** SKEW for rank in users))
+    now = datetime.utcnow()
+
+    def task(i: int, assignee: int) -> dict:
+        return {
+            "title": f"{rng.choice(WORDS)} {rng.choice(WORDS)} #{i}",
+            "description": " ".join(rng.choices(WORDS, k=12)),
+            "priority": rng.choice(list(Priority)),
+            "status": rng.choice(list(Status)),
+            "progress": rng.randint(0, 100),
+            "due_date": None if rng.random() < 0.1 else TODAY + timedelta(days=rng.randint(-60, 120)),
+            "assignee_id": None if rng.random() < 0.05 else assignee,
+            "created_at": now - timedelta(minutes=n_tasks - i),
+            "updated_at": now - timedelta(minutes=n_tasks - i),
+        }
+
+    start = time.perf_counter()
+    with SessionLocal() as db:
+        # user 1 manages (sees every task); user 2 is the busiest assignee
+        db.execute(insert(User), [
+            {"email": f"user{u}@example.com", "full_name": f"User {u}", "hashed_password": hashed,
+             "role": Role.manager if u == 1 else Role.user}
+            for u in users
+        ])
+        db.commit()
+        for offset in range(0, n_tasks, SEED_CHUNK):
+            size = min(SEED_CHUNK, n_tasks - offset)
+            # the manager is left out of the draw: everyone else, by skew
+            assignees = rng.choices(users, cum_weights=cum_weights, k=size)
+            with deferred_fts_index(db):
+                db.execute(insert(Task), [task(offset + i, max(a, 2)) for i, a in enumerate(assignees)])
+            db.commit()
+            print(f"  seeded {offset + size:>10,} tasks", end="\r", flush=True)
+        n_notes = n_tasks // 2
+        for offset in range(0, n_notes, SEED_CHUNK):
+            size = min(SEED_CHUNK, n_notes - offset)
+            recipients = rng.choices(users, cum_weights=cum_weights, k=size)
+            db.execute(insert(Notification), [
+                {"user_id": u, "task_id": rng.randint(1, n_tasks), "message": f"Task #{offset + i} changed",
+                 "created_at": now - timedelta(seconds=n_notes - offset - i),
+                 "read_at": now if rng.random() < 0.5 else None}
+                for i, u in enumerate(recipients)
+            ])
+            db.commit()
+        stats.rebuild(db)
+        db.commit()
+        db.execute(text("PRAGMA wal_checkpoint(TRUNCATE)"))
+    engine.dispose()
+    print(f"  seeded {n_tasks:,} tasks, {n_notes:,} notifications, {n_users:,} users "
+          f"in {time.perf_counter() - start:.1f}s")
+
+
+def dataset(path: str) -> dict:
+    import sqlite3
+
+    with sqlite3.connect(path) as conn:
+        count = lambda table: conn.execute(f"SELECT count(*) FROM {table}").fetchone()[0]  # noqa: E731
+        return {"tasks": count("tasks"), "users": count("users"),
+                "notifications": count("notifications")}
+
+
+# --- Scenarios ----------------------------------------------------------------------
+
+def build_app():
+    # imported late: DATABASE_URL must point at the run's copy first
+    from fastapi import FastAPI
+
+    from task_manager_app.core import metrics
+    from task_manager_app.core.config import Settings
+    from task_manager_app.routers import auth, notifications, tasks, users
+
+    app = FastAPI()
+    for module in (auth, users, tasks, notifications):
+        app.include_router(module.router)
+    metrics.install(app, Settings(metrics_enabled=True))
+    return app
+
+
+def summarize(latencies: list[float], statements: list[int], failed: int, elapsed: float) -> dict:
+    cuts = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else latencies * 99
+    return {
+        "requests": len(latencies),
+        "failed": failed,
+        "rps": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(cuts[49] * 1000, 2),
+        "p99_ms": round(cuts[98] * 1000, 2),
+        "queries_per_request": round(sum(statements) / len(statements), 2) if statements else 0.0,
+    }
+
+
+async def drive(client: httpx.AsyncClient, requests: list, concurrency: int,
+                max_seconds: float) -> dict:
+    """
+    Send ``requests`` (``(method, url, kwargs)``) with ``concurrency`` clients,
+    stopping early once ``max_seconds`` have passed.
+    """
+    pending = iter(requests)
+    deadline = time.perf_counter() + max_seconds
+    latencies: list[float] = []
+    statements: list[int] = []
+    failed = 0
+
+    async def worker() -> None:
+        nonlocal failed
+        for method, url, kwargs in pending:
+            if time.perf_counter() > deadline:
+                break
+            start = time.perf_counter()
+            res = await client.request(method, url, **kwargs)
+            latencies.append(time.perf_counter() - start)
+            failed += res.status_code >= 400
+            match = _STATEMENTS.search(res.headers.get("server-timing", ""))
+            if match:
+                statements.append(int(match.group(1)))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize(latencies, statements, failed, time.perf_counter() - start)
+
+
+def http_scenarios(data: dict, n_requests: int, n_logins: int) -> dict[str, list]:
+    from task_manager_app.core.security import create_access_token
+
+    rng = random.Random(7)
+    bearer = lambda user_id: {"headers": {"Authorization": f"Bearer {create_access_token(str(user_id))}"}}  # noqa: E731
+    manager, busiest = bearer(1), bearer(2)
+    scenarios: dict[str, list] = {}
+    for size in range(len(TASK_FILTERS) + 1):
+        for combo in itertools.combinations(TASK_FILTERS, size):
+            params = {"limit": 50}
+            for name in combo:
+                params.update(TASK_FILTERS[name])
+            label = "+".join(combo) or "no filter"
+            scenarios[f"GET /tasks/ [{label}]"] = [("GET", "/tasks/", {"params": params, **manager})] * n_requests
+    scenarios["GET /tasks/ [as busiest user]"] = [("GET", "/tasks/", {"params": {"limit": 50}, **busiest})] * n_requests
+    regular = {"limit": 50, "assignee_id": REGULAR_USER, **TASK_FILTERS["q"]}
+    for label, params in (("assignee+q", regular), ("assignee+q, by id", {**regular, "sort": "id"})):
+        scenarios[f"GET /tasks/ [{label} as regular user]"] = [
+            ("GET", "/tasks/", {"params": params, **bearer(REGULAR_USER)})] * n_requests
+    scenarios["GET /tasks/stats"] = [("GET", "/tasks/stats", manager)] * n_requests
+
+    users = range(1, data["users"] + 1)
+    cum_weights = list(itertools.accumulate(1 / rank ** SKEW for rank in users))
+    readers = [bearer(u) for u in sorted(set(rng.choices(users, cum_weights=cum_weights,
+                                                          k=NOTIFICATION_USERS)))]
+    scenarios["GET /notifications/"] = [("GET", "/notifications/", {"params": {"limit": 50}, **r})
+                                        for r in rng.choices(readers, k=n_requests)]
+    scenarios["POST /auth/login"] = [
+        ("POST", "/auth/login", {"data": {"username": f"user{rng.choice(users)}@example.com",
+                                          "password": PASSWORD}})
+        for _ in range(n_logins)
+    ]
+    return scenarios
+
+
+async def run_http(scenarios: dict[str, list], concurrency: int,
+                   max_seconds: float) -> dict[str, dict]:
+    app = build_app()
+    results = {}
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        for name, requests in scenarios.items():
+            # warm the user cache and connection pool so queries/request is stable
+            warm = {r[2].get("headers", {}).get("Authorization"): r for r in requests}
+            for method, url, kwargs in list(warm.values())[:NOTIFICATION_USERS]:
+                await client.request(method, url, **kwargs)
+            results[name] = await drive(client, requests, concurrency, max_seconds)
+            report(name, results[name])
+    return results
+
+
+def run_sweeps(n_sweeps: int) -> dict[str, dict]:
+    from sqlalchemy import event
+    from sqlalchemy.engine import Engine
+
+    from task_manager_app.core.reminders import reminder_engine, run_reminder_sweep
+
+    statements = [0]
+
+    def count(*args):
+        statements[0] += 1
+
+    results = {}
+    event.listen(Engine, "before_cursor_execute", count)
+    try:
+        reminder_engine.deactivate()
+        for name, runs in zip(SWEEP_SCENARIOS, (1, n_sweeps)):
+            latencies, counts = [], []
+            for _ in range(runs):
+                statements[0] = 0
+                start = time.perf_counter()
+                run_reminder_sweep()
+                latencies.append(time.perf_counter() - start)
+                counts.append(statements[0])
+            results[name] = summarize(latencies, counts, 0, sum(latencies))
+            report(name, results[name])
+    finally:
+        event.remove(Engine, "before_cursor_execute", count)
+    return results
+
+
+# --- Reporting ----------------------------------------------------------------------
+
+def report(name: str, result: dict) -> None:
+    print(f"{name:<48} {result['rps']:>9.1f} {result['p50_ms']:>9.2f} {result['p99_ms']:>9.2f} "
+          f"{result['queries_per_request']:>7.2f} {result['failed']:>6}")
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Regressions of ``results`` against ``baseline``, one line each."""
+    if results["dataset"] != baseline["dataset"]:
+        raise SystemExit(f"baseline was recorded on {baseline['dataset']}, "
+                         f"this run used {results['dataset']}")
+    regressions = []
+    for name, base in baseline["scenarios"].items():
+        current = results["scenarios"].get(name)
+        if current is None:
+            continue  # not run this time (--only)
+        if current["rps"] < base["rps"] * (1 - tolerance):
+            regressions.append(f"{name}: {current['rps']} req/s, baseline {base['rps']}")
+        if current["p99_ms"] > base["p99_ms"] * (1 + tolerance):
+            regressions.append(f"{name}: p99 {current['p99_ms']} ms, baseline {base['p99_ms']}")
+        if current["queries_per_request"] > base["queries_per_request"] + 0.01:
+            regressions.append(f"{name}: {current['queries_per_request']} queries/request, "
+                               f"baseline {base['queries_per_request']}")
+        if current["failed"] > base["failed"]:
+            regressions.append(f"{name}: {current['failed']} failed, baseline {base['failed']}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=100_000)
+    parser.add_argument("--users", type=int, default=1_000)
+    parser.add_argument("--db", help="seeded SQLite file to reuse (seeded first if missing)")
+    parser.add_argument("--requests", type=int, default=200, help="requests per HTTP scenario")
+    parser.add_argument("--logins", type=int, default=40, help="requests in the login scenario")
+    parser.add_argument("--sweeps", type=int, default=10, help="steady-state reminder ticks")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--max-seconds", type=float, default=30,
+                        help="stop sending a scenario's requests after this long")
+    parser.add_argument("--only", help="run scenarios whose name contains this")
+    parser.add_argument("--baseline", help="JSON results to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.3,
+                        help="allowed fractional loss of req/s and growth of p99")
+    parser.add_argument("--save-baseline", help="write this run's results here")
+    args = parser.parse_args()
+
+    tmp = tempfile.TemporaryDirectory()
+    template = args.db or os.path.join(tmp.name, "seed.db")
+    run_copy = os.path.join(tmp.name, "run.db")
+    # set before the app's engines and settings are created (first import below)
+    os.environ["DATABASE_URL"] = f"sqlite:///{run_copy}"
+    # slow scenarios would otherwise see user-cache expiries as extra queries
+    os.environ["USER_CACHE_TTL_SECONDS"] = "86400"
+    if not os.path.exists(template):
+        seed(template, args.tasks, args.users)
+    shutil.copyfile(template, run_copy)
+    data = dataset(run_copy)
+    if args.db:
+        print(f"  using {args.db}: {data}")
+
+    from task_manager_app.core.hashing import password_hasher
+
+    print(f"{'scenario':<48} {'req/s':>9} {'p50 ms':>9} {'p99 ms':>9} {'q/req':>7} {'failed':>6}")
+    scenarios = {name: requests for name, requests in http_scenarios(data, args.requests, args.logins).items()
+                 if not args.only or args.only in name}
+    try:
+        results = asyncio.run(run_http(scenarios, args.concurrency, args.max_seconds))
+    finally:
+        password_hasher.shutdown()
+    if not args.only or any(args.only in name for name in SWEEP_SCENARIOS):
+        results.update(run_sweeps(args.sweeps))
+
+    run = {"dataset": data, "scenarios": results}
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            json.dump(run, f, indent=2, sort_keys=True)
+            f.write("\n")
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(run, json.load(f), args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            sys.exit(1)
+        print(f"no regressions against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,31 +1,48 @@
 from fastapi import FastAPI
-import asyncio
-from datetime import datetime, timedelta
 from sqlalchemy import select
 
-from task_manager_app.core.database import Base, engine, SessionLocal
+from task_manager_app.core.database import Base, async_engine, engine, SessionLocal
 from task_manager_app.core.config import get_settings
-from task_manager_app.core.security import hash_password
+from task_manager_app.core.security import hash_password, token_cache
+from task_manager_app.core.hashing import password_hasher
+from task_manager_app.core.notifications import notification_broker
+from task_manager_app.core.reminders import (
+    reminder_engine,
+    run_reminder_sweep,
+    seconds_until_next_reminder,
+)
+from task_manager_app.core.retention import run_retention
+from task_manager_app.core.revocation import run_revocation_purge
+from task_manager_app.core.scheduler import BackgroundScheduler
+from task_manager_app.core.leader import Lease
+from task_manager_app.core import metrics, stats
 
 from task_manager_app.models.user import User, Role
-from task_manager_app.models.task import Task, Status
-from task_manager_app.models.notification import Notification
+from task_manager_app.models.task import Task  # noqa: F401  (register tables)
+from task_manager_app.models.notification import Notification  # noqa: F401
+from task_manager_app.models.lease import SchedulerLease  # noqa: F401
+from task_manager_app.models.revoked_token import RevokedToken  # noqa: F401
+from task_manager_app.models.task_stat import TaskStat  # noqa: F401
 
 # Import router modules directly (avoid circular imports via __init__)
 from task_manager_app.routers import auth as auth_router
 from task_manager_app.routers import users as users_router
 from task_manager_app.routers import tasks as tasks_router
 from task_manager_app.routers import notifications as notifications_router
-
-from task_manager_app.core.startup import on_startup
-on_startup(app)
+from task_manager_app.routers.users import user_cache
 
 
 def create_app() -> FastAPI:
     app = FastAPI(title="Task Management API", version="1.0.0")
+    settings = get_settings()
 
-    # Create DB tables (bootstrap; migrations handled by Alembic later)
-    Base.metadata.create_all(bind=engine)
+    # Create DB tables (bootstrap). Where Alembic owns the schema, set
+    # CREATE_TABLES_ON_STARTUP=false: every worker start skips the DDL checks.
+    if settings.create_tables_on_startup:
+        Base.metadata.create_all(bind=engine)
+        # a task_stats table created just now next to existing tasks is empty
+        with SessionLocal() as db:
+            stats.backfill(db)
 
     # Register routers
     app.include_router(auth_router.router)
@@ -37,6 +54,21 @@ def create_app() -> FastAPI:
     def health():
         return {"status": "ok"}
 
+    @app.get("/health/scheduler")
+    def scheduler_health():
+        return scheduler.metrics()
+
+    @app.get("/health/caches")
+    def cache_health():
+        return {"users": user_cache.stats(), "tokens": token_cache.stats()}
+
+    @app.get("/health/notifications")
+    def notification_health():
+        return notification_broker.stats()
+
+    if settings.metrics_enabled:
+        metrics.install(app, settings)
+
     @app.on_event("startup")
     def seed_admin() -> None:
         """
@@ -64,57 +96,39 @@ def create_app() -> FastAPI:
         finally:
             db.close()
 
-    async def reminder_worker(interval_seconds: int):
-        """
-        Every ``interval_seconds`` seconds create a notification for tasks due within
-        24h (for the assignee), skipping completed tasks and avoiding duplicates.
-        """
-        while True:
-            try:
-                now = datetime.utcnow()
-                soon = now + timedelta(hours=24)
-
-                db = SessionLocal()
-                try:
-                    # Find tasks with a due date within 24h and not completed
-                    stmt = select(Task).where(
-                        Task.due_date != None,           # noqa: E711
-                        Task.status != Status.completed,
-                        Task.due_date <= soon.date(),
-                    )
-                    tasks = db.execute(stmt).scalars().all()
-
-                    for t in tasks:
-                        if not t.assignee_id:
-                            continue
-
-                        # Avoid spamming: if a similar notification already exists, skip
-                        existing = db.execute(
-                            select(Notification).where(
-                                Notification.user_id == t.assignee_id,
-                                Notification.task_id == t.id,
-                                Notification.message.like("%due within 24h%")
-                            )
-                        ).scalar_one_or_none()
-                        if existing:
-                            continue
-
-                        msg = f"Task '{t.title}' is due within 24h (due: {t.due_date})."
-                        db.add(Notification(user_id=t.assignee_id, task_id=t.id, message=msg))
-
-                    db.commit()
-                finally:
-                    db.close()
-            except Exception as e:
-                # Keep the worker resilient—log and continue
-                print(f"[reminder_worker] error: {e}")
-            await asyncio.sleep(interval_seconds)
+    # Background jobs run on their own threads, never on the event loop
+    scheduler = BackgroundScheduler(
+        max_workers=settings.background_max_workers,
+        shutdown_timeout=settings.background_shutdown_timeout_seconds,
+    )
+    # Only one process (the lease holder) sweeps; the others stand by
+    scheduler.add_job("reminders", run_reminder_sweep,
+                      settings.reminder_interval_seconds, jitter=settings.reminder_jitter,
+                      lease=Lease("reminders", ttl_seconds=settings.reminder_lease_seconds),
+                      standby=reminder_engine.deactivate,
+                      next_run_in=seconds_until_next_reminder)
+    # Expired revocations are dead weight; the lease outlives one interval so
+    # the same worker normally keeps the job
+    scheduler.add_job("revocation-purge", run_revocation_purge,
+                      settings.revocation_purge_interval_seconds, jitter=settings.reminder_jitter,
+                      lease=Lease("revocation-purge",
+                                  ttl_seconds=2 * settings.revocation_purge_interval_seconds))
+    scheduler.add_job("notification-retention", run_retention,
+                      settings.retention_interval_seconds, jitter=settings.reminder_jitter,
+                      lease=Lease("notification-retention",
+                                  ttl_seconds=2 * settings.retention_interval_seconds))
+    app.state.scheduler = scheduler
 
     @app.on_event("startup")
     async def start_background_workers():
-        # Fire-and-forget background reminder loop
-        settings = get_settings()
-        asyncio.create_task(reminder_worker(settings.reminder_interval_seconds))
+        scheduler.start()
+
+    @app.on_event("shutdown")
+    async def stop_background_workers():
+        await scheduler.shutdown()
+        password_hasher.shutdown()
+        notification_broker.close()
+        await async_engine.dispose()
 
     return app
 
@@ -8,9 +8,78 @@ class Settings(BaseSettings):
     algorithm: str = Field("HS256", alias="ALGORITHM")
     access_token_expire_minutes: int = Field(60, alias="ACCESS_TOKEN_EXPIRE_MINUTES")
     refresh_token_expire_days: int = Field(7, alias="REFRESH_TOKEN_EXPIRE_DAYS")
+    # verified access tokens -> subject; entries never outlive the token's exp
+    token_cache_size: int = Field(10000, alias="TOKEN_CACHE_SIZE")
+    token_cache_ttl_seconds: int = Field(300, alias="TOKEN_CACHE_TTL_SECONDS")
+    # authenticated user identity/role by id; 0 disables
+    user_cache_size: int = Field(10000, alias="USER_CACHE_SIZE")
+    user_cache_ttl_seconds: int = Field(30, alias="USER_CACHE_TTL_SECONDS")
+    # revoked refresh-token jtis remembered in-process (revocations are permanent)
+    revocation_cache_size: int = Field(10000, alias="REVOCATION_CACHE_SIZE")
+    # how often expired rows are deleted from revoked_tokens
+    revocation_purge_interval_seconds: int = Field(3600, alias="REVOCATION_PURGE_INTERVAL_SECONDS")
+    # bcrypt cost; hashes with another cost are upgraded on login
+    bcrypt_rounds: int = Field(12, alias="BCRYPT_ROUNDS")
+    # processes dedicated to bcrypt (0 = hash on a thread instead)
+    password_hash_workers: int = Field(2, alias="PASSWORD_HASH_WORKERS")
+    # queued + running hashes before /auth answers 503 with Retry-After
+    password_hash_max_pending: int = Field(32, alias="PASSWORD_HASH_MAX_PENDING")
     database_url: str = Field("sqlite:///./taskmanager.db", alias="DATABASE_URL")
+    # create missing tables when the app starts; turn off where Alembic owns the schema
+    create_tables_on_startup: bool = Field(True, alias="CREATE_TABLES_ON_STARTUP")
+    # connections kept open, extra ones allowed under load, and the wait for a free one
+    db_pool_size: int = Field(5, alias="DB_POOL_SIZE")
+    db_max_overflow: int = Field(10, alias="DB_MAX_OVERFLOW")
+    db_pool_timeout_seconds: float = Field(30.0, alias="DB_POOL_TIMEOUT_SECONDS")
+    # server databases only: reopen connections older than this (-1 never), test on checkout
+    db_pool_recycle_seconds: int = Field(1800, alias="DB_POOL_RECYCLE_SECONDS")
+    db_pool_pre_ping: bool = Field(True, alias="DB_POOL_PRE_PING")
+    sqlite_journal_mode: str = Field("WAL", alias="SQLITE_JOURNAL_MODE")
+    sqlite_synchronous: str = Field("NORMAL", alias="SQLITE_SYNCHRONOUS")
+    sqlite_busy_timeout_ms: int = Field(5000, alias="SQLITE_BUSY_TIMEOUT_MS")
+    sqlite_mmap_size: int = Field(256 * 1024 * 1024, alias="SQLITE_MMAP_SIZE")
+    sqlite_cache_size_kib: int = Field(64 * 1024, alias="SQLITE_CACHE_SIZE_KIB")
+    # comma-separated read replicas of DATABASE_URL for read-only endpoints; empty = none
+    database_replica_urls: str = Field("", alias="DATABASE_REPLICA_URLS")
+    # replicas further behind than this, or unreachable, are skipped until the next check
+    replica_max_lag_seconds: float = Field(5.0, alias="REPLICA_MAX_LAG_SECONDS")
+    replica_check_seconds: float = Field(2.0, alias="REPLICA_CHECK_SECONDS")
+    # a client's reads stay on the primary this long after its own write
+    read_your_writes_seconds: float = Field(10.0, alias="READ_YOUR_WRITES_SECONDS")
+
+    # opt-in request instrumentation: Prometheus /metrics, Server-Timing headers
+    metrics_enabled: bool = Field(False, alias="METRICS_ENABLED")
+    # requests sending "X-Profile: <token>" are profiled into PROFILE_DIR; unset disables
+    profile_token: str | None = Field(None, alias="PROFILE_TOKEN")
+    profile_dir: str = Field("./profiles", alias="PROFILE_DIR")
 
     reminder_interval_seconds: int = Field(60, alias="REMINDER_INTERVAL_SECONDS")
+    # +/- fraction of the interval added at random so workers don't tick in lockstep
+    reminder_jitter: float = Field(0.1, alias="REMINDER_JITTER")
+    # leader lease for the reminder sweep; a dead leader is replaced after this long
+    reminder_lease_seconds: int = Field(180, alias="REMINDER_LEASE_SECONDS")
+    # full rebuild of the reminder index, catching rows committed behind the watermark
+    reminder_rebuild_seconds: int = Field(3600, alias="REMINDER_REBUILD_SECONDS")
+    # threads shared by all background jobs; a job never overlaps itself
+    background_max_workers: int = Field(2, alias="BACKGROUND_MAX_WORKERS")
+    background_shutdown_timeout_seconds: float = Field(30.0, alias="BACKGROUND_SHUTDOWN_TIMEOUT_SECONDS")
+
+    # "local": pushes reach streams on the same worker; "table": every worker tails the table
+    notification_broker: str = Field("local", alias="NOTIFICATION_BROKER")
+    # events buffered per stream before a slow client is disconnected
+    notification_queue_size: int = Field(100, alias="NOTIFICATION_QUEUE_SIZE")
+    notification_poll_seconds: float = Field(1.0, alias="NOTIFICATION_POLL_SECONDS")
+    # comment line sent on idle streams so proxies don't time them out
+    notification_keepalive_seconds: float = Field(15.0, alias="NOTIFICATION_KEEPALIVE_SECONDS")
+    # read notifications older than this are deleted; 0 keeps them forever
+    notification_retention_days: int = Field(90, alias="NOTIFICATION_RETENTION_DAYS")
+    # unread notifications older than this move to notifications_archive; 0 never
+    notification_archive_days: int = Field(365, alias="NOTIFICATION_ARCHIVE_DAYS")
+    retention_interval_seconds: int = Field(3600, alias="RETENTION_INTERVAL_SECONDS")
+    # rows per delete/archive transaction, the pause between them, and the cap per run
+    retention_batch_size: int = Field(1000, alias="RETENTION_BATCH_SIZE")
+    retention_batch_pause_seconds: float = Field(0.05, alias="RETENTION_BATCH_PAUSE_SECONDS")
+    retention_max_rows_per_run: int = Field(100_000, alias="RETENTION_MAX_ROWS_PER_RUN")
 
     admin_email: str | None = Field(None, alias="ADMIN_EMAIL")
     admin_password: str | None = Field(None, alias="ADMIN_PASSWORD")
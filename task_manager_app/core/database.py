@@ -1,18 +1,150 @@
 # task_manager_app/core/database.py
 import os
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy import create_engine, event
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import URL, Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker, declarative_base
+
+from task_manager_app.core.config import Settings, get_settings
+from task_manager_app.core.replicas import Replica, ReplicaRouter
 
 DATABASE_URL = os.getenv(
     "DATABASE_URL",
     "sqlite:///./dev.db",  # change to your Postgres URL when ready
 )
 
-# SQLite needs this; remove for Postgres
-connect_args = {"check_same_thread": False} if DATABASE_URL.startswith("sqlite") else {}
 
-engine = create_engine(DATABASE_URL, echo=False, future=True, connect_args=connect_args)
+def sqlite_pragmas(settings: Settings) -> dict[str, str]:
+    """PRAGMAs run on every new SQLite connection."""
+    return {
+        # readers don't block the writer (and vice versa); persistent in the file
+        "journal_mode": settings.sqlite_journal_mode,
+        # with WAL, NORMAL only risks the last commits on power loss, not corruption
+        "synchronous": settings.sqlite_synchronous,
+        # wait for a competing writer instead of failing with "database is locked"
+        "busy_timeout": str(settings.sqlite_busy_timeout_ms),
+        "mmap_size": str(settings.sqlite_mmap_size),
+        # negative: KiB rather than pages
+        "cache_size": str(-settings.sqlite_cache_size_kib),
+    }
+
+
+def _is_memory(url: URL) -> bool:
+    return url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")
+
+
+def _engine_options(url: URL, settings: Settings) -> dict:
+    if url.get_backend_name() != "sqlite":
+        return dict(
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout_seconds,
+            pool_recycle=settings.db_pool_recycle_seconds,
+            pool_pre_ping=settings.db_pool_pre_ping,
+        )
+    # SQLite connections are shared across the threadpool; remove for Postgres
+    options: dict = {"connect_args": {"check_same_thread": False}}
+    if not _is_memory(url):
+        options.update(
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout_seconds,
+        )
+    return options
+
+
+def _tune_sqlite(engine: Engine, url: URL, settings: Settings) -> None:
+    if url.get_backend_name() != "sqlite" or _is_memory(url):
+        return
+    pragmas = sqlite_pragmas(settings)
+
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+
+def make_engine(url: str, settings: Settings | None = None) -> Engine:
+    """
+    An engine for ``url`` with the pool sized from ``settings``. File-backed
+    SQLite databases also get the ``sqlite_pragmas`` on every connection;
+    in-memory ones keep SQLAlchemy's single-connection pool.
+    """
+    settings = settings or get_settings()
+    url = make_url(url)
+    engine = create_engine(url, echo=False, future=True, **_engine_options(url, settings))
+    _tune_sqlite(engine, url, settings)
+    return engine
+
+
+# Driver the async engine uses for each backend
+_ASYNC_DRIVERS = {"sqlite": "sqlite+aiosqlite", "postgresql": "postgresql+asyncpg"}
+
+
+def async_url(url: str | URL) -> URL:
+    """``url`` with its backend's async driver (aiosqlite, asyncpg) swapped in."""
+    url = make_url(url)
+    return url.set(drivername=_ASYNC_DRIVERS.get(url.get_backend_name(), url.drivername))
+
+
+def make_async_engine(url: str, settings: Settings | None = None) -> AsyncEngine:
+    """``make_engine``'s async twin: the same database, pool settings and pragmas."""
+    settings = settings or get_settings()
+    url = async_url(url)
+    engine = create_async_engine(url, echo=False, **_engine_options(url, settings))
+    _tune_sqlite(engine.sync_engine, url, settings)
+    return engine
+
+
+engine = make_engine(DATABASE_URL)
+async_engine = make_async_engine(DATABASE_URL)
 
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
+# Nothing is expired on commit: an expired attribute would need IO to reload,
+# which an async session can't do implicitly
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
 
 Base = declarative_base()
+
+
+def make_replica_router(settings: Settings | None = None) -> ReplicaRouter:
+    """A ``ReplicaRouter`` over the ``DATABASE_REPLICA_URLS`` in ``settings``."""
+    settings = settings or get_settings()
+    replicas = []
+    for url in filter(None, (u.strip() for u in settings.database_replica_urls.split(","))):
+        sessions = async_sessionmaker(bind=make_async_engine(url, settings),
+                                      autoflush=False, expire_on_commit=False)
+        replicas.append(Replica(make_url(url).render_as_string(hide_password=True), sessions))
+    return ReplicaRouter(replicas,
+                         max_lag_seconds=settings.replica_max_lag_seconds,
+                         check_seconds=settings.replica_check_seconds,
+                         sticky_seconds=settings.read_your_writes_seconds)
+
+
+replica_router = make_replica_router()
+
+# Dialects whose INSERT supports ON CONFLICT (skip or update a duplicate key)
+_INSERT_ON_CONFLICT = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
+
+
+def dialect_insert(db: Session, model):
+    """
+    The session dialect's own ``insert(model)``, which has ``on_conflict_do_*``,
+    or None where ON CONFLICT isn't available.
+    """
+    insert = _INSERT_ON_CONFLICT.get(db.get_bind().dialect.name)
+    return insert(model) if insert else None
+
+
+def insert_ignoring_duplicates(db: Session, model):
+    """
+    ``INSERT ... ON CONFLICT DO NOTHING`` for ``model`` on the session's dialect,
+    or None where that isn't available (callers fall back to catching IntegrityError).
+    """
+    stmt = dialect_insert(db, model)
+    return stmt.on_conflict_do_nothing() if stmt is not None else None
@@ -1,18 +1,58 @@
 from contextlib import contextmanager
-from typing import Generator
+from typing import AsyncGenerator, Generator, Optional
+from fastapi import Request
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from task_manager_app.core.database import SessionLocal
+from task_manager_app.core import database
 
-def get_db() -> Generator[Session, None, None]:
-    db: Session = SessionLocal()
+# Methods that never write, so they don't pin the client to the primary
+_SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+
+def _client(request: Request) -> Optional[str]:
+    # The credentials identify "the client" for read-your-writes
+    return request.headers.get("authorization")
+
+
+def _note_write(request: Request) -> None:
+    if request.method not in _SAFE_METHODS:
+        database.replica_router.wrote(_client(request))
+
+
+def get_db(request: Request) -> Generator[Session, None, None]:
+    # Look up SessionLocal at call time so tests can swap it out
+    _note_write(request)
+    db: Session = database.SessionLocal()
     try:
         yield db
     finally:
         db.close()
+        _note_write(request)
+
+
+async def get_async_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    # Looked up at call time too, like get_db. Writes are noted on the way in,
+    # so reads racing the request already see the primary, and again on the way
+    # out, so the read-your-writes window starts after a slow write finishes.
+    _note_write(request)
+    async with database.AsyncSessionLocal() as db:
+        yield db
+    _note_write(request)
+
+
+async def get_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    A session for a read-only endpoint: on a replica when one is configured,
+    healthy and not lagging, else on the primary (see ``ReplicaRouter``).
+    """
+    replica = await database.replica_router.sessionmaker_for(_client(request))
+    async with (replica or database.AsyncSessionLocal)() as db:
+        yield db
+
 
 @contextmanager
 def get_db_session_once():
-    db: Session = SessionLocal()
+    db: Session = database.SessionLocal()
     try:
         yield db
     finally:
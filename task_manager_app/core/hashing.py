@@ -0,0 +1,113 @@
+# task_manager_app/core/hashing.py
+import asyncio
+import multiprocessing
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from task_manager_app.core.config import get_settings
+
+if TYPE_CHECKING:
+    from passlib.context import CryptContext
+
+settings = get_settings()
+
+
+@lru_cache
+def get_pwd_context() -> "CryptContext":
+    """
+    The bcrypt context, built on first use so that importing passlib stays off
+    the startup path. Hashes made with a different cost than BCRYPT_ROUNDS
+    report needs_update() and are rehashed on the next successful login.
+    """
+    from passlib.context import CryptContext
+
+    return CryptContext(
+        schemes=["bcrypt"],
+        deprecated="auto",
+        bcrypt__rounds=settings.bcrypt_rounds,
+    )
+
+
+def __getattr__(name: str):
+    # ``pwd_context`` stays importable from here, built on first access
+    if name == "pwd_context":
+        return get_pwd_context()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class HasherBusy(Exception):
+    """Raised when the hashing queue is full; callers should answer 503."""
+
+
+def _hash(password: str) -> str:
+    return get_pwd_context().hash(password)
+
+
+def _verify_and_update(password: str, hashed: str) -> tuple[bool, str | None]:
+    return get_pwd_context().verify_and_update(password, hashed)
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt on a dedicated, size-limited process pool so hashing neither holds
+    the event loop nor Starlette's request threadpool.
+
+    At most ``max_pending`` hash/verify calls may be queued or running; beyond that
+    ``HasherBusy`` is raised immediately instead of letting a login burst build an
+    unbounded backlog. ``workers=0`` runs hashing on a plain thread instead (tests,
+    single-process tools).
+    """
+
+    def __init__(self, workers: int, max_pending: int):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.pending = 0
+        self.rejected = 0
+        self._executor: Executor | None = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> Executor | None:
+        if self.workers <= 0:
+            return None
+        with self._lock:
+            if self._executor is None:
+                # spawn: forking a process that already runs threads is unsafe
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+    async def _submit(self, fn, *args):
+        with self._lock:
+            if self.pending >= self.max_pending:
+                self.rejected += 1
+                raise HasherBusy()
+            self.pending += 1
+        try:
+            executor = self._get_executor()
+            if executor is None:
+                return await asyncio.to_thread(fn, *args)
+            return await asyncio.wrap_future(executor.submit(fn, *args))
+        finally:
+            with self._lock:
+                self.pending -= 1
+
+    async def hash(self, password: str) -> str:
+        return await self._submit(_hash, password)
+
+    async def verify_and_update(self, password: str, hashed: str) -> tuple[bool, str | None]:
+        """Return ``(valid, new_hash)``; ``new_hash`` is set when ``hashed`` is outdated."""
+        return await self._submit(_verify_and_update, password, hashed)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+password_hasher = PasswordHasher(settings.password_hash_workers,
+                                 settings.password_hash_max_pending)
@@ -0,0 +1,203 @@
+# task_manager_app/core/importer.py
+import csv
+import io
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import IO, Callable, Iterable, Iterator
+
+from pydantic import ValidationError
+from sqlalchemy import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from task_manager_app.core import stats
+from task_manager_app.core.notifications import notify_assigned
+from task_manager_app.core.search import deferred_fts_index
+from task_manager_app.models.task import Task, Priority, Status
+from task_manager_app.models.user import Role
+from task_manager_app.schemas.task import TaskCreate
+
+# Rows per INSERT executemany / transaction; each commit is a resumable checkpoint
+IMPORT_BATCH_SIZE = 5_000
+# Errors kept for the report; the rest are only counted
+MAX_REPORTED_ERRORS = 1_000
+
+FORMATS = ("ndjson", "csv")
+
+
+@dataclass
+class RowError:
+    row: int  # 0-based data row (NDJSON line / CSV record after the header)
+    detail: object
+
+
+@dataclass
+class ImportReport:
+    rows: int = 0        # rows read, including skipped and failed ones
+    inserted: int = 0
+    checkpoint: int = 0  # rows fully processed and committed; resume from here
+    error_count: int = 0
+    errors: list[RowError] = field(default_factory=list)
+
+    def fail(self, row: int, detail: object) -> None:
+        self.error_count += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(RowError(row, detail))
+
+
+def iter_records(stream: IO[bytes], format: str) -> Iterator[dict | Exception]:
+    """
+    Parse ``stream`` one record at a time. Unparseable records are yielded as the
+    exception so they take up a row number and end up in the report.
+    """
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    try:
+        if format == "csv":
+            for record in csv.DictReader(text):
+                # empty cells are missing values, not empty strings
+                yield {k: v for k, v in record.items() if k is not None and v != ""}
+            return
+        for line in text:
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as exc:
+                yield exc
+                continue
+            yield record if isinstance(record, dict) else ValueError("Expected a JSON object")
+    finally:
+        text.detach()  # leave the caller's stream open
+
+
+def import_tasks(db: Session, records: Iterable[dict | Exception], current, *,
+                 start_row: int = 0,
+                 batch_size: int | None = None,
+                 on_checkpoint: Callable[[int], None] | None = None) -> ImportReport:
+    """
+    Validate ``records`` against ``TaskCreate`` and insert them ``batch_size`` rows
+    per transaction, as ``current`` (same assignment rule as ``POST /tasks/``,
+    except that a regular user's rows may name that user as assignee, as their
+    own ``/tasks/export`` does).
+
+    Rows before ``start_row`` are skipped, so a failed run can resume from the
+    last ``checkpoint``. If the database rejects a batch, its rows are retried one
+    at a time so only the offending rows are reported.
+
+    Tasks assigned to someone other than ``current`` notify their assignee, as
+    ``POST /tasks/`` does. Imported tasks reach the reminder engine through its
+    ``updated_at`` catch-up rather than ``track()``, which also covers imports
+    run from the CLI.
+    """
+    batch_size = batch_size or IMPORT_BATCH_SIZE
+    can_assign = current.role in (Role.admin, Role.manager)
+    report = ImportReport(checkpoint=start_row)
+    batch: list[tuple[int, dict]] = []
+
+    def flush(upto: int) -> None:
+        if batch:
+            _insert_batch(db, batch, report, current.id)
+            batch.clear()
+        report.checkpoint = upto
+        if on_checkpoint is not None:
+            on_checkpoint(upto)
+
+    for row, record in enumerate(records):
+        report.rows += 1
+        if row < start_row:
+            continue
+        if isinstance(record, Exception):
+            report.fail(row, str(record))
+            continue
+        try:
+            payload = TaskCreate.model_validate(record)
+        except ValidationError as exc:
+            report.fail(row, exc.errors(include_url=False, include_context=False))
+            continue
+        assignee_id = payload.assignee_id
+        if assignee_id and not can_assign:
+            if assignee_id != current.id:
+                report.fail(row, "Only managers/admins can assign tasks")
+                continue
+            assignee_id = None  # their own task: the default anyway
+        batch.append((row, {
+            "title": payload.title,
+            "description": payload.description,
+            "priority": Priority(payload.priority),
+            "status": Status(payload.status),
+            "progress": payload.progress,
+            "due_date": payload.due_date,
+            "assignee_id": assignee_id or current.id,
+        }))
+        if len(batch) >= batch_size:
+            flush(row + 1)
+    flush(max(report.rows, start_row))
+    return report
+
+
+# Columns written by the importer, in statement order
+_COLUMNS = ["title", "description", "priority", "status", "progress", "due_date",
+            "assignee_id", "created_at", "updated_at"]
+
+
+# SQLite before 3.32 binds at most 999 parameters per statement
+_ROWS_PER_STATEMENT = 999 // len(_COLUMNS)
+
+# What notify_assigned reads from each inserted row
+_INSERT_RETURNING = insert(Task.__table__).returning(
+    Task.__table__.c.id, Task.__table__.c.title, Task.__table__.c.assignee_id)
+
+
+def _insert_many(db: Session, values: list[dict]) -> None:
+    """
+    INSERT ``values`` in as few statements as possible. On SQLite the rows are
+    converted with the column types' bind processors and sent as multi-row
+    ``VALUES`` lists straight to the driver. That skips SQLAlchemy's per-row
+    parameter bookkeeping, and the per-statement work of the FTS insert trigger,
+    which an executemany pays for every row. Other dialects take the regular
+    Core path.
+    """
+    table = Task.__table__
+    conn = db.connection()
+    if conn.dialect.name != "sqlite":
+        conn.execute(insert(table), values)
+        return
+    processors = [table.c[name].type.bind_processor(conn.dialect) for name in _COLUMNS]
+    head, row_sql = str(insert(table).compile(dialect=conn.dialect, column_keys=_COLUMNS)).split(" VALUES ")
+    for start in range(0, len(values), _ROWS_PER_STATEMENT):
+        chunk = values[start:start + _ROWS_PER_STATEMENT]
+        conn.exec_driver_sql(f"{head} VALUES {', '.join([row_sql] * len(chunk))}", tuple(
+            v if p is None or v is None else p(v)
+            for row in chunk for p, v in zip(processors, (row[name] for name in _COLUMNS))
+        ))
+
+
+def _insert_batch(db: Session, batch: list[tuple[int, dict]], report: ImportReport,
+                  actor_id: int) -> None:
+    now = datetime.utcnow()
+    # explicit timestamps: one executemany instead of per-row default callables
+    values = [{**v, "created_at": now, "updated_at": now} for _, v in batch]
+    try:
+        with deferred_fts_index(db):
+            if any(v["assignee_id"] != actor_id for v in values):
+                # assignment notices need the new ids, so this batch takes the
+                # regular path, which can return them
+                notify_assigned(db, db.execute(_INSERT_RETURNING, values).all(), actor_id)
+            else:
+                _insert_many(db, values)
+        stats.record_values(db, values)
+        db.commit()
+        report.inserted += len(values)
+        return
+    except SQLAlchemyError:
+        db.rollback()
+    for (row, _), v in zip(batch, values):
+        try:
+            notify_assigned(db, db.execute(_INSERT_RETURNING, v).all(), actor_id)
+            stats.record_values(db, [v])
+            db.commit()
+            report.inserted += 1
+        except SQLAlchemyError as exc:
+            db.rollback()
+            report.fail(row, f"Rejected by the database: {exc.orig or exc}")
@@ -0,0 +1,74 @@
+# task_manager_app/core/leader.py
+import os
+import socket
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import update, or_
+from sqlalchemy.exc import IntegrityError
+
+from task_manager_app.core import database
+from task_manager_app.models.lease import SchedulerLease
+
+
+def default_holder_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class Lease:
+    """
+    Leader election through a lease row in ``scheduler_leases``.
+
+    Every process calls ``acquire()`` on each tick. The current holder renews its
+    lease; everyone else only wins once the lease has expired, so a crashed leader
+    is replaced after at most ``ttl_seconds``. Works on any database with
+    transactional UPDATE (SQLite included), no advisory locks needed.
+    """
+
+    def __init__(self, name: str, ttl_seconds: float, holder: str | None = None):
+        self.name = name
+        self.ttl = timedelta(seconds=ttl_seconds)
+        self.holder = holder or default_holder_id()
+
+    def acquire(self, now: datetime | None = None) -> bool:
+        """Take or renew the lease; return True if this process is the leader."""
+        now = now or datetime.utcnow()
+        db = database.SessionLocal()
+        try:
+            res = db.execute(
+                update(SchedulerLease)
+                .where(
+                    SchedulerLease.name == self.name,
+                    or_(SchedulerLease.holder == self.holder,
+                        SchedulerLease.expires_at < now),
+                )
+                .values(holder=self.holder, expires_at=now + self.ttl)
+            )
+            if res.rowcount == 1:
+                db.commit()
+                return True
+            # No row updated: either someone else holds it, or it doesn't exist yet
+            db.add(SchedulerLease(name=self.name, holder=self.holder,
+                                  expires_at=now + self.ttl))
+            try:
+                db.commit()
+            except IntegrityError:
+                db.rollback()
+                return False
+            return True
+        finally:
+            db.close()
+
+    def release(self) -> None:
+        """Expire our lease immediately so a follower can take over on its next tick."""
+        db = database.SessionLocal()
+        try:
+            db.execute(
+                update(SchedulerLease)
+                .where(SchedulerLease.name == self.name,
+                       SchedulerLease.holder == self.holder)
+                .values(expires_at=datetime.utcnow())
+            )
+            db.commit()
+        finally:
+            db.close()
@@ -0,0 +1,253 @@
+# task_manager_app/core/metrics.py
+import cProfile
+import hmac
+import os
+import threading
+import time
+import uuid
+from bisect import bisect_left
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Optional
+
+from fastapi import FastAPI, Response
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+
+from task_manager_app.core.config import Settings
+
+# Prometheus' default latency buckets (seconds)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+STATEMENT_BUCKETS = (1, 2, 3, 5, 10, 20, 50, 100)
+
+# Content type of the Prometheus text exposition format
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(names: tuple[str, ...], values: tuple, extra: str = "") -> str:
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Histogram:
+    """A Prometheus histogram: cumulative bucket counts, sum and count per label set."""
+
+    def __init__(self, name: str, help: str, labelnames: tuple[str, ...] = (),
+                 buckets: tuple[float, ...] = LATENCY_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+        self.buckets = buckets
+        # labels -> [per-bucket counts (+Inf last), sum]
+        self._series: dict[tuple, list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labels) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][index] += 1
+            series[1] += value
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            series = sorted((labels, list(counts), total)
+                            for labels, (counts, total) in self._series.items())
+        for labels, counts, total in series:
+            cumulative = 0
+            for bound, count in zip((*self.buckets, "+Inf"), counts):
+                cumulative += count
+                le = f'le="{bound}"'
+                lines.append(f"{self.name}_bucket{_labels(self.labelnames, labels, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, labels)} {total}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, labels)} {cumulative}")
+        return lines
+
+    def clear(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+
+request_seconds = Histogram(
+    "http_request_duration_seconds", "Time from request to response start, by route.",
+    ("method", "route", "status"))
+request_statements = Histogram(
+    "http_request_db_statements", "SQL statements executed per request.",
+    ("method", "route"), STATEMENT_BUCKETS)
+request_db_seconds = Histogram(
+    "http_request_db_seconds", "Time spent executing SQL per request.", ("method", "route"))
+span_seconds = Histogram(
+    "app_span_duration_seconds", "Time spent in instrumented sections of a request.", ("span",))
+REGISTRY = [request_seconds, request_statements, request_db_seconds, span_seconds]
+
+
+def render() -> str:
+    """Every metric in the Prometheus text exposition format."""
+    return "\n".join(line for metric in REGISTRY for line in metric.render()) + "\n"
+
+
+# --- Per-request timings -----------------------------------------------------
+
+@dataclass
+class RequestTimings:
+    statements: int = 0
+    db_seconds: float = 0.0
+    spans: dict[str, float] = field(default_factory=dict)
+
+
+# Set by MetricsMiddleware for the duration of a request. The threadpool and
+# SQLAlchemy's async greenlets run in a copy of the request's context, so they
+# see (and add to) the same object.
+_current: ContextVar[Optional[RequestTimings]] = ContextVar("request_timings", default=None)
+
+
+class span:
+    """
+    ``with span("auth"):`` adds the block's duration to the current request's
+    timings. Outside an instrumented request it only reads the clock.
+    """
+
+    __slots__ = ("name", "start")
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc) -> None:
+        timings = _current.get()
+        if timings is not None:
+            elapsed = time.perf_counter() - self.start
+            timings.spans[self.name] = timings.spans.get(self.name, 0.0) + elapsed
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current.get() is not None:
+        context._metrics_start = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    timings = _current.get()
+    start = getattr(context, "_metrics_start", None)
+    if timings is not None and start is not None:
+        timings.statements += 1
+        timings.db_seconds += time.perf_counter() - start
+
+
+def instrument_sql() -> None:
+    """
+    Count statements and query time per request on every engine: primary,
+    replicas, sync and async alike. Outside a request the hooks do nothing.
+    """
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def server_timing(timings: RequestTimings) -> str:
+    """A ``Server-Timing`` header value (milliseconds), shown by browser dev tools."""
+    plural = "" if timings.statements == 1 else "s"
+    parts = [f'db;dur={timings.db_seconds * 1000:.2f};desc="{timings.statements} statement{plural}"']
+    parts += [f"{name};dur={seconds * 1000:.2f}" for name, seconds in timings.spans.items()]
+    return ", ".join(parts)
+
+
+# --- Middleware ----------------------------------------------------------------
+
+PROFILE_HEADER = b"x-profile"
+PROFILE_DUMP_HEADER = "X-Profile-Dump"
+
+
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware (streaming responses pass straight through) that times
+    every HTTP request into the histograms above, labelled by route template so
+    ids in paths don't multiply the series, and adds a ``Server-Timing`` header.
+
+    With ``profile_token`` set, a request carrying ``X-Profile: <token>`` also
+    runs under cProfile and the stats are written to ``profile_dir`` (open them
+    with ``python -m pstats`` or snakeviz); the file name comes back in
+    ``X-Profile-Dump``. cProfile sees only the event loop's thread, including
+    whatever other requests run meanwhile, so one request is profiled at a time.
+    """
+
+    def __init__(self, app, profile_token: Optional[str] = None, profile_dir: str = "profiles"):
+        self.app = app
+        self.profile_token = profile_token.encode() if profile_token else None
+        self.profile_dir = profile_dir
+        self._profiling = threading.Lock()
+
+    def _wants_profile(self, scope) -> bool:
+        if self.profile_token is None:
+            return False
+        given = dict(scope["headers"]).get(PROFILE_HEADER)
+        return given is not None and hmac.compare_digest(given, self.profile_token)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        timings = RequestTimings()
+        token = _current.set(timings)
+        status = 500
+        start = time.perf_counter()
+        elapsed: Optional[float] = None
+        profiler, dump_path = None, None
+        if self._wants_profile(scope) and self._profiling.acquire(blocking=False):
+            profiler = cProfile.Profile()
+            os.makedirs(self.profile_dir, exist_ok=True)
+            dump_path = os.path.join(
+                self.profile_dir, f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}.prof")
+
+        async def send_timed(message):
+            nonlocal status, elapsed
+            if message["type"] == "http.response.start":
+                elapsed = time.perf_counter() - start
+                status = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", server_timing(timings))
+                if dump_path:
+                    headers.append(PROFILE_DUMP_HEADER, os.path.basename(dump_path))
+            await send(message)
+
+        try:
+            if profiler:
+                profiler.enable()
+            await self.app(scope, receive, send_timed)
+        finally:
+            if profiler:
+                profiler.disable()
+                profiler.dump_stats(dump_path)
+                self._profiling.release()
+            _current.reset(token)
+            route = getattr(scope.get("route"), "path", "<unmatched>")
+            method = scope["method"]
+            request_seconds.observe(
+                elapsed if elapsed is not None else time.perf_counter() - start,
+                method, route, status)
+            request_statements.observe(timings.statements, method, route)
+            request_db_seconds.observe(timings.db_seconds, method, route)
+            for name, seconds in timings.spans.items():
+                span_seconds.observe(seconds, name)
+
+
+def install(app: FastAPI, settings: Settings) -> None:
+    """Instrument ``app``: SQL hooks, ``MetricsMiddleware`` and ``GET /metrics``."""
+    instrument_sql()
+    app.add_middleware(MetricsMiddleware, profile_token=settings.profile_token,
+                       profile_dir=settings.profile_dir)
+
+    @app.get("/metrics", include_in_schema=False)
+    def prometheus_metrics():
+        return Response(render(), media_type=CONTENT_TYPE)
@@ -0,0 +1,156 @@
+# task_manager_app/core/notifications.py
+import asyncio
+import logging
+from typing import Iterable
+
+from sqlalchemy import event, func, insert, select
+from sqlalchemy.orm import Session
+
+from task_manager_app.core import database
+from task_manager_app.core.config import get_settings
+from task_manager_app.core.pubsub import Broker
+from task_manager_app.models.notification import Notification, NotificationKind
+from task_manager_app.schemas.notification import NotificationOut
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Columns that make up a pushed notification event (NotificationOut)
+EVENT_COLUMNS = [getattr(Notification, name) for name in NotificationOut.model_fields]
+
+# Rows read per poll by TableTailBroker, and how far behind the newest id it
+# re-reads: ids are allocated at INSERT but become visible at COMMIT, so a
+# slower transaction can surface an id below one already seen.
+TAIL_BATCH_SIZE = 5_000
+TAIL_OVERLAP_IDS = 100
+
+_PENDING_EVENTS = "pending_notification_events"
+
+
+def notification_event(row) -> dict:
+    return NotificationOut.model_validate(row).model_dump(mode="json")
+
+
+class TableTailBroker(Broker):
+    """
+    Cross-worker delivery without extra infrastructure: every worker process
+    tails the ``notifications`` table (one indexed range read per poll, however
+    many clients are connected) and fans new rows out to its own subscribers.
+    Whichever process inserted a notification, every worker sees the row.
+    """
+
+    def __init__(self, queue_size: int, poll_seconds: float):
+        super().__init__(queue_size)
+        self.poll_seconds = poll_seconds
+        self._floor: int | None = None
+        self._seen: set[int] = set()
+        self._task: asyncio.Task | None = None
+
+    def publish(self, key, message) -> None:
+        # the committed row is the message; the tail picks it up
+        pass
+
+    def subscribe(self, key):
+        subscription = super().subscribe(key)
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._poll_forever())
+        return subscription
+
+    async def _poll_forever(self) -> None:
+        while True:
+            if not self.stats()["subscribers"]:
+                # nobody to deliver to: start from the newest row next time
+                self._floor = None
+            else:
+                try:
+                    events = await asyncio.to_thread(self.poll_once)
+                except Exception:
+                    logger.exception("Polling notifications failed")
+                    events = []
+                for message in events:
+                    self.fan_out(message["user_id"], message)
+            await asyncio.sleep(self.poll_seconds)
+
+    def poll_once(self) -> list[dict]:
+        """Read notifications committed since the last poll (blocking)."""
+        db = database.SessionLocal()
+        try:
+            if self._floor is None:
+                self._floor = db.scalar(select(func.max(Notification.id))) or 0
+                self._seen.clear()
+                return []
+            rows = db.execute(
+                select(*EVENT_COLUMNS)
+                .where(Notification.id > self._floor)
+                .order_by(Notification.id)
+                .limit(TAIL_BATCH_SIZE)
+            ).all()
+        finally:
+            db.close()
+        events = [notification_event(row) for row in rows if row.id not in self._seen]
+        self._seen.update(row.id for row in rows)
+        if rows:
+            self._floor = max(self._floor, rows[-1].id - TAIL_OVERLAP_IDS)
+            self._seen = {i for i in self._seen if i > self._floor}
+        return events
+
+    def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+
+def make_broker(name: str) -> Broker:
+    if name == "table":
+        return TableTailBroker(settings.notification_queue_size,
+                               settings.notification_poll_seconds)
+    if name == "local":
+        return Broker(settings.notification_queue_size)
+    raise ValueError(f"Unknown NOTIFICATION_BROKER {name!r}")
+
+
+notification_broker = make_broker(settings.notification_broker)
+
+
+def publish_on_commit(db: Session, rows: Iterable) -> None:
+    """Push ``rows`` (notification rows) to subscribers once ``db`` commits."""
+    db.info.setdefault(_PENDING_EVENTS, []).extend(notification_event(row) for row in rows)
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_pending(session: Session) -> None:
+    for message in session.info.pop(_PENDING_EVENTS, ()):
+        notification_broker.publish(message["user_id"], message)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending(session: Session) -> None:
+    session.info.pop(_PENDING_EVENTS, None)
+
+
+def assigned_message(title: str) -> str:
+    return f"You were assigned task '{title}'."
+
+
+def notify_assigned(db: Session, tasks: Iterable, actor_id: int) -> None:
+    """
+    Queue an ``assigned`` notification for each task assigned to someone other
+    than ``actor_id``. Each user is told about a given task once, however often
+    it is reassigned back to them (the table's dedupe key).
+    """
+    values = [
+        {
+            "user_id": task.assignee_id,
+            "task_id": task.id,
+            "kind": NotificationKind.assigned,
+            "message": assigned_message(task.title),
+        }
+        for task in tasks
+        if task.assignee_id is not None and task.assignee_id != actor_id
+    ]
+    if not values:
+        return
+    stmt = database.insert_ignoring_duplicates(db, Notification)
+    if stmt is None:
+        stmt = insert(Notification)
+    publish_on_commit(db, db.execute(stmt.returning(*EVENT_COLUMNS), values).all())
@@ -0,0 +1,106 @@
+# task_manager_app/core/pubsub.py
+import asyncio
+import threading
+from collections import defaultdict
+from typing import Any, Hashable
+
+
+class Subscription:
+    """
+    One listener's bounded inbox, consumed on the event loop it was created on.
+
+    A subscriber that falls ``maxsize`` messages behind is cut off rather than
+    buffered without limit: its queue is emptied and ``get()`` returns None,
+    after which the caller should drop the connection and let the client resume
+    from durable storage (for notifications: the table, by Last-Event-ID).
+    """
+
+    def __init__(self, broker: "Broker", key: Hashable, maxsize: int,
+                 loop: asyncio.AbstractEventLoop):
+        self.broker = broker
+        self.key = key
+        self.loop = loop
+        self.overflowed = False
+        self.closed = False
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize + 1)  # +1: close sentinel
+        self._maxsize = maxsize
+
+    def offer(self, message: Any) -> None:
+        """Deliver ``message``; must run on ``self.loop``."""
+        if self.closed:
+            return
+        if self._queue.qsize() >= self._maxsize:
+            self.overflowed = True
+            self.broker.dropped += 1
+            while not self._queue.empty():
+                self._queue.get_nowait()
+            self.close()
+            return
+        self._queue.put_nowait(message)
+        self.broker.delivered += 1
+
+    async def get(self) -> Any | None:
+        """Next message, or None once the subscription is closed."""
+        if self.closed and self._queue.empty():
+            return None
+        return await self._queue.get()
+
+    def close(self) -> None:
+        if not self.closed:
+            self.closed = True
+            self._queue.put_nowait(None)
+            self.broker.unsubscribe(self)
+
+
+class Broker:
+    """
+    In-process fan-out of messages to subscribers, keyed (e.g. by user id).
+
+    ``publish`` may be called from any thread, including the background
+    scheduler's and the request threadpool's; delivery hops onto each
+    subscriber's event loop. Subclasses can source messages from elsewhere
+    (another process, a table) and hand them to ``fan_out``.
+    """
+
+    def __init__(self, queue_size: int = 100):
+        self.queue_size = queue_size
+        self._subscribers: dict[Hashable, set[Subscription]] = defaultdict(set)
+        self._lock = threading.Lock()
+        self.delivered = 0
+        self.dropped = 0
+
+    def subscribe(self, key: Hashable) -> Subscription:
+        """Must be called from the event loop that will consume the subscription."""
+        subscription = Subscription(self, key, self.queue_size, asyncio.get_running_loop())
+        with self._lock:
+            self._subscribers[key].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.key)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[subscription.key]
+
+    def publish(self, key: Hashable, message: Any) -> None:
+        self.fan_out(key, message)
+
+    def fan_out(self, key: Hashable, message: Any) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers.get(key, ()))
+        for subscription in subscribers:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.offer, message)
+            except RuntimeError:
+                # the subscriber's loop has shut down
+                self.unsubscribe(subscription)
+
+    def close(self) -> None:
+        """Release background resources; subclasses that own any override this."""
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            subscribers = sum(len(s) for s in self._subscribers.values())
+        return {"subscribers": subscribers, "delivered": self.delivered, "dropped": self.dropped}
@@ -0,0 +1,267 @@
+# task_manager_app/core/reminders.py
+import heapq
+import threading
+import time as clock
+from datetime import datetime, date, time, timedelta
+from typing import Iterable
+
+from sqlalchemy import select, insert, exists
+from sqlalchemy.orm import Session
+
+from task_manager_app.core import database
+from task_manager_app.core.config import get_settings
+from task_manager_app.core.notifications import EVENT_COLUMNS, publish_on_commit
+from task_manager_app.models.task import Task, Status
+from task_manager_app.models.notification import Notification, NotificationKind
+
+# Tasks due within this window get a "due soon" reminder for their assignee
+REMINDER_WINDOW = timedelta(hours=24)
+
+# Rows per INSERT executemany batch
+INSERT_BATCH_SIZE = 1000
+
+# Task ids per IN (...) clause when sweeping a known set of tasks
+ID_BATCH_SIZE = 500
+
+# Re-read changes this far behind the watermark to tolerate clock skew
+# between worker processes stamping ``updated_at``
+CATCH_UP_OVERLAP = timedelta(seconds=5)
+
+settings = get_settings()
+
+
+def reminder_message(title: str, due_date) -> str:
+    return f"Task '{title}' is due within 24h (due: {due_date})."
+
+
+def reminder_fire_at(due_date: date) -> datetime:
+    """The moment a task due on ``due_date`` enters the reminder window."""
+    return datetime.combine(due_date, time.min) - REMINDER_WINDOW
+
+
+def due_reminder_candidates(now: datetime, task_ids: Iterable[int] | None = None, *,
+                            upcoming: bool = False):
+    """
+    Select ``(task_id, assignee_id, title, due_date)`` for every open, assigned task
+    that is due within the reminder window and has no ``due_soon`` notification yet.
+    With ``upcoming=True`` the window has no upper end (every task that will need one).
+
+    The dedupe check is a correlated ``NOT EXISTS`` against the
+    ``(task_id, user_id, kind)`` index, so the whole sweep is a single query.
+    """
+    already_reminded = (
+        select(Notification.id)
+        .where(
+            Notification.task_id == Task.id,
+            Notification.user_id == Task.assignee_id,
+            Notification.kind == NotificationKind.due_soon,
+        )
+    )
+    stmt = select(Task.id, Task.assignee_id, Task.title, Task.due_date).where(
+        Task.due_date != None,           # noqa: E711
+        Task.assignee_id != None,        # noqa: E711
+        Task.status != Status.completed,
+        ~exists(already_reminded),
+    )
+    if not upcoming:
+        stmt = stmt.where(Task.due_date <= (now + REMINDER_WINDOW).date())
+    if task_ids is not None:
+        stmt = stmt.where(Task.id.in_(list(task_ids)))
+    return stmt
+
+
+def sweep_due_reminders(db: Session, now: datetime | None = None,
+                        task_ids: list[int] | None = None) -> int:
+    """
+    Create a ``due_soon`` notification for every task that needs one and
+    return how many were inserted. ``task_ids`` restricts the sweep to those tasks.
+    """
+    now = now or datetime.utcnow()
+    if task_ids is None:
+        rows = db.execute(due_reminder_candidates(now)).all()
+    else:
+        rows = []
+        for start in range(0, len(task_ids), ID_BATCH_SIZE):
+            chunk = task_ids[start:start + ID_BATCH_SIZE]
+            rows.extend(db.execute(due_reminder_candidates(now, chunk)).all())
+    if not rows:
+        return 0
+
+    values = [
+        {
+            "user_id": assignee_id,
+            "task_id": task_id,
+            "kind": NotificationKind.due_soon,
+            "message": reminder_message(title, due_date),
+            "created_at": now,
+        }
+        for task_id, assignee_id, title, due_date in rows
+    ]
+    for start in range(0, len(values), INSERT_BATCH_SIZE):
+        inserted = db.execute(
+            insert(Notification).returning(*EVENT_COLUMNS),
+            values[start:start + INSERT_BATCH_SIZE],
+        ).all()
+        publish_on_commit(db, inserted)
+    db.commit()
+    return len(values)
+
+
+class DueDateIndex:
+    """
+    Min-heap of ``(fire_at, task_id)`` timers. Rescheduling or discarding a task
+    leaves its old heap entry behind; stale entries are skipped when popped and
+    the heap is compacted once they outnumber the live ones.
+    """
+
+    def __init__(self):
+        self._heap: list[tuple[datetime, int]] = []
+        self._fire_at: dict[int, datetime] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._fire_at)
+
+    def __contains__(self, task_id: int) -> bool:
+        return task_id in self._fire_at
+
+    def schedule(self, task_id: int, fire_at: datetime) -> None:
+        with self._lock:
+            if self._fire_at.get(task_id) == fire_at:
+                return
+            self._fire_at[task_id] = fire_at
+            heapq.heappush(self._heap, (fire_at, task_id))
+            if len(self._heap) > 2 * len(self._fire_at) + 64:
+                self._heap = [(f, t) for t, f in self._fire_at.items()]
+                heapq.heapify(self._heap)
+
+    def discard(self, task_id: int) -> None:
+        with self._lock:
+            self._fire_at.pop(task_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._heap.clear()
+            self._fire_at.clear()
+
+    def next_fire_at(self) -> datetime | None:
+        with self._lock:
+            while self._heap and self._fire_at.get(self._heap[0][1]) != self._heap[0][0]:
+                heapq.heappop(self._heap)
+            return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: datetime) -> list[int]:
+        """Remove and return every task whose timer fires at or before ``now``."""
+        due = []
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                fire_at, task_id = heapq.heappop(self._heap)
+                if self._fire_at.get(task_id) == fire_at:
+                    del self._fire_at[task_id]
+                    due.append(task_id)
+        return due
+
+
+class ReminderEngine:
+    """
+    Incremental reminder scheduling.
+
+    The engine keeps a ``DueDateIndex`` with one timer per open, assigned task that
+    has not been reminded yet. Each tick it folds in tasks whose ``updated_at`` is
+    newer than the previous tick (so edits made by other worker processes are seen
+    too), then sweeps only the tasks whose timers have fired. Steady-state cost is
+    O(changed tasks + tasks becoming due) rather than O(all tasks).
+
+    The index is only maintained while ``active``, i.e. in the process that holds
+    the reminders lease; it is rebuilt from the database when a process takes over.
+
+    ``updated_at`` is stamped when a row is written, not when it commits, so a
+    transaction that stays open longer than ``CATCH_UP_OVERLAP`` commits rows
+    behind the watermark. As a backstop the index is also rebuilt from scratch
+    every ``rebuild_seconds``.
+    """
+
+    def __init__(self, rebuild_seconds: float = 3600):
+        self.index = DueDateIndex()
+        self.active = False
+        self.watermark: datetime | None = None
+        self.rebuild_seconds = rebuild_seconds
+        self._rebuilt_at: float | None = None
+
+    def track(self, task) -> None:
+        """Reschedule a task after it was created or updated."""
+        if not self.active:
+            return
+        if task.due_date and task.assignee_id and task.status != Status.completed:
+            self.index.schedule(task.id, reminder_fire_at(task.due_date))
+        else:
+            self.index.discard(task.id)
+
+    def discard(self, task_id: int) -> None:
+        """Forget a task after it was deleted."""
+        self.index.discard(task_id)
+
+    def rebuild(self, db: Session, now: datetime | None = None) -> None:
+        self.index.clear()
+        self.watermark = datetime.utcnow()
+        candidates = due_reminder_candidates(now or self.watermark, upcoming=True)
+        for task_id, _, _, due_date in db.execute(candidates):
+            self.index.schedule(task_id, reminder_fire_at(due_date))
+        self.active = True
+        self._rebuilt_at = clock.monotonic()
+
+    def catch_up(self, db: Session) -> None:
+        started = datetime.utcnow()
+        rows = db.execute(
+            select(Task.id, Task.due_date, Task.assignee_id, Task.status)
+            .where(Task.updated_at >= self.watermark - CATCH_UP_OVERLAP)
+        ).all()
+        for row in rows:
+            self.track(row)
+        self.watermark = started
+
+    def deactivate(self) -> None:
+        """Drop the index when another process holds the lease."""
+        self.active = False
+        self.watermark = None
+        self.index.clear()
+
+    def next_fire_at(self) -> datetime | None:
+        return self.index.next_fire_at() if self.active else None
+
+    def run(self, db: Session, now: datetime | None = None) -> int:
+        now = now or datetime.utcnow()
+        if not self.active or clock.monotonic() - self._rebuilt_at >= self.rebuild_seconds:
+            self.rebuild(db, now)
+        else:
+            self.catch_up(db)
+        due = self.index.pop_due(now)
+        if not due:
+            return 0
+        try:
+            return sweep_due_reminders(db, now, task_ids=due)
+        except Exception:
+            db.rollback()
+            for task_id in due:
+                self.index.schedule(task_id, now)
+            raise
+
+
+# Process-wide engine, fed by task mutations in routers/tasks.py
+reminder_engine = ReminderEngine(settings.reminder_rebuild_seconds)
+
+
+def run_reminder_sweep() -> int:
+    """Blocking entry point for the background scheduler: one tick in its own session."""
+    db = database.SessionLocal()
+    try:
+        return reminder_engine.run(db)
+    finally:
+        db.close()
+
+
+def seconds_until_next_reminder() -> float | None:
+    fire_at = reminder_engine.next_fire_at()
+    if fire_at is None:
+        return None
+    return max(0.0, (fire_at - datetime.utcnow()).total_seconds())
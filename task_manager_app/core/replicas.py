@@ -0,0 +1,113 @@
+# task_manager_app/core/replicas.py
+import asyncio
+import itertools
+import logging
+import time
+from typing import Hashable, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from task_manager_app.core.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Seconds a replica is behind its primary, per dialect. A streaming Postgres
+# standby that has replayed everything it received reports 0 even when the
+# primary has been idle. Elsewhere only reachability is checked; for SQLite
+# that means reading the schema, since a bare SELECT never touches the file.
+_LAG_QUERIES = {
+    "postgresql": text(
+        "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0"
+        " ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+    ),
+    "sqlite": text("SELECT 0 FROM sqlite_master LIMIT 1"),
+}
+_PING = text("SELECT 0")
+
+# How long a health check may take before the replica counts as down
+CHECK_TIMEOUT_SECONDS = 2.0
+
+
+class Replica:
+    """One read replica and what its last health check found."""
+
+    def __init__(self, name: str, sessionmaker: async_sessionmaker):
+        self.name = name
+        self.sessionmaker = sessionmaker
+        self.healthy = True
+        self.lag = 0.0
+        self.checked_at: Optional[float] = None
+        self.checking = False
+
+
+async def replication_lag(replica: Replica) -> float:
+    async with replica.sessionmaker() as db:
+        query = _LAG_QUERIES.get(db.get_bind().dialect.name, _PING)
+        return float(await db.scalar(query) or 0)
+
+
+class ReplicaRouter:
+    """
+    Chooses where a read-only request's session goes.
+
+    Replicas are taken round-robin, skipping any that failed their last health
+    check or lag more than ``max_lag_seconds``; with none usable (or none
+    configured) the answer is the primary, signalled by ``None``. Each replica is
+    checked at most every ``check_seconds``, inline on the request that finds
+    the result stale; concurrent requests use the previous result meanwhile.
+
+    Read-your-writes: ``wrote(client)`` pins that client's reads to the primary
+    for ``sticky_seconds``. Like the other in-process caches this is per worker,
+    so the window should cover the replicas' usual lag.
+    """
+
+    def __init__(self, replicas: list[Replica], *, max_lag_seconds: float,
+                 check_seconds: float, sticky_seconds: float, max_clients: int = 100_000):
+        self.replicas = replicas
+        self.max_lag = max_lag_seconds
+        self.check_seconds = check_seconds
+        self._turn = itertools.count()
+        self._recent_writers = TTLCache(max_clients, sticky_seconds)
+
+    def wrote(self, client: Optional[Hashable]) -> None:
+        if client is not None and self.replicas:
+            self._recent_writers.set(client, True)
+
+    async def sessionmaker_for(self, client: Optional[Hashable]) -> Optional[async_sessionmaker]:
+        if not self.replicas:
+            return None
+        if client is not None and self._recent_writers.get(client):
+            return None
+        start = next(self._turn)
+        for offset in range(len(self.replicas)):
+            replica = self.replicas[(start + offset) % len(self.replicas)]
+            if await self._usable(replica):
+                return replica.sessionmaker
+        return None
+
+    async def _usable(self, replica: Replica) -> bool:
+        stale = (replica.checked_at is None
+                 or time.monotonic() - replica.checked_at >= self.check_seconds)
+        if stale and not replica.checking:
+            await self.check(replica)
+        return replica.healthy and replica.lag <= self.max_lag
+
+    async def check(self, replica: Replica) -> None:
+        replica.checking = True
+        try:
+            replica.lag = await asyncio.wait_for(replication_lag(replica), CHECK_TIMEOUT_SECONDS)
+            if not replica.healthy:
+                logger.info("Replica %s is back", replica.name)
+            replica.healthy = True
+            if replica.lag > self.max_lag:
+                logger.warning("Replica %s lags %.1fs; reading from the primary",
+                               replica.name, replica.lag)
+        except Exception:
+            if replica.healthy:
+                logger.warning("Replica %s is down; reading from the primary",
+                               replica.name, exc_info=True)
+            replica.healthy = False
+        finally:
+            replica.checked_at = time.monotonic()
+            replica.checking = False
@@ -0,0 +1,176 @@
+# task_manager_app/core/retention.py
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Callable
+
+from sqlalchemy import and_, delete, exists, insert, literal, or_, select, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from task_manager_app.core import database
+from task_manager_app.core.config import get_settings
+from task_manager_app.models.notification import Notification, NotificationArchive
+from task_manager_app.models.task import Status, Task
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Rebuild the SQLite file once at least this fraction of its pages are free
+VACUUM_FREE_FRACTION = 0.25
+
+_ARCHIVED_COLUMNS = ["id", "user_id", "task_id", "kind", "message", "created_at", "read_at"]
+
+
+# System notifications (``kind`` set) double as the reminder engine's dedupe
+# key: while their task is open, removing one would let it be sent again
+_DEDUPE_KEY_IN_USE = Notification.kind.is_not(None) & exists(
+    select(Task.id).where(Task.id == Notification.task_id, Task.status != Status.completed)
+)
+
+
+@dataclass
+class RetentionReport:
+    deleted: int = 0
+    archived: int = 0
+    vacuumed: bool = False
+
+    @property
+    def rows(self) -> int:
+        return self.deleted + self.archived
+
+
+def _batch_query(condition, after: tuple[datetime, int] | None, limit: int):
+    """
+    The next ``limit`` matching notifications, oldest first along
+    ix_notifications_created_at. Each batch resumes after the last row seen
+    (``after``), so rows that are kept are read only once per run.
+    """
+    stmt = select(Notification.id, Notification.created_at).where(condition)
+    if after is not None:
+        stmt = stmt.where(or_(
+            Notification.created_at > after[0],
+            and_(Notification.created_at == after[0], Notification.id > after[1]),
+        ))
+    return stmt.order_by(Notification.created_at, Notification.id).limit(limit)
+
+
+def _in_batches(db: Session, condition, apply: Callable[[list[int]], None], *,
+                batch_size: int, pause: float, budget: int) -> int:
+    """
+    Call ``apply`` with the ids of matching notifications, ``batch_size`` at a
+    time, committing and sleeping ``pause`` seconds between batches so other
+    writers get the database in between. Returns the number of rows handled.
+    """
+    done = 0
+    after = None
+    while done < budget:
+        limit = min(batch_size, budget - done)
+        rows = db.execute(_batch_query(condition, after, limit)).all()
+        if not rows:
+            break
+        ids = [row.id for row in rows]
+        after = (rows[-1].created_at, rows[-1].id)
+        apply(ids)
+        db.commit()
+        done += len(ids)
+        if len(ids) < limit:
+            break
+        time.sleep(pause)
+    return done
+
+
+def apply_retention(db: Session, now: datetime | None = None, *,
+                    retention_days: int,
+                    archive_days: int,
+                    batch_size: int = 1000,
+                    pause: float = 0.0,
+                    max_rows: int = 100_000) -> RetentionReport:
+    """
+    Delete read notifications older than ``retention_days`` and move unread ones
+    older than ``archive_days`` to ``notifications_archive`` (0 disables either).
+    Reminders and assignment notices of open tasks are kept whatever their age.
+    At most ``max_rows`` are handled per call; the rest wait for the next run.
+    """
+    now = now or datetime.utcnow()
+    report = RetentionReport()
+    budget = max_rows
+
+    if retention_days:
+        cutoff = now - timedelta(days=retention_days)
+        report.deleted = _in_batches(
+            db,
+            (Notification.read_at.is_not(None)) & (Notification.created_at < cutoff)
+            & ~_DEDUPE_KEY_IN_USE,
+            lambda ids: db.execute(delete(Notification).where(Notification.id.in_(ids))),
+            batch_size=batch_size, pause=pause, budget=budget,
+        )
+        budget -= report.deleted
+
+    if archive_days:
+        cutoff = now - timedelta(days=archive_days)
+
+        def archive(ids: list[int]) -> None:
+            source = select(*(getattr(Notification, c) for c in _ARCHIVED_COLUMNS),
+                            literal(now, NotificationArchive.archived_at.type))
+            db.execute(
+                insert(NotificationArchive).from_select(
+                    [*_ARCHIVED_COLUMNS, "archived_at"], source.where(Notification.id.in_(ids)))
+            )
+            db.execute(delete(Notification).where(Notification.id.in_(ids)))
+
+        report.archived = _in_batches(
+            db,
+            (Notification.read_at.is_(None)) & (Notification.created_at < cutoff)
+            & ~_DEDUPE_KEY_IN_USE,
+            archive,
+            batch_size=batch_size, pause=pause, budget=budget,
+        )
+    return report
+
+
+def compact(engine: Engine) -> bool:
+    """
+    Refresh planner statistics for ``notifications`` and, on SQLite, ``VACUUM``
+    once enough of the file is free pages to be worth rewriting it. Returns
+    whether a VACUUM ran.
+    """
+    vacuumed = False
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        try:
+            if conn.dialect.name == "sqlite":
+                pages = conn.exec_driver_sql("PRAGMA page_count").scalar()
+                free = conn.exec_driver_sql("PRAGMA freelist_count").scalar()
+                if pages and free / pages >= VACUUM_FREE_FRACTION:
+                    conn.exec_driver_sql("VACUUM")
+                    vacuumed = True
+                conn.exec_driver_sql("ANALYZE notifications")
+            elif conn.dialect.name == "postgresql":
+                conn.execute(text("VACUUM (ANALYZE) notifications"))
+        except OperationalError:
+            # e.g. SQLite can't VACUUM while another connection is mid-transaction
+            logger.warning("Compacting after notification retention failed", exc_info=True)
+    return vacuumed
+
+
+def run_retention() -> int:
+    """Blocking entry point for the background scheduler."""
+    db = database.SessionLocal()
+    try:
+        report = apply_retention(
+            db,
+            retention_days=settings.notification_retention_days,
+            archive_days=settings.notification_archive_days,
+            batch_size=settings.retention_batch_size,
+            pause=settings.retention_batch_pause_seconds,
+            max_rows=settings.retention_max_rows_per_run,
+        )
+        engine = db.get_bind()
+    finally:
+        db.close()
+    if report.rows:
+        report.vacuumed = compact(engine)
+    logger.info("Notification retention: %s", report)
+    return report.rows
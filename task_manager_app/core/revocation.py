@@ -0,0 +1,87 @@
+# task_manager_app/core/revocation.py
+from datetime import datetime
+
+from sqlalchemy import delete, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from task_manager_app.core import database
+from task_manager_app.core.cache import TTLCache
+from task_manager_app.core.config import get_settings
+from task_manager_app.models.revoked_token import RevokedToken
+
+settings = get_settings()
+
+
+class RevocationStore:
+    """
+    Refresh-token revocations keyed by ``jti``, shared by every worker through the
+    ``revoked_tokens`` table.
+
+    Only *positive* answers are cached in-process: a jti seen revoked stays revoked
+    until it expires, so replays of a revoked token are rejected without a query.
+    "Not revoked" is never cached, since another worker may revoke the token at
+    any moment; the rotation in ``/auth/refresh`` goes through ``revoke`` instead,
+    which checks and revokes in a single INSERT.
+    """
+
+    def __init__(self, cache_size: int):
+        self.cache = TTLCache(cache_size, settings.refresh_token_expire_days * 86400)
+
+    def _remember(self, jti: str, expires_at: datetime) -> None:
+        self.cache.set(jti, True, ttl_seconds=(expires_at - datetime.utcnow()).total_seconds())
+
+    def is_revoked(self, db: Session, jti: str) -> bool:
+        if self.cache.get(jti):
+            return True
+        expires_at = db.scalar(select(RevokedToken.expires_at).where(RevokedToken.jti == jti))
+        if expires_at is None:
+            return False
+        self._remember(jti, expires_at)
+        return True
+
+    def revoke(self, db: Session, jti: str, expires_at: datetime) -> bool:
+        """
+        Revoke ``jti``. Returns False if it was already revoked, which makes this a
+        race-free "use once" check when two workers see the same token.
+        """
+        if self.cache.get(jti):
+            return False
+        values = {"jti": jti, "expires_at": expires_at, "revoked_at": datetime.utcnow()}
+        stmt = database.insert_ignoring_duplicates(db, RevokedToken)
+        if stmt is not None:
+            inserted = db.execute(stmt.values(**values)).rowcount == 1
+            db.commit()
+        else:
+            db.add(RevokedToken(**values))
+            try:
+                db.commit()
+                inserted = True
+            except IntegrityError:
+                db.rollback()
+                inserted = False
+        self._remember(jti, expires_at)
+        return inserted
+
+    def clear(self) -> None:
+        self.cache.clear()
+
+
+revocation_store = RevocationStore(settings.revocation_cache_size)
+
+
+def purge_expired_revocations(db: Session, now: datetime | None = None) -> int:
+    """Delete revocations whose token has expired; an expired token fails ``exp`` anyway."""
+    now = now or datetime.utcnow()
+    result = db.execute(delete(RevokedToken).where(RevokedToken.expires_at < now))
+    db.commit()
+    return result.rowcount
+
+
+def run_revocation_purge() -> int:
+    """Blocking entry point for the background scheduler."""
+    db = database.SessionLocal()
+    try:
+        return purge_expired_revocations(db)
+    finally:
+        db.close()
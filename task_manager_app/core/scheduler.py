@@ -0,0 +1,168 @@
+# task_manager_app/core/scheduler.py
+import asyncio
+import logging
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, asdict
+from datetime import datetime
+from typing import Callable
+
+from task_manager_app.core.leader import Lease
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class JobMetrics:
+    runs: int = 0
+    failures: int = 0
+    is_leader: bool = False
+    last_run_at: datetime | None = None
+    last_duration_seconds: float = 0.0
+    total_duration_seconds: float = 0.0
+    last_rows: int = 0
+    total_rows: int = 0
+
+
+@dataclass
+class PeriodicJob:
+    name: str
+    func: Callable[[], object]
+    interval_seconds: float
+    jitter: float = 0.0
+    # When set, only the process holding the lease runs the job and
+    # ``standby`` is called on the others
+    lease: Lease | None = None
+    standby: Callable[[], None] | None = None
+    # Seconds until the job has work again; shortens the next sleep
+    next_run_in: Callable[[], float | None] | None = None
+    metrics: JobMetrics = field(default_factory=JobMetrics)
+
+
+class BackgroundScheduler:
+    """
+    Runs blocking periodic jobs (DB sweeps and the like) on a small dedicated
+    thread pool so they never execute on the asyncio event loop.
+
+    - at most ``max_workers`` jobs run at once, and a job never overlaps itself
+    - each delay is ``interval * (1 +/- jitter)`` so processes drift apart
+    - ``shutdown()`` stops scheduling, waits for in-flight runs, then
+      releases the threads
+    - jobs with a ``lease`` run only in the elected process; the others keep
+      ticking so they can take over when the leader goes away
+    """
+
+    def __init__(self, max_workers: int = 2, shutdown_timeout: float = 30.0):
+        self.max_workers = max_workers
+        self.shutdown_timeout = shutdown_timeout
+        self.jobs: list[PeriodicJob] = []
+        self._executor: ThreadPoolExecutor | None = None
+        self._stopping: asyncio.Event | None = None
+        self._tasks: list[asyncio.Task] = []
+
+    def add_job(self, name: str, func: Callable[[], object],
+                interval_seconds: float, jitter: float = 0.0,
+                lease: Lease | None = None,
+                standby: Callable[[], None] | None = None,
+                next_run_in: Callable[[], float | None] | None = None) -> PeriodicJob:
+        job = PeriodicJob(name, func, interval_seconds, jitter, lease, standby, next_run_in)
+        self.jobs.append(job)
+        return job
+
+    def metrics(self) -> dict[str, dict]:
+        return {job.name: asdict(job.metrics) for job in self.jobs}
+
+    @property
+    def running(self) -> bool:
+        return bool(self._tasks)
+
+    def start(self) -> None:
+        """Start every job. Must be called from the running event loop."""
+        if self._tasks:
+            return
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                            thread_name_prefix="background")
+        self._stopping = asyncio.Event()
+        self._tasks = [
+            asyncio.create_task(self._run(job), name=f"background:{job.name}")
+            for job in self.jobs
+        ]
+
+    async def shutdown(self) -> None:
+        if not self._tasks:
+            return
+        self._stopping.set()
+        done, pending = await asyncio.wait(self._tasks, timeout=self.shutdown_timeout)
+        for task in pending:
+            logger.warning("background job %s did not stop in time", task.get_name())
+            task.cancel()
+        loop = asyncio.get_running_loop()
+        for job in self.jobs:
+            if job.lease and job.metrics.is_leader:
+                try:
+                    await loop.run_in_executor(self._executor, job.lease.release)
+                except Exception:
+                    logger.exception("could not release lease for %s", job.name)
+                job.metrics.is_leader = False
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._tasks = []
+        self._executor = None
+
+    @staticmethod
+    def _delay(job: PeriodicJob) -> float:
+        spread = job.interval_seconds * job.jitter
+        delay = max(0.0, job.interval_seconds + random.uniform(-spread, spread))
+        if job.next_run_in is not None:
+            due_in = job.next_run_in()
+            if due_in is not None:
+                # floor so a failing job can't spin
+                delay = min(delay, max(due_in, 1.0))
+        return delay
+
+    async def _sleep(self, seconds: float) -> bool:
+        """Sleep for ``seconds``; return False if shutdown was requested meanwhile."""
+        try:
+            await asyncio.wait_for(self._stopping.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            return True
+        return False
+
+    async def _run(self, job: PeriodicJob) -> None:
+        loop = asyncio.get_running_loop()
+        # Run soon after startup, but spread out across processes
+        delay = random.uniform(0, job.interval_seconds * job.jitter)
+        while await self._sleep(delay):
+            try:
+                await loop.run_in_executor(self._executor, self._tick, job)
+            except Exception:
+                # Keep the worker resilient—log and continue
+                job.metrics.failures += 1
+                logger.exception("background job %s failed", job.name)
+            delay = self._delay(job)
+
+    @staticmethod
+    def _tick(job: PeriodicJob) -> None:
+        """One run of ``job`` on a worker thread, recording duration and rows touched."""
+        metrics = job.metrics
+        if job.lease is not None:
+            try:
+                metrics.is_leader = job.lease.acquire()
+            except Exception:
+                metrics.is_leader = False
+                raise
+            if not metrics.is_leader:
+                if job.standby is not None:
+                    job.standby()
+                return
+        start = time.perf_counter()
+        try:
+            rows = job.func()
+        finally:
+            elapsed = time.perf_counter() - start
+            metrics.runs += 1
+            metrics.last_run_at = datetime.utcnow()
+            metrics.last_duration_seconds = elapsed
+            metrics.total_duration_seconds += elapsed
+        metrics.last_rows = rows if isinstance(rows, int) else 0
+        metrics.total_rows += metrics.last_rows
@@ -0,0 +1,146 @@
+# task_manager_app/core/search.py
+import re
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+
+from sqlalchemy import false, func, literal_column, or_, column, select, table, text
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+
+from task_manager_app.core import database
+from task_manager_app.models.task import Task
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+# The FTS5 shadow of ``tasks`` created by TASK_SEARCH_DDL in models/task.py
+tasks_fts = table("tasks_fts", column("rowid"), column("rank"))
+
+
+@contextmanager
+def deferred_fts_index(db: Session):
+    """
+    Index tasks inserted inside the block in one pass at the end, instead of
+    row by row through the FTS5 insert trigger (several times faster for bulk
+    loads). SQLite only; elsewhere the index maintains itself and this is a no-op.
+
+    Must wrap the whole write transaction: the pause row is taken first, which
+    also takes SQLite's write lock, so no other connection can insert meanwhile
+    or ever see the trigger paused.
+    """
+    if db.get_bind().dialect.name != "sqlite":
+        yield
+        return
+    db.execute(text("INSERT INTO tasks_fts_deferred (id) VALUES (1)"))
+    last_id = db.scalar(select(func.max(Task.id))) or 0
+    yield
+    db.execute(text("INSERT INTO tasks_fts(rowid, title, description) "
+                    "SELECT id, title, description FROM tasks WHERE id > :last_id"),
+               {"last_id": last_id})
+    db.execute(text("DELETE FROM tasks_fts_deferred"))
+
+
+def search_terms(q: str) -> list[str]:
+    """Split user input into word tokens; punctuation never reaches the query syntax."""
+    return _TOKEN.findall(q.lower())
+
+
+class SearchBackend(ABC):
+    """
+    Text search over task title + description.
+
+    ``apply`` narrows a ``select(Task)`` to matching rows; ``rank`` returns an
+    expression to ORDER BY (best match first), or None when the backend cannot
+    rank. Pass ``ranked=True`` to ``apply`` when the statement will be ordered
+    by ``rank``: the expression is only valid on such a statement.
+    What counts as a match is up to each backend; see their docstrings.
+    """
+
+    @abstractmethod
+    def apply(self, stmt: Select, q: str, *, ranked: bool = False) -> Select:
+        ...
+
+    def rank(self, q: str):
+        return None
+
+
+class LikeSearch(SearchBackend):
+    """
+    Unindexed, case-insensitive substring match of the whole input (not split
+    into terms: ``rev`` finds "Preview"); the fallback for other databases.
+    Cannot rank.
+    """
+
+    def apply(self, stmt, q, *, ranked=False):
+        like = f"%{q}%"
+        return stmt.where(or_(Task.title.ilike(like), Task.description.ilike(like)))
+
+
+class SqliteFtsSearch(SearchBackend):
+    """
+    FTS5 ``tasks_fts`` table kept in sync by triggers. Every term must match
+    the start of a word (case- and accent-insensitive); ranked by bm25.
+
+    Unranked, the matches are an ``IN`` list computed once, so the planner can
+    drive from the most selective index on ``tasks`` (e.g. one assignee) and
+    probe the list. Ranked, ``tasks_fts`` drives a join on ``+rowid``: the
+    unary plus hides the rowid from the planner, which otherwise nested
+    ``tasks_fts`` inside a loop over ``tasks`` and reran the whole MATCH for
+    every candidate row. bm25 is then only computed for rows past the filters.
+    """
+
+    def apply(self, stmt, q, *, ranked=False):
+        terms = search_terms(q)
+        if not terms:
+            return stmt.where(false())
+        match = literal_column("tasks_fts").op("MATCH")(" ".join(f'"{t}"*' for t in terms))
+        if ranked:
+            return stmt.join(tasks_fts, literal_column("+tasks_fts.rowid") == Task.id).where(match)
+        return stmt.where(Task.id.in_(select(tasks_fts.c.rowid).where(match)))
+
+    def rank(self, q):
+        if not search_terms(q):
+            return None  # apply() didn't join tasks_fts
+        # FTS5's rank is bm25(): more negative is a better match
+        return tasks_fts.c.rank.asc()
+
+
+class PostgresFtsSearch(SearchBackend):
+    """
+    ``tsvector`` expression backed by the ``ix_tasks_search`` GIN index. Every
+    term must match the start of a word (``simple`` config: lowercased, no
+    stemming); ranked by ``ts_rank``.
+    """
+
+    # must match the indexed expression exactly for the planner to use it,
+    # hence the inlined config name rather than a bound parameter
+    config = literal_column("'simple'::regconfig")
+    document = func.to_tsvector(
+        config,
+        func.coalesce(Task.title, literal_column("''")).op("||")(literal_column("' '"))
+        .op("||")(func.coalesce(Task.description, literal_column("''"))),
+    )
+
+    def _query(self, q):
+        return func.to_tsquery(self.config, " & ".join(f"{t}:*" for t in search_terms(q)))
+
+    def apply(self, stmt, q, *, ranked=False):
+        if not search_terms(q):
+            return stmt.where(false())
+        return stmt.where(self.document.op("@@")(self._query(q)))
+
+    def rank(self, q):
+        if not search_terms(q):
+            return None
+        return func.ts_rank(self.document, self._query(q)).desc()
+
+
+_BACKENDS = {
+    "sqlite": SqliteFtsSearch(),
+    "postgresql": PostgresFtsSearch(),
+}
+
+
+def get_search_backend(dialect_name: str | None = None) -> SearchBackend:
+    """Backend for ``dialect_name``, defaulting to the application engine's dialect."""
+    name = dialect_name or database.engine.dialect.name
+    return _BACKENDS.get(name, LikeSearch())
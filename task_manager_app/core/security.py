@@ -1,48 +1,85 @@
+import hashlib
+import time
+import uuid
 from datetime import datetime, timedelta
-from jose import jwt, JWTError
-from passlib.context import CryptContext
+from jose.exceptions import JWTError
+from sqlalchemy.orm import Session
+from task_manager_app.core.cache import TTLCache
 from task_manager_app.core.config import get_settings
+from task_manager_app.core.hashing import get_pwd_context
+from task_manager_app.core.revocation import revocation_store
 
 settings = get_settings()
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
-# In-memory store for revoked refresh tokens
-revoked_refresh_tokens: set[str] = set()
+def _jwt():
+    # jose.jwt loads its cryptography backend on import (~45 ms), so it is
+    # imported by the first token issued or checked rather than at startup
+    from jose import jwt
+    return jwt
 
-def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+# Access tokens whose signature has already been verified -> subject
+token_cache = TTLCache(settings.token_cache_size, settings.token_cache_ttl_seconds)
+
+def hash_password(password: str) -> str:
+    return get_pwd_context().hash(password)
+
+# Backwards-compatible alias
+get_password_hash = hash_password
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    return get_pwd_context().verify(plain_password, hashed_password)
 
 def create_access_token(sub: str, minutes: int | None = None) -> str:
     exp_minutes = minutes or settings.access_token_expire_minutes
     payload = {"sub": sub, "exp": datetime.utcnow() + timedelta(minutes=exp_minutes)}
-    return jwt.encode(payload, settings.secret_key, algorithm=settings.algorithm)
+    return _jwt().encode(payload, settings.secret_key, algorithm=settings.algorithm)
 
 def decode_token(token: str) -> str:
-    payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
-    return str(payload.get("sub"))
+    sub = token_cache.get(token)
+    if sub is not None:
+        return sub
+    payload = _jwt().decode(token, settings.secret_key, algorithms=[settings.algorithm])
+    sub = str(payload.get("sub"))
+    # never serve a token from cache past its own expiry
+    if payload.get("exp") is not None:
+        token_cache.set(token, sub, ttl_seconds=payload["exp"] - time.time())
+    return sub
 
 def create_refresh_token(sub: str, days: int | None = None) -> str:
     exp_days = days or settings.refresh_token_expire_days
     payload = {
         "sub": sub,
         "type": "refresh",
+        "jti": uuid.uuid4().hex,
         "exp": datetime.utcnow() + timedelta(days=exp_days),
     }
-    return jwt.encode(payload, settings.secret_key, algorithm=settings.algorithm)
+    return _jwt().encode(payload, settings.secret_key, algorithm=settings.algorithm)
 
-def decode_refresh_token(token: str) -> str:
-    payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
+def refresh_token_claims(token: str) -> dict:
+    payload = _jwt().decode(token, settings.secret_key, algorithms=[settings.algorithm])
     if payload.get("type") != "refresh":
         raise JWTError("Invalid token type")
-    return str(payload.get("sub"))
+    # tokens issued before jti was added are identified by their digest
+    payload.setdefault("jti", hashlib.sha256(token.encode()).hexdigest())
+    return payload
 
-def verify_refresh_token(token: str) -> str:
-    if token in revoked_refresh_tokens:
+def decode_refresh_token(token: str) -> str:
+    return str(refresh_token_claims(token).get("sub"))
+
+def verify_refresh_token(token: str, db: Session) -> str:
+    payload = refresh_token_claims(token)
+    if revocation_store.is_revoked(db, payload["jti"]):
         raise JWTError("Token revoked")
-    return decode_refresh_token(token)
+    return str(payload.get("sub"))
+
+def revoke_refresh_token(token: str, db: Session) -> bool:
+    """Revoke ``token``; False if it was already revoked."""
+    payload = refresh_token_claims(token)
+    return revocation_store.revoke(db, payload["jti"], datetime.utcfromtimestamp(payload["exp"]))
 
-def revoke_refresh_token(token: str) -> None:
-    revoked_refresh_tokens.add(token)
+def rotate_refresh_token(token: str, db: Session) -> str:
+    """Verify and revoke ``token`` in one step, so each refresh token works exactly once."""
+    payload = refresh_token_claims(token)
+    if not revocation_store.revoke(db, payload["jti"], datetime.utcfromtimestamp(payload["exp"])):
+        raise JWTError("Token revoked")
+    return str(payload.get("sub"))
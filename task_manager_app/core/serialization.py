@@ -0,0 +1,40 @@
+# task_manager_app/core/serialization.py
+import json
+from datetime import date, datetime
+from typing import Iterable, Sequence
+
+from fastapi import Response
+
+from task_manager_app.core.metrics import span
+
+try:
+    import orjson
+except ImportError:  # optional: the json module produces the same bytes, more slowly
+    orjson = None
+
+
+class JSONBytesResponse(Response):
+    """A body that is already JSON; nothing is validated or encoded again."""
+    media_type = "application/json"
+
+
+def _default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def rows_to_json(rows: Iterable[Sequence], fields: Sequence[str]) -> bytes:
+    """
+    Encode result rows as a JSON array of objects keyed by ``fields``, in order.
+
+    This is the output a ``response_model`` of the matching schema would give
+    for these columns (str enums by value, ISO dates), without building a
+    pydantic model per row. Extra trailing columns in a row are left out.
+    """
+    with span("serialize"):
+        objects = [dict(zip(fields, row)) for row in rows]
+        if orjson is not None:
+            return orjson.dumps(objects)
+        return json.dumps(objects, default=_default, ensure_ascii=False,
+                          separators=(",", ":")).encode()
@@ -0,0 +1,205 @@
+# task_manager_app/core/stats.py
+from collections import defaultdict
+from datetime import date
+from types import SimpleNamespace
+from typing import Iterable
+
+from sqlalchemy import String, cast, delete, event, func, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from task_manager_app.core import database
+from task_manager_app.models.task import Task, Status
+from task_manager_app.models.task_stat import TaskStat, UNASSIGNED
+
+_PENDING_DELTAS = "pending_task_stat_deltas"
+
+# Statuses that count as overdue once past their due date
+OPEN_STATUSES = [s for s in Status if s != Status.completed]
+
+
+def _value(enum_or_str) -> str:
+    return getattr(enum_or_str, "value", enum_or_str)
+
+
+def snapshot(task) -> SimpleNamespace:
+    """The fields of ``task`` the rollup groups by, before it is modified."""
+    return SimpleNamespace(assignee_id=task.assignee_id, status=task.status,
+                           priority=task.priority, progress=task.progress)
+
+
+def record(db: Session, task, sign: int = 1) -> None:
+    """
+    Count ``task`` (anything with assignee_id, status, priority and progress)
+    into (+1) or out of (-1) the rollup. Deltas are written when ``db`` commits,
+    in the same transaction, and dropped if it rolls back. ``db`` may also be an
+    AsyncSession; only its ``info`` is touched here.
+    """
+    delta = _pending(db)[(task.assignee_id or UNASSIGNED, _value(task.status), _value(task.priority))]
+    delta[0] += sign
+    delta[1] += sign * (task.progress or 0)
+
+
+def record_values(db: Session, values: Iterable[dict]) -> None:
+    """``record`` for rows given as INSERT values (dicts), as bulk inserts have them."""
+    deltas = _pending(db)
+    for v in values:
+        delta = deltas[(v["assignee_id"] or UNASSIGNED, _value(v["status"]), _value(v["priority"]))]
+        delta[0] += 1
+        delta[1] += v["progress"] or 0
+
+
+def _pending(db: Session) -> dict:
+    return db.info.setdefault(_PENDING_DELTAS, defaultdict(lambda: [0, 0]))
+
+
+def record_change(db: Session, before, after) -> None:
+    record(db, before, -1)
+    record(db, after, +1)
+
+
+def apply_deltas(db: Session, deltas: dict) -> None:
+    # sorted: concurrent transactions touch shared groups in the same order
+    rows = [
+        {"assignee_id": assignee_id, "status": status, "priority": priority,
+         "task_count": count, "progress_sum": progress}
+        for (assignee_id, status, priority), (count, progress) in sorted(deltas.items())
+        if count or progress
+    ]
+    if not rows:
+        return
+    stmt = database.dialect_insert(db, TaskStat)
+    if stmt is not None:
+        db.execute(stmt.on_conflict_do_update(
+            index_elements=["assignee_id", "status", "priority"],
+            set_={
+                "task_count": TaskStat.task_count + stmt.excluded.task_count,
+                "progress_sum": TaskStat.progress_sum + stmt.excluded.progress_sum,
+            },
+        ), rows)
+        return
+    for row in rows:
+        updated = db.execute(
+            update(TaskStat)
+            .where(TaskStat.assignee_id == row["assignee_id"],
+                   TaskStat.status == row["status"],
+                   TaskStat.priority == row["priority"])
+            .values(task_count=TaskStat.task_count + row["task_count"],
+                    progress_sum=TaskStat.progress_sum + row["progress_sum"])
+        ).rowcount
+        if not updated:
+            db.execute(insert(TaskStat), row)
+
+
+@event.listens_for(Session, "before_commit")
+def _apply_pending(session: Session) -> None:
+    deltas = session.info.pop(_PENDING_DELTAS, None)
+    if deltas:
+        apply_deltas(session, deltas)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending(session: Session) -> None:
+    session.info.pop(_PENDING_DELTAS, None)
+
+
+def rebuild(db: Session) -> None:
+    """Recompute the rollup from ``tasks``, e.g. after writes that bypassed ``record``."""
+    assignee = func.coalesce(Task.assignee_id, UNASSIGNED)
+    status, priority = cast(Task.status, String(32)), cast(Task.priority, String(32))
+    db.execute(delete(TaskStat))
+    db.execute(insert(TaskStat).from_select(
+        ["assignee_id", "status", "priority", "task_count", "progress_sum"],
+        select(assignee, status, priority, func.count(), func.coalesce(func.sum(Task.progress), 0))
+        .group_by(assignee, status, priority),
+    ))
+    db.commit()
+
+
+def backfill(db: Session) -> bool:
+    """
+    ``rebuild`` an empty rollup when ``tasks`` is not empty, as after
+    ``create_all`` added ``task_stats`` to a database that already had tasks
+    (the Alembic revision backfills it itself). Returns whether it rebuilt.
+    """
+    if db.scalar(select(TaskStat.assignee_id).limit(1)) is not None:
+        return False
+    if db.scalar(select(Task.id).limit(1)) is None:
+        return False
+    try:
+        rebuild(db)
+    except IntegrityError:
+        db.rollback()  # another worker starting up got there first
+        return False
+    return True
+
+
+def rollup_groups(db: Session, assignee_id: int | None = None) -> list[tuple]:
+    """(assignee_id, status, priority, count, progress_sum) per non-empty group, from the rollup."""
+    stmt = select(TaskStat.assignee_id, TaskStat.status, TaskStat.priority,
+                  TaskStat.task_count, TaskStat.progress_sum).where(TaskStat.task_count > 0)
+    if assignee_id is not None:
+        stmt = stmt.where(TaskStat.assignee_id == assignee_id)
+    return [tuple(row) for row in db.execute(stmt)]
+
+
+def live_groups(db: Session, assignee_id: int | None = None) -> list[tuple]:
+    """The same groups as ``rollup_groups``, aggregated from ``tasks`` directly."""
+    assignee = func.coalesce(Task.assignee_id, UNASSIGNED)
+    stmt = (select(assignee, Task.status, Task.priority, func.count(), func.sum(Task.progress))
+            .group_by(assignee, Task.status, Task.priority))
+    if assignee_id is not None:
+        stmt = stmt.where(Task.assignee_id == assignee_id)
+    return [(a, _value(s), _value(p), n, total) for a, s, p, n, total in db.execute(stmt)]
+
+
+def overdue_counts(db: Session, today: date, assignee_id: int | None = None) -> dict[int, int]:
+    """Open tasks due before ``today`` per assignee; a range read on ix_tasks_status_due."""
+    assignee = func.coalesce(Task.assignee_id, UNASSIGNED)
+    stmt = (select(assignee, func.count())
+            .where(Task.status.in_(OPEN_STATUSES), Task.due_date < today)
+            .group_by(assignee))
+    if assignee_id is not None:
+        stmt = stmt.where(Task.assignee_id == assignee_id)
+    return dict(db.execute(stmt).all())
+
+
+def summarize(groups: list[tuple], overdue: dict[int, int]) -> dict:
+    """Fold rollup groups into the ``TaskStats`` shape."""
+    def average(total: int, count: int) -> float:
+        return round(total / count, 2) if count else 0.0
+
+    def tally() -> dict:
+        return {"count": 0, "progress": 0, "by_status": defaultdict(int)}
+
+    by_status: dict[str, int] = defaultdict(int)
+    by_priority: dict[str, int] = defaultdict(int)
+    assignees: dict[int, dict] = defaultdict(tally)
+    total = progress = 0
+    out = []
+    for assignee_id, status, priority, count, progress_sum in sorted(groups):
+        total += count
+        progress += progress_sum
+        by_status[status] += count
+        by_priority[priority] += count
+        a = assignees[assignee_id]
+        a["count"] += count
+        a["progress"] += progress_sum
+        a["by_status"][status] += count
+        out.append({"assignee_id": assignee_id or None, "status": status, "priority": priority,
+                    "count": count, "average_progress": average(progress_sum, count)})
+    return {
+        "total": total,
+        "overdue": sum(overdue.values()),
+        "average_progress": average(progress, total),
+        "by_status": dict(by_status),
+        "by_priority": dict(by_priority),
+        "by_assignee": [
+            {"assignee_id": assignee_id or None, "count": a["count"],
+             "overdue": overdue.get(assignee_id, 0),
+             "average_progress": average(a["progress"], a["count"]),
+             "by_status": dict(a["by_status"])}
+            for assignee_id, a in sorted(assignees.items())
+        ],
+        "groups": out,
+    }
@@ -1,3 +1,6 @@
 from task_manager_app.models.user import User, Role
 from task_manager_app.models.task import Task, Priority, Status
-from task_manager_app.models.notification import Notification
+from task_manager_app.models.notification import Notification, NotificationArchive, NotificationKind
+from task_manager_app.models.lease import SchedulerLease
+from task_manager_app.models.revoked_token import RevokedToken
+from task_manager_app.models.task_stat import TaskStat
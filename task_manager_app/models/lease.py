@@ -0,0 +1,11 @@
+from sqlalchemy import Column, String, DateTime
+from task_manager_app.core.database import Base
+
+
+class SchedulerLease(Base):
+    """A named, time-limited lock row used to elect a single background worker."""
+    __tablename__ = "scheduler_leases"
+
+    name = Column(String(64), primary_key=True)
+    holder = Column(String(128), nullable=False)
+    expires_at = Column(DateTime, nullable=False)
@@ -1,18 +1,58 @@
 from __future__ import annotations
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text
+import enum
+
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Enum, Index, text
 from sqlalchemy.orm import relationship
 from task_manager_app.core.database import Base
 
+
+class NotificationKind(str, enum.Enum):
+    due_soon = "due_soon"
+    assigned = "assigned"
+
+
 class Notification(Base):
     __tablename__ = "notifications"
+    __table_args__ = (
+        # Dedupe key for system-generated notifications; NULL kinds never collide
+        Index("uq_notifications_task_user_kind", "task_id", "user_id", "kind", unique=True),
+        # keyset pagination: WHERE user_id = ? ORDER BY id DESC
+        Index("ix_notifications_user_id_id", "user_id", "id"),
+        # unread badge count and mark-all-read: holds only unread rows, so it
+        # stays small however much history the table keeps. read_at (always
+        # NULL here) lets SQLite match "read_at IS NULL" against the index itself
+        Index("ix_notifications_user_unread", "user_id", "read_at",
+              sqlite_where=text("read_at IS NULL"), postgresql_where=text("read_at IS NULL")),
+        # retention: WHERE created_at < cutoff ORDER BY created_at, id
+        Index("ix_notifications_created_at", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), index=True, nullable=False)
     task_id = Column(Integer, ForeignKey("tasks.id"), index=True, nullable=True)
 
+    # Stored as VARCHAR so new kinds don't need a Postgres ALTER TYPE
+    kind = Column(Enum(NotificationKind, native_enum=False, length=32), nullable=True)
     message = Column(Text, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     read_at = Column(DateTime, nullable=True)
 
     user = relationship("User")
+
+
+class NotificationArchive(Base):
+    """
+    Cold storage for old unread notifications moved out of ``notifications`` by
+    the retention job. Write-only: no foreign keys and no secondary indexes.
+    """
+    __tablename__ = "notifications_archive"
+
+    id = Column(Integer, primary_key=True, autoincrement=False)  # the original id
+    user_id = Column(Integer, nullable=False)
+    task_id = Column(Integer, nullable=True)
+    kind = Column(String(32), nullable=True)
+    message = Column(Text, nullable=False)
+    created_at = Column(DateTime, nullable=False)
+    read_at = Column(DateTime, nullable=True)
+    archived_at = Column(DateTime, nullable=False)
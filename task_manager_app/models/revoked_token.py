@@ -0,0 +1,11 @@
+from sqlalchemy import Column, String, DateTime
+from task_manager_app.core.database import Base
+
+
+class RevokedToken(Base):
+    """A refresh token that may no longer be used, kept until the token itself expires."""
+    __tablename__ = "revoked_tokens"
+
+    jti = Column(String(64), primary_key=True)
+    expires_at = Column(DateTime, nullable=False, index=True)
+    revoked_at = Column(DateTime, nullable=False)
@@ -3,7 +3,7 @@ from datetime import datetime, date
 import enum
 
 from sqlalchemy import (
-    Column, Integer, String, Text, Enum, Date, ForeignKey, DateTime
+    Column, Integer, String, Text, Enum, Date, ForeignKey, DateTime, Index, DDL, event
 )
 from sqlalchemy.orm import relationship
 
@@ -26,6 +26,18 @@ class Status(str, enum.Enum):
 
 class Task(Base):
     __tablename__ = "tasks"
+    # Matched to the filter combinations in routers/tasks._apply_filters;
+    # tests/test_query_plans.py asserts each combination is index-backed.
+    __table_args__ = (
+        # due_before / due_after; keyset pagination by (due_date, id)
+        Index("ix_tasks_due_date_id", "due_date", "id"),
+        # a user's own tasks, optionally by status and due range
+        Index("ix_tasks_assignee_status_due", "assignee_id", "status", "due_date"),
+        # status (+ due range), also the reminder / overdue scans
+        Index("ix_tasks_status_due", "status", "due_date"),
+        # priority (+ due range)
+        Index("ix_tasks_priority_due", "priority", "due_date"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
 
@@ -38,8 +50,67 @@ class Task(Base):
 
     due_date = Column(Date, nullable=True)
 
-    assignee_id = Column(Integer, ForeignKey("users.id"), nullable=True, index=True)
+    # indexed via ix_tasks_assignee_status_due
+    assignee_id = Column(Integer, ForeignKey("users.id"), nullable=True)
     assignee = relationship("User")  # simple relationship; no backref for now
 
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    # indexed: the reminder engine reads changes since a watermark
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False, index=True)
+
+
+# Full-text search over title + description (see core/search.py). These objects
+# live outside the ORM metadata, so they are attached to the tasks table's DDL.
+# The Alembic revision "task full-text search" creates the same objects.
+TASK_SEARCH_DDL = {
+    "sqlite": [
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(
+            title, description,
+            content='tasks', content_rowid='id',
+            tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+        )
+        """,
+        # While a writer holds a row here (inside its own transaction, so no one
+        # else ever sees it) the insert trigger stands down and the writer indexes
+        # its rows in one pass; see core/search.deferred_fts_index.
+        """
+        CREATE TABLE IF NOT EXISTS tasks_fts_deferred (id INTEGER PRIMARY KEY)
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS tasks_fts_ai AFTER INSERT ON tasks
+        WHEN NOT EXISTS (SELECT 1 FROM tasks_fts_deferred) BEGIN
+            INSERT INTO tasks_fts(rowid, title, description)
+            VALUES (new.id, new.title, new.description);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS tasks_fts_ad AFTER DELETE ON tasks BEGIN
+            INSERT INTO tasks_fts(tasks_fts, rowid, title, description)
+            VALUES ('delete', old.id, old.title, old.description);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS tasks_fts_au AFTER UPDATE OF title, description ON tasks BEGIN
+            INSERT INTO tasks_fts(tasks_fts, rowid, title, description)
+            VALUES ('delete', old.id, old.title, old.description);
+            INSERT INTO tasks_fts(rowid, title, description)
+            VALUES (new.id, new.title, new.description);
+        END
+        """,
+    ],
+    "postgresql": [
+        """
+        CREATE INDEX IF NOT EXISTS ix_tasks_search ON tasks USING GIN (
+            to_tsvector('simple', coalesce(title, '') || ' ' || coalesce(description, ''))
+        )
+        """,
+    ],
+}
+
+for _dialect, _statements in TASK_SEARCH_DDL.items():
+    for _statement in _statements:
+        event.listen(Task.__table__, "after_create", DDL(_statement).execute_if(dialect=_dialect))
+for _table in ("tasks_fts", "tasks_fts_deferred"):
+    event.listen(Task.__table__, "before_drop",
+                 DDL(f"DROP TABLE IF EXISTS {_table}").execute_if(dialect="sqlite"))
@@ -0,0 +1,19 @@
+from sqlalchemy import Column, Integer, String
+from task_manager_app.core.database import Base
+
+# assignee_id stored for tasks without an assignee (primary key columns can't be NULL)
+UNASSIGNED = 0
+
+
+class TaskStat(Base):
+    """
+    Rollup of ``tasks`` by assignee, status and priority, kept current by
+    ``core.stats`` as tasks are written so dashboards read one row per group.
+    """
+    __tablename__ = "task_stats"
+
+    assignee_id = Column(Integer, primary_key=True, autoincrement=False)
+    status = Column(String(32), primary_key=True)
+    priority = Column(String(32), primary_key=True)
+    task_count = Column(Integer, nullable=False, default=0)
+    progress_sum = Column(Integer, nullable=False, default=0)
@@ -2,53 +2,79 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 from jose import JWTError
 from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from task_manager_app.core.hashing import HasherBusy, password_hasher
 from task_manager_app.core.security import (
-    hash_password,
-    verify_password,
     create_access_token,
     create_refresh_token,
-    verify_refresh_token,
-    revoke_refresh_token,
+    rotate_refresh_token,
 )
 from task_manager_app.models.user import User, Role
 from task_manager_app.schemas.user import UserCreate, Token, TokenRefresh
-from task_manager_app.core.deps import get_db
+from task_manager_app.core.deps import get_async_db
 
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
+# Sent with 503 when the password hashing queue is full
+HASHER_RETRY_AFTER_SECONDS = 1
+
+
+def _hasher_busy() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Too many concurrent sign-ins, retry shortly",
+        headers={"Retry-After": str(HASHER_RETRY_AFTER_SECONDS)},
+    )
+
+
+# bcrypt waits on the hashing pool and queries on the async session, so no
+# request thread is held at any point.
 @router.post("/signup", status_code=201)
-def signup(payload: UserCreate, db: Session = Depends(get_db)):
-    exists = db.scalar(select(User).where(User.email == payload.email))
+async def signup(payload: UserCreate, db: AsyncSession = Depends(get_async_db)):
+    exists = await db.scalar(select(User).where(User.email == payload.email))
     if exists:
         raise HTTPException(status_code=400, detail="Email already registered")
+    try:
+        hashed = await password_hasher.hash(payload.password)
+    except HasherBusy:
+        raise _hasher_busy()
     user = User(
         email=payload.email,
         full_name=payload.full_name,
-        hashed_password=hash_password(payload.password),
+        hashed_password=hashed,
         role=Role.user,
     )
     db.add(user)
-    db.commit()
+    await db.commit()
     return {"message": "user created"}
 
 @router.post("/login", response_model=Token)
-def login(form: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
-    user = db.scalar(select(User).where(User.email == form.username))
-    if not user or not verify_password(form.password, user.hashed_password):
+async def login(form: OAuth2PasswordRequestForm = Depends(),
+                db: AsyncSession = Depends(get_async_db)):
+    user = await db.scalar(select(User).where(User.email == form.username))
+    if not user:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
+    try:
+        valid, new_hash = await password_hasher.verify_and_update(form.password, user.hashed_password)
+    except HasherBusy:
+        raise _hasher_busy()
+    if not valid:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
+    if new_hash:
+        # stored hash used an outdated cost; upgrade it transparently
+        user.hashed_password = new_hash
+        await db.commit()
     access = create_access_token(sub=str(user.id))
     refresh = create_refresh_token(sub=str(user.id))
     return {"access_token": access, "refresh_token": refresh, "token_type": "bearer"}
 
 @router.post("/refresh", response_model=Token)
-def refresh(payload: TokenRefresh):
+async def refresh(payload: TokenRefresh, db: AsyncSession = Depends(get_async_db)):
     try:
-        sub = verify_refresh_token(payload.refresh_token)
+        sub = await db.run_sync(lambda session: rotate_refresh_token(payload.refresh_token, session))
     except JWTError:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token")
-    revoke_refresh_token(payload.refresh_token)
     access = create_access_token(sub=sub)
     new_refresh = create_refresh_token(sub=sub)
     return {"access_token": access, "refresh_token": new_refresh, "token_type": "bearer"}
@@ -1,47 +1,129 @@
-from typing import List, Annotated
+import asyncio
+import json
+from typing import AsyncIterator, List, Annotated, Optional
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy import select, update
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from task_manager_app.core.deps import get_db
+from task_manager_app.core.config import get_settings
+from task_manager_app.core.deps import get_async_db, get_read_db
+from task_manager_app.core.etag import etag_matches, make_etag, not_modified
+from task_manager_app.core.notifications import EVENT_COLUMNS, notification_broker, notification_event
+from task_manager_app.core.serialization import JSONBytesResponse, rows_to_json
+from task_manager_app.core.pagination import NEXT_CURSOR_HEADER, encode_cursor, decode_cursor
 from task_manager_app.models.notification import Notification
 from task_manager_app.models.user import User
 from task_manager_app.routers.users import get_current_user
-from task_manager_app.schemas.notification import NotificationOut  # <-- import BEFORE usage
+from task_manager_app.schemas.notification import (  # <-- import BEFORE usage
+    MarkReadResult,
+    NotificationMarkRead,
+    NotificationOut,
+    UnreadCount,
+)
 
 router = APIRouter(prefix="/notifications", tags=["notifications"])
+settings = get_settings()
 
+NOTIFICATION_FIELDS = list(NotificationOut.model_fields)
 
-@router.get("/", response_model=List[NotificationOut])
-def list_my_notifications(
-    db: Session = Depends(get_db),
+# Reconnect delay suggested to EventSource clients
+SSE_RETRY_MS = 3_000
+# Most missed notifications replayed on reconnect; older ones are left to GET /notifications/
+STREAM_REPLAY_LIMIT = 1_000
+
+
+def _page_etag(count: int, id_sum: int, read_count: int, last_read) -> str:
+    # notifications only change by being read (or removed by retention)
+    return make_etag("notifications", count, id_sum, read_count, last_read)
+
+
+@router.get("/", response_model=List[NotificationOut], response_class=JSONBytesResponse)
+async def list_my_notifications(
+    db: AsyncSession = Depends(get_read_db),
     current: User = Depends(get_current_user),
+    cursor: Annotated[Optional[str], Query(description="Opaque cursor from a previous page's X-Next-Cursor header")] = None,
     limit: Annotated[int, Query(ge=1, le=1000, description="Maximum number of notifications to return")] = 100,
-    offset: Annotated[int, Query(ge=0, description="Number of notifications to skip")] = 0,
+    offset: Annotated[int, Query(ge=0, description="Number of notifications to skip (legacy; prefer cursor)")] = 0,
+    if_none_match: Annotated[Optional[str], Header()] = None,
 ):
-    rows = (
-        db.execute(
-            select(Notification)
-            .where(Notification.user_id == current.id)
-            .order_by(Notification.id.desc())
-            .limit(limit)
-            .offset(offset)
-        )
-        .scalars()
-        .all()
+    if cursor is not None and offset:
+        raise HTTPException(status_code=400, detail="Use either cursor or offset, not both")
+    # plain rows encoded straight to JSON: no ORM objects, no NotificationOut per row
+    stmt = (
+        select(*EVENT_COLUMNS)
+        .where(Notification.user_id == current.id)
+        .order_by(Notification.id.desc())
+        .limit(limit)
+    )
+    if cursor is not None:
+        try:
+            stmt = stmt.where(Notification.id < int(decode_cursor(cursor)["id"]))
+        except (ValueError, KeyError, TypeError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+    if offset:
+        stmt = stmt.offset(offset)
+    if if_none_match:
+        page = stmt.with_only_columns(Notification.id, Notification.read_at).subquery()
+        count, id_sum, read_count, last_read = (await db.execute(select(
+            func.count(), func.sum(page.c.id), func.count(page.c.read_at), func.max(page.c.read_at),
+        ))).one()
+        etag = _page_etag(count, id_sum or 0, read_count, last_read)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+    rows = (await db.execute(stmt)).all()
+    read_at = [n.read_at for n in rows if n.read_at is not None]
+    headers = {"ETag": _page_etag(len(rows), sum(n.id for n in rows), len(read_at),
+                                  max(read_at, default=None))}
+    if len(rows) == limit:
+        headers[NEXT_CURSOR_HEADER] = encode_cursor({"id": rows[-1].id})
+    return JSONBytesResponse(rows_to_json(rows, NOTIFICATION_FIELDS), headers=headers)
+
+
+@router.get("/unread_count", response_model=UnreadCount)
+async def unread_count(
+    db: AsyncSession = Depends(get_read_db),
+    current: User = Depends(get_current_user),
+):
+    # answered from ix_notifications_user_unread alone
+    count = await db.scalar(
+        select(func.count())
+        .select_from(Notification)
+        .where(Notification.user_id == current.id, Notification.read_at.is_(None))
+    )
+    return UnreadCount(unread=count)
+
+
+@router.post("/read", response_model=MarkReadResult)
+async def mark_many_read(
+    payload: NotificationMarkRead,
+    db: AsyncSession = Depends(get_async_db),
+    current: User = Depends(get_current_user),
+):
+    """Mark the listed notifications, or all up to ``up_to_id``, read in one UPDATE."""
+    stmt = (
+        update(Notification)
+        .where(Notification.user_id == current.id, Notification.read_at.is_(None))
+        .values(read_at=datetime.utcnow())
     )
-    return [NotificationOut.model_validate(n) for n in rows]
+    if payload.ids is not None:
+        stmt = stmt.where(Notification.id.in_(payload.ids))
+    else:
+        stmt = stmt.where(Notification.id <= payload.up_to_id)
+    updated = (await db.execute(stmt)).rowcount
+    await db.commit()
+    return MarkReadResult(updated=updated)
 
 
 @router.post("/{notification_id}/read", status_code=204)
-def mark_read(
+async def mark_read(
     notification_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current: User = Depends(get_current_user),
 ):
-    db.execute(
+    await db.execute(
         update(Notification)
         .where(
             Notification.id == notification_id,
@@ -49,5 +131,68 @@ def mark_read(
         )
         .values(read_at=datetime.utcnow())
     )
-    db.commit()
+    await db.commit()
     return None
+
+
+def _sse(message: dict) -> str:
+    return f"id: {message['id']}\nevent: notification\ndata: {json.dumps(message)}\n\n"
+
+
+async def sse_events(subscription, backlog: list[dict], keepalive: float) -> AsyncIterator[str]:
+    """
+    Server-sent events: ``backlog`` first, then live notifications. A client
+    that falls too far behind gets an ``overflow`` event and the stream ends;
+    EventSource reconnects with Last-Event-ID and is replayed from the table.
+    """
+    try:
+        yield f"retry: {SSE_RETRY_MS}\n\n"
+        replayed = 0
+        for message in backlog:
+            yield _sse(message)
+            replayed = message["id"]
+        while True:
+            try:
+                message = await asyncio.wait_for(subscription.get(), keepalive)
+            except asyncio.TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            if message is None:
+                if subscription.overflowed:
+                    yield "event: overflow\ndata: {}\n\n"
+                return
+            if message["id"] <= replayed:
+                continue  # committed while the backlog was read
+            yield _sse(message)
+    finally:
+        subscription.close()
+
+
+@router.get("/stream")
+async def stream_my_notifications(
+    db: AsyncSession = Depends(get_async_db),
+    current: User = Depends(get_current_user),
+    last_event_id: Annotated[Optional[int], Header(description="Id of the last notification received; missed ones are replayed")] = None,
+):
+    # subscribe before reading the backlog so nothing committed in between is lost
+    subscription = notification_broker.subscribe(current.id)
+    backlog: list[dict] = []
+    try:
+        if last_event_id is not None:
+            rows = (await db.execute(
+                select(*EVENT_COLUMNS)
+                .where(Notification.user_id == current.id, Notification.id > last_event_id)
+                .order_by(Notification.id)
+                .limit(STREAM_REPLAY_LIMIT)
+            )).all()
+            backlog = [notification_event(row) for row in rows]
+        # the stream can stay open for hours; don't hold a connection for it
+        await db.close()
+    except BaseException:
+        subscription.close()
+        raise
+    return StreamingResponse(
+        sse_events(subscription, backlog, settings.notification_keepalive_seconds),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -1,16 +1,51 @@
-from datetime import date
-from typing import Optional, List, Annotated
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+import csv
+import io
+from datetime import date, datetime
+from types import SimpleNamespace
+from typing import Any, Dict, Optional, List, Annotated, Literal
+from fastapi import APIRouter, Body, Depends, Header, HTTPException, Query, Response, UploadFile, status
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import select, and_, or_
-from task_manager_app.core.deps import get_db
+from sqlalchemy import delete, func, insert, select, and_, or_
+from task_manager_app.core.deps import get_async_db, get_db, get_read_db
+from task_manager_app.core.etag import etag_matches, make_etag, not_modified
+from task_manager_app.core.importer import import_tasks, iter_records
+from task_manager_app.core.notifications import notify_assigned
+from task_manager_app.core.pagination import NEXT_CURSOR_HEADER, encode_cursor, decode_cursor
+from task_manager_app.core.reminders import reminder_engine
+from task_manager_app.core.search import get_search_backend
+from task_manager_app.core.serialization import JSONBytesResponse, rows_to_json
+from task_manager_app.core import stats
 from task_manager_app.models.task import Task, Priority, Status
 from task_manager_app.models.user import User, Role
-from task_manager_app.schemas.task import TaskCreate, TaskUpdate, TaskOut
+from task_manager_app.schemas.task import (
+    TaskCreate, TaskUpdate, TaskOut, TaskBulkUpdateItem, BulkItemError, BulkResult, ImportResult,
+    TaskStats,
+)
 from task_manager_app.routers.users import get_current_user
 
 router = APIRouter(prefix="/tasks", tags=["tasks"])
 
+# Items accepted by one bulk request, and rows written per transaction
+BULK_MAX_ITEMS = 10_000
+BULK_CHUNK_SIZE = 1_000
+# Rows fetched from the database cursor, and serialized per streamed chunk, by /export
+EXPORT_BATCH_SIZE = 1_000
+EXPORT_FIELDS = ["id", *(f for f in TaskOut.model_fields if f != "id")]
+# Columns GET /tasks/ selects: TaskOut's fields in its order, then what the ETag needs
+LIST_FIELDS = list(TaskOut.model_fields)
+LIST_COLUMNS = [*(getattr(Task, f) for f in LIST_FIELDS), Task.updated_at]
+
+
+def _visible_to(stmt, current: User):
+    # Regular users only see their own tasks
+    if current.role not in (Role.admin, Role.manager):
+        stmt = stmt.where(Task.assignee_id == current.id)
+    return stmt
+
 
 def _apply_filters(stmt, *,
                    status_: Optional[str],
@@ -18,7 +53,8 @@ def _apply_filters(stmt, *,
                    assignee_id: Optional[int],
                    due_before: Optional[date],
                    due_after: Optional[date],
-                   q: Optional[str]):
+                   q: Optional[str],
+                   ranked: bool = False):
     conditions = []
     if status_:
         try:
@@ -38,24 +74,18 @@ def _apply_filters(stmt, *,
     if due_after:
         conditions.append(Task.due_date != None)  # noqa: E711
         conditions.append(Task.due_date >= due_after)
-    if q:
-        like = f"%{q}%"
-        conditions.append(or_(Task.title.ilike(like),
-                              Task.description.ilike(like)))
     if conditions:
         stmt = stmt.where(and_(*conditions))
+    if q:
+        stmt = get_search_backend().apply(stmt, q, ranked=ranked)
     return stmt
 
 
-@router.post("/", response_model=TaskOut, status_code=201)
-def create_task(payload: TaskCreate,
-                db: Session = Depends(get_db),
-                current: User = Depends(get_current_user)):
+def _new_task_values(payload: TaskCreate, current: User) -> dict:
     # Non-admin/manager cannot assign tasks to others
     if payload.assignee_id and current.role not in (Role.admin, Role.manager):
         raise HTTPException(status_code=403, detail="Only managers/admins can assign tasks")
-
-    task = Task(
+    return dict(
         title=payload.title,
         description=payload.description,
         priority=Priority(payload.priority),
@@ -64,15 +94,99 @@ def create_task(payload: TaskCreate,
         due_date=payload.due_date,
         assignee_id=payload.assignee_id or current.id,
     )
+
+
+def _apply_update(task: Task, payload: TaskUpdate, current: User) -> None:
+    # Only admin/manager or the assignee can update
+    if current.role not in (Role.admin, Role.manager) and task.assignee_id != current.id:
+        raise HTTPException(status_code=403, detail="Forbidden")
+
+    # Only admin/manager can reassign
+    if payload.assignee_id is not None and current.role not in (Role.admin, Role.manager):
+        raise HTTPException(status_code=403, detail="Only managers/admins can reassign")
+
+    data = payload.model_dump(exclude_unset=True, exclude={"id"})  # bulk items carry their id
+
+    if "priority" in data:
+        data["priority"] = Priority(data["priority"])
+    if "status" in data:
+        data["status"] = Status(data["status"])
+
+    for k, v in data.items():
+        setattr(task, k, v)
+
+    # Sanity: auto progress adjust on status change
+    if "status" in data:
+        if task.status == Status.completed:
+            task.progress = 100
+        elif task.status == Status.not_started and ("progress" not in data):
+            task.progress = 0
+
+
+@router.post("/", response_model=TaskOut, status_code=201)
+async def create_task(payload: TaskCreate,
+                      db: AsyncSession = Depends(get_async_db),
+                      current: User = Depends(get_current_user)):
+    task = Task(**_new_task_values(payload, current))
     db.add(task)
-    db.commit()
-    db.refresh(task)
+    await db.flush()
+    await db.run_sync(notify_assigned, [task], current.id)
+    stats.record(db, task)
+    await db.commit()
+    await db.refresh(task)
+    reminder_engine.track(task)
     return task
 
 
-@router.get("/", response_model=List[TaskOut])
-def list_tasks(
-    db: Session = Depends(get_db),
+def _apply_sort(stmt, sort: str, cursor: Optional[str]):
+    """Order by the ``sort`` key (always ending in ``id``) and seek past ``cursor``."""
+    if sort == "due_date":
+        stmt = stmt.order_by(Task.due_date.asc().nulls_last(), Task.id.asc())
+    else:
+        stmt = stmt.order_by(Task.id.asc())
+    if cursor is None:
+        return stmt
+
+    try:
+        key = decode_cursor(cursor)
+        if key.get("sort") != sort:
+            raise ValueError("Cursor does not match sort")
+        last_id = int(key["id"])
+        last_due = date.fromisoformat(key["due_date"]) if key.get("due_date") else None
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    if sort == "due_date":
+        if last_due is None:
+            # already into the NULLS LAST tail
+            return stmt.where(Task.due_date == None, Task.id > last_id)  # noqa: E711
+        return stmt.where(or_(
+            Task.due_date > last_due,
+            and_(Task.due_date == last_due, Task.id > last_id),
+            Task.due_date == None,  # noqa: E711
+        ))
+    return stmt.where(Task.id > last_id)
+
+
+def _next_cursor(last: Task, sort: str) -> str:
+    key = {"sort": sort, "id": last.id}
+    if sort == "due_date":
+        key["due_date"] = last.due_date.isoformat() if last.due_date else None
+    return encode_cursor(key)
+
+
+def _task_etag(task_id: int, updated_at) -> str:
+    return make_etag("task", task_id, updated_at)
+
+
+def _page_etag(count: int, id_sum: int, last_updated) -> str:
+    # the same ids, none updated since: the same page
+    return make_etag("tasks", count, id_sum, last_updated)
+
+
+@router.get("/", response_model=List[TaskOut], response_class=JSONBytesResponse)
+async def list_tasks(
+    db: AsyncSession = Depends(get_read_db),
     current: User = Depends(get_current_user),
     status_: Annotated[Optional[str], Query(alias="status")] = None,
     priority: Optional[str] = None,
@@ -80,80 +194,363 @@ def list_tasks(
     due_before: Optional[date] = None,
     due_after: Optional[date] = None,
     q: Optional[str] = None,
+    sort: Annotated[Optional[Literal["id", "due_date", "relevance"]],
+                    Query(description="Sort key, ties broken by id; defaults to relevance with q, else id")] = None,
+    cursor: Annotated[Optional[str], Query(description="Opaque cursor from a previous page's X-Next-Cursor header")] = None,
     limit: Annotated[int, Query(ge=1, le=1000, description="Maximum number of tasks to return")] = 100,
-    offset: Annotated[int, Query(ge=0, description="Number of tasks to skip")] = 0,
+    offset: Annotated[int, Query(ge=0, description="Number of tasks to skip (legacy; prefer cursor)")] = 0,
+    if_none_match: Annotated[Optional[str], Header()] = None,
 ):
-    stmt = select(Task)
-    # Regular users only see their own tasks
+    if cursor is not None and offset:
+        raise HTTPException(status_code=400, detail="Use either cursor or offset, not both")
+    sort = sort or ("relevance" if q else "id")
+    if sort == "relevance":
+        if not q:
+            raise HTTPException(status_code=400, detail="Relevance sort requires q")
+        if cursor is not None:
+            raise HTTPException(status_code=400, detail="Relevance sort does not support cursors")
+    # plain rows encoded straight to JSON: no ORM objects, no TaskOut per row
+    stmt = _visible_to(select(*LIST_COLUMNS), current)
+    stmt = _apply_filters(stmt, status_=status_, priority=priority,
+                          assignee_id=assignee_id, due_before=due_before,
+                          due_after=due_after, q=q, ranked=sort == "relevance")
+    if sort == "relevance":
+        rank = get_search_backend().rank(q)
+        stmt = stmt.order_by(*([rank] if rank is not None else []), Task.id.asc())
+    else:
+        stmt = _apply_sort(stmt, sort, cursor)
+    stmt = stmt.limit(limit)
+    if offset:
+        stmt = stmt.offset(offset)
+    if if_none_match:
+        # fingerprint the page from (id, updated_at) alone before loading any rows
+        page = stmt.with_only_columns(Task.id, Task.updated_at).subquery()
+        count, id_sum, last_updated = (await db.execute(
+            select(func.count(), func.sum(page.c.id), func.max(page.c.updated_at)))).one()
+        etag = _page_etag(count, id_sum or 0, last_updated)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+    rows = (await db.execute(stmt)).all()
+    headers = {"ETag": _page_etag(
+        len(rows), sum(r.id for r in rows), max((r.updated_at for r in rows), default=None))}
+    # Any full page can be continued by keyset, however it was fetched
+    if sort != "relevance" and len(rows) == limit:
+        headers[NEXT_CURSOR_HEADER] = _next_cursor(rows[-1], sort)
+    return JSONBytesResponse(rows_to_json(rows, LIST_FIELDS), headers=headers)
+
+
+# --- Export ------------------------------------------------------------------
+
+async def _export_rows(db: AsyncSession, stmt):
+    """Yield ``TaskOut`` models, holding at most one batch of rows at a time."""
+    result = await db.stream(stmt.execution_options(yield_per=EXPORT_BATCH_SIZE))
+    async for batch in result.partitions():
+        yield [TaskOut.model_validate(row) for row in batch]
+
+
+async def _ndjson_chunks(batches):
+    async for batch in batches:
+        yield "".join(task.model_dump_json() + "\n" for task in batch)
+
+
+async def _csv_chunks(batches):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_FIELDS)
+    async for batch in batches:
+        writer.writerows([getattr(task, f) for f in EXPORT_FIELDS] for task in batch)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()  # header only: no rows matched
+
+
+@router.get("/stats", response_model=TaskStats)
+async def task_stats(
+    db: AsyncSession = Depends(get_read_db),
+    current: User = Depends(get_current_user),
+    assignee_id: Optional[int] = None,
+    source: Annotated[Literal["rollup", "live"], Query(
+        description="rollup: the maintained task_stats table; live: GROUP BY over tasks")] = "rollup",
+):
+    # Regular users only ever see their own tasks
     if current.role not in (Role.admin, Role.manager):
-        stmt = stmt.where(Task.assignee_id == current.id)
+        assignee_id = current.id
+    groups = await db.run_sync(stats.rollup_groups if source == "rollup" else stats.live_groups,
+                               assignee_id)
+    overdue = await db.run_sync(stats.overdue_counts, datetime.utcnow().date(), assignee_id)
+    return stats.summarize(groups, overdue)
+
+
+@router.get("/export", response_class=StreamingResponse,
+            responses={200: {"content": {"application/x-ndjson": {}, "text/csv": {}}}})
+async def export_tasks(
+    db: AsyncSession = Depends(get_read_db),
+    current: User = Depends(get_current_user),
+    format: Literal["ndjson", "csv"] = "ndjson",
+    status_: Annotated[Optional[str], Query(alias="status")] = None,
+    priority: Optional[str] = None,
+    assignee_id: Optional[int] = None,
+    due_before: Optional[date] = None,
+    due_after: Optional[date] = None,
+    q: Optional[str] = None,
+):
+    """
+    Stream every visible task matching the ``GET /tasks/`` filters, ordered by id.
+
+    Rows are read through a server-side cursor (``yield_per``) and written out a
+    batch at a time, so memory stays flat however many tasks match.
+    """
+    columns = [getattr(Task, f) for f in EXPORT_FIELDS]
+    stmt = _visible_to(select(*columns), current)
     stmt = _apply_filters(stmt, status_=status_, priority=priority,
                           assignee_id=assignee_id, due_before=due_before,
                           due_after=due_after, q=q)
-    stmt = stmt.limit(limit).offset(offset)
-    return db.execute(stmt).scalars().all()
+    stmt = stmt.order_by(Task.id.asc())
 
+    batches = _export_rows(db, stmt)
+    if format == "csv":
+        body, media_type = _csv_chunks(batches), "text/csv"
+    else:
+        body, media_type = _ndjson_chunks(batches), "application/x-ndjson"
+    return StreamingResponse(body, media_type=media_type, headers={
+        "Content-Disposition": f'attachment; filename="tasks.{format}"',
+    })
 
-@router.get("/{task_id}", response_model=TaskOut)
-def get_task(task_id: int,
-             db: Session = Depends(get_db),
-             current: User = Depends(get_current_user)):
-    task = db.get(Task, task_id)
-    if not task:
-        raise HTTPException(status_code=404, detail="Not found")
-    if current.role not in (Role.admin, Role.manager) and task.assignee_id != current.id:
-        raise HTTPException(status_code=403, detail="Forbidden")
-    return task
 
+@router.post("/import", response_model=ImportResult)
+def import_tasks_file(
+    file: UploadFile,
+    db: Session = Depends(get_db),
+    current: User = Depends(get_current_user),
+    format: Annotated[Optional[Literal["ndjson", "csv"]],
+                      Query(description="Defaults from the file extension, else ndjson")] = None,
+    start_row: Annotated[int, Query(ge=0, description="Resume from a previous import's checkpoint")] = 0,
+):
+    """
+    Import an NDJSON or CSV file of ``TaskCreate`` rows (e.g. a ``/tasks/export``).
 
-@router.patch("/{task_id}", response_model=TaskOut)
-def update_task(task_id: int, payload: TaskUpdate,
-                db: Session = Depends(get_db),
-                current: User = Depends(get_current_user)):
-    task = db.get(Task, task_id)
-    if not task:
-        raise HTTPException(status_code=404, detail="Not found")
+    The upload is parsed a row at a time and inserted in large batches, each
+    committed on its own. Bad rows are reported and skipped; if the request dies
+    midway, re-upload with ``start_row`` set to the last ``checkpoint``.
 
-    # Only admin/manager or the assignee can update
-    if current.role not in (Role.admin, Role.manager) and task.assignee_id != current.id:
-        raise HTTPException(status_code=403, detail="Forbidden")
+    Parsing and validating every row is CPU-bound, so unlike the rest of this
+    router the import runs on the threadpool with a sync session.
+    """
+    if format is None:
+        format = "csv" if (file.filename or "").lower().endswith(".csv") else "ndjson"
+    return import_tasks(db, iter_records(file.file, format), current, start_row=start_row)
 
-    # Only admin/manager can reassign
-    if payload.assignee_id is not None and current.role not in (Role.admin, Role.manager):
-        raise HTTPException(status_code=403, detail="Only managers/admins can reassign")
 
-    data = payload.model_dump(exclude_unset=True)
+# --- Bulk endpoints ----------------------------------------------------------
+# Declared before the /{task_id} routes so "bulk" is not parsed as an id.
+# Each item is validated and permission-checked on its own; a bad item is
+# reported in ``errors`` and never fails the rest. Writes happen in
+# transactions of BULK_CHUNK_SIZE rows; if the database rejects a chunk, all of
+# its items are reported as failed and the remaining chunks still run.
 
-    if "priority" in data:
-        data["priority"] = Priority(data["priority"])
-    if "status" in data:
-        data["status"] = Status(data["status"])
+BulkItems = Annotated[List[Dict[str, Any]], Body(min_length=1, max_length=BULK_MAX_ITEMS)]
+BulkIds = Annotated[List[int], Body(min_length=1, max_length=BULK_MAX_ITEMS)]
 
-    for k, v in data.items():
-        setattr(task, k, v)
 
-    # Sanity: auto progress adjust on status change
-    if "status" in data:
-        if task.status == Status.completed:
-            task.progress = 100
-        elif task.status == Status.not_started and ("progress" not in data):
-            task.progress = 0
+def _item_error(index: int, exc: Exception, task_id: Optional[int] = None) -> BulkItemError:
+    if isinstance(exc, ValidationError):
+        return BulkItemError(index=index, id=task_id, status_code=422,
+                             detail=exc.errors(include_url=False, include_context=False))
+    if isinstance(exc, HTTPException):
+        return BulkItemError(index=index, id=task_id, status_code=exc.status_code, detail=exc.detail)
+    return BulkItemError(index=index, id=task_id, status_code=409, detail="Rejected by the database")
+
+
+def _chunks(items: list, size: Optional[int] = None):
+    size = size or BULK_CHUNK_SIZE
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
 
+def _reminder_snapshot(task: Task) -> SimpleNamespace:
+    # what ReminderEngine.track reads, captured before commit expires the object
+    return SimpleNamespace(id=task.id, due_date=task.due_date,
+                           assignee_id=task.assignee_id, status=task.status)
+
+
+@router.post("/bulk", response_model=BulkResult)
+async def bulk_create_tasks(items: BulkItems,
+                            db: AsyncSession = Depends(get_async_db),
+                            current: User = Depends(get_current_user)):
+    result = BulkResult()
+    valid: list[tuple[int, dict]] = []
+    for index, item in enumerate(items):
+        try:
+            valid.append((index, _new_task_values(TaskCreate.model_validate(item), current)))
+        except (ValidationError, HTTPException) as exc:
+            result.errors.append(_item_error(index, exc))
+
+    # One multi-row INSERT ... RETURNING per chunk. RETURNING rows may come back
+    # in any order, but the ids of one statement are allocated in VALUES order,
+    # so sorting by id lines them up with the request. (sort_by_parameter_order
+    # would do the same but makes SQLite fall back to one INSERT per row.)
+    stmt = insert(Task).returning(Task.id, Task.title, Task.due_date, Task.assignee_id, Task.status,
+                                  Task.priority, Task.progress)
+    for chunk in _chunks(valid):
+        try:
+            rows = (await db.execute(stmt, [values for _, values in chunk])).all()
+            await db.run_sync(notify_assigned, rows, current.id)
+            for row in rows:
+                stats.record(db, row)
+            await db.commit()
+        except SQLAlchemyError as exc:
+            await db.rollback()
+            result.errors.extend(_item_error(index, exc) for index, _ in chunk)
+            continue
+        for row in sorted(rows, key=lambda r: r.id):
+            result.ids.append(row.id)
+            reminder_engine.track(row)
+    result.errors.sort(key=lambda e: e.index)
+    return result
+
+
+@router.patch("/bulk", response_model=BulkResult)
+async def bulk_update_tasks(items: BulkItems,
+                            db: AsyncSession = Depends(get_async_db),
+                            current: User = Depends(get_current_user)):
+    result = BulkResult()
+    valid: list[tuple[int, TaskBulkUpdateItem]] = []
+    for index, item in enumerate(items):
+        try:
+            valid.append((index, TaskBulkUpdateItem.model_validate(item)))
+        except ValidationError as exc:
+            task_id = item.get("id")
+            result.errors.append(_item_error(index, exc, task_id if isinstance(task_id, int) else None))
+
+    for chunk in _chunks(valid):
+        tasks = {t.id: t for t in await db.scalars(
+            select(Task).where(Task.id.in_({payload.id for _, payload in chunk})))}
+        applied: list[tuple[int, Task]] = []
+        reassigned: list[Task] = []
+        for index, payload in chunk:
+            task = tasks.get(payload.id)
+            try:
+                if task is None:
+                    raise HTTPException(status_code=404, detail="Not found")
+                before = stats.snapshot(task)
+                _apply_update(task, payload, current)
+            except HTTPException as exc:
+                result.errors.append(_item_error(index, exc, payload.id))
+                continue
+            applied.append((index, task))
+            stats.record_change(db, before, task)
+            if task.assignee_id != before.assignee_id:
+                reassigned.append(task)
+        try:
+            await db.flush()  # UPDATEs with the same columns go out as one executemany
+            await db.run_sync(notify_assigned, reassigned, current.id)
+            snapshots = [_reminder_snapshot(task) for _, task in applied]
+            await db.commit()
+        except SQLAlchemyError as exc:
+            await db.rollback()
+            result.errors.extend(_item_error(index, exc, task.id) for index, task in applied)
+            continue
+        for snapshot in snapshots:
+            result.ids.append(snapshot.id)
+            reminder_engine.track(snapshot)
+    result.errors.sort(key=lambda e: e.index)
+    return result
+
+
+@router.post("/bulk/delete", response_model=BulkResult)
+async def bulk_delete_tasks(ids: BulkIds,
+                            db: AsyncSession = Depends(get_async_db),
+                            current: User = Depends(get_current_user)):
+    result = BulkResult()
+    indexed = list(enumerate(ids))
+    for chunk in _chunks(indexed):
+        found = {row.id: row for row in await db.execute(
+            select(Task.id, Task.assignee_id, Task.status, Task.priority, Task.progress)
+            .where(Task.id.in_({task_id for _, task_id in chunk})))}
+        allowed: list[tuple[int, int]] = []
+        for index, task_id in chunk:
+            if task_id not in found:
+                result.errors.append(_item_error(index, HTTPException(404, "Not found"), task_id))
+            elif current.role not in (Role.admin, Role.manager) and found[task_id].assignee_id != current.id:
+                result.errors.append(_item_error(index, HTTPException(403, "Forbidden"), task_id))
+            else:
+                allowed.append((index, task_id))
+                # a repeated id is deleted once, then reported missing
+                stats.record(db, found.pop(task_id), -1)
+        try:
+            await db.execute(delete(Task).where(Task.id.in_([task_id for _, task_id in allowed])))
+            await db.commit()
+        except SQLAlchemyError as exc:
+            await db.rollback()
+            result.errors.extend(_item_error(index, exc, task_id) for index, task_id in allowed)
+            continue
+        for _, task_id in allowed:
+            result.ids.append(task_id)
+            reminder_engine.discard(task_id)
+    result.errors.sort(key=lambda e: e.index)
+    return result
+
+
+@router.get("/{task_id}", response_model=TaskOut)
+async def get_task(task_id: int,
+                   response: Response,
+                   db: AsyncSession = Depends(get_read_db),
+                   current: User = Depends(get_current_user),
+                   if_none_match: Annotated[Optional[str], Header()] = None):
+    if if_none_match:
+        # a conditional GET only needs what the permission check and ETag use
+        row = (await db.execute(
+            select(Task.assignee_id, Task.updated_at).where(Task.id == task_id))).first()
+    else:
+        row = task = await db.get(Task, task_id)
+    if not row:
+        raise HTTPException(status_code=404, detail="Not found")
+    if current.role not in (Role.admin, Role.manager) and row.assignee_id != current.id:
+        raise HTTPException(status_code=403, detail="Forbidden")
+    etag = _task_etag(task_id, row.updated_at)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    if if_none_match:
+        task = await db.get(Task, task_id)
+        if not task:
+            raise HTTPException(status_code=404, detail="Not found")
+    response.headers["ETag"] = _task_etag(task_id, task.updated_at)
+    return task
+
+
+@router.patch("/{task_id}", response_model=TaskOut)
+async def update_task(task_id: int, payload: TaskUpdate,
+                      db: AsyncSession = Depends(get_async_db),
+                      current: User = Depends(get_current_user)):
+    task = await db.get(Task, task_id)
+    if not task:
+        raise HTTPException(status_code=404, detail="Not found")
+    before = stats.snapshot(task)
+    _apply_update(task, payload, current)
     db.add(task)
-    db.commit()
-    db.refresh(task)
+    if task.assignee_id != before.assignee_id:
+        await db.flush()
+        await db.run_sync(notify_assigned, [task], current.id)
+    stats.record_change(db, before, task)
+    await db.commit()
+    await db.refresh(task)
+    reminder_engine.track(task)
     return task
 
 
 @router.delete("/{task_id}", status_code=204)
-def delete_task(task_id: int,
-                db: Session = Depends(get_db),
-                current: User = Depends(get_current_user)):
-    task = db.get(Task, task_id)
+async def delete_task(task_id: int,
+                      db: AsyncSession = Depends(get_async_db),
+                      current: User = Depends(get_current_user)):
+    task = await db.get(Task, task_id)
     if not task:
         raise HTTPException(status_code=404, detail="Not found")
     if current.role not in (Role.admin, Role.manager) and task.assignee_id != current.id:
         raise HTTPException(status_code=403, detail="Forbidden")
-    db.delete(task)
-    db.commit()
+    await db.delete(task)
+    stats.record(db, task, -1)
+    await db.commit()
+    reminder_engine.discard(task_id)
     return None
@@ -1,7 +1,15 @@
+from dataclasses import dataclass
+from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
-from task_manager_app.core.deps import get_db
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, object_session
+from task_manager_app.core.cache import TTLCache
+from task_manager_app.core.config import get_settings
+from task_manager_app.core import database
+from task_manager_app.core.deps import get_db, get_read_db
+from task_manager_app.core.metrics import span
 from task_manager_app.core.security import decode_token
 from task_manager_app.models.user import User, Role
 from task_manager_app.schemas.user import UserOut
@@ -9,25 +17,88 @@ from task_manager_app.schemas.user import UserOut
 router = APIRouter(prefix="/users", tags=["users"])
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
-def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> User:
+
+@dataclass(frozen=True)
+class CurrentUser:
+    """Detached snapshot of the authenticated user, safe to share across requests."""
+    id: int
+    email: str
+    full_name: Optional[str]
+    role: Role
+
+    @classmethod
+    def from_user(cls, user: User) -> "CurrentUser":
+        return cls(id=user.id, email=user.email, full_name=user.full_name, role=user.role)
+
+
+_settings = get_settings()
+user_cache = TTLCache(_settings.user_cache_size, _settings.user_cache_ttl_seconds)
+
+
+# Session.info key: ids of users changed in the session's open transaction
+_CHANGED_USERS = "changed_user_ids"
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _note_changed_user(mapper, connection, target: User) -> None:
+    # Role changes and deletions must not be served from cache. Evicting now
+    # would let a request reading the old row before the commit cache it
+    # again, so the eviction waits for the commit.
+    session = object_session(target)
+    if session is None:
+        user_cache.pop(target.id)
+        return
+    session.info.setdefault(_CHANGED_USERS, set()).add(target.id)
+
+
+@event.listens_for(Session, "after_commit")
+def _evict_changed_users(session: Session) -> None:
+    for user_id in session.info.pop(_CHANGED_USERS, ()):
+        user_cache.pop(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_changed_users(session: Session) -> None:
+    session.info.pop(_CHANGED_USERS, None)
+
+
+async def get_current_user(token: str = Depends(oauth2_scheme),
+                           db: AsyncSession = Depends(get_read_db)) -> CurrentUser:
     try:
-        user_id = int(decode_token(token))
+        with span("auth.token"):
+            user_id = int(decode_token(token))
     except Exception:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
-    user = db.get(User, user_id)
-    if not user:
-        raise HTTPException(status_code=401, detail="User not found")
-    return user
+    with span("auth.user"):
+        current = user_cache.get(user_id)
+        if current is not None:
+            return current
+        try:
+            user = await db.get(User, user_id)
+            if not user:
+                # db may be a replica that doesn't have the account yet (just signed up)
+                async with database.AsyncSessionLocal() as primary:
+                    user = await primary.get(User, user_id)
+            if not user:
+                raise HTTPException(status_code=401, detail="User not found")
+            current = CurrentUser.from_user(user)
+        finally:
+            # hand the connection back now rather than when the request ends,
+            # which for a notification stream can be hours away
+            await db.close()
+        user_cache.set(user_id, current)
+        return current
 
 def require_roles(*allowed: Role):
-    def guard(user: User = Depends(get_current_user)):
+    async def guard(user: CurrentUser = Depends(get_current_user)):
         if user.role not in allowed:
             raise HTTPException(status_code=403, detail="Forbidden")
         return user
     return guard
 
 @router.get("/me", response_model=UserOut)
-def me(current: User = Depends(get_current_user)):
+def me(current: CurrentUser = Depends(get_current_user)):
     return current
 
 @router.get("/{user_id}", response_model=UserOut, dependencies=[Depends(require_roles(Role.admin, Role.manager))])
@@ -1,13 +1,34 @@
 from datetime import datetime
-from pydantic import BaseModel, ConfigDict
-from typing import Optional
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+from typing import List, Optional
 
 class NotificationOut(BaseModel):
     id: int
     user_id: int
     task_id: Optional[int]
+    kind: Optional[str] = None
     message: str
     created_at: datetime
     read_at: Optional[datetime] = None
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class UnreadCount(BaseModel):
+    unread: int
+
+
+class NotificationMarkRead(BaseModel):
+    # either the listed ids, or every notification with id <= up_to_id
+    ids: Optional[List[int]] = Field(None, min_length=1, max_length=1000)
+    up_to_id: Optional[int] = None
+
+    @model_validator(mode="after")
+    def one_selector(self):
+        if (self.ids is None) == (self.up_to_id is None):
+            raise ValueError("Provide exactly one of ids or up_to_id")
+        return self
+
+
+class MarkReadResult(BaseModel):
+    updated: int
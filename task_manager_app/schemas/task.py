@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field, ConfigDict
-from typing import Optional, Literal
+from typing import Any, Dict, List, Optional, Literal
 from datetime import date
 
 PriorityLiteral = Literal["low", "medium", "high", "critical"]
@@ -34,3 +34,64 @@ class TaskUpdate(BaseModel):
 class TaskOut(TaskBase):
     id: int
     model_config = ConfigDict(from_attributes=True)
+
+
+class TaskBulkUpdateItem(TaskUpdate):
+    id: int
+
+
+class BulkItemError(BaseModel):
+    index: int  # position in the request body
+    id: Optional[int] = None
+    status_code: int
+    detail: Any
+
+
+class BulkResult(BaseModel):
+    # ids of the tasks created / updated / deleted, in request order
+    ids: List[int] = []
+    errors: List[BulkItemError] = []
+
+
+class ImportRowError(BaseModel):
+    row: int  # 0-based data row in the uploaded file
+    detail: Any
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ImportResult(BaseModel):
+    rows: int
+    inserted: int
+    # rows committed so far; pass back as start_row to resume an interrupted import
+    checkpoint: int
+    error_count: int
+    errors: List[ImportRowError] = []
+    model_config = ConfigDict(from_attributes=True)
+
+
+class TaskStatGroup(BaseModel):
+    assignee_id: Optional[int] = None
+    status: StatusLiteral
+    priority: PriorityLiteral
+    count: int
+    average_progress: float
+
+
+class AssigneeStats(BaseModel):
+    assignee_id: Optional[int] = None
+    count: int
+    overdue: int
+    average_progress: float
+    by_status: Dict[StatusLiteral, int]
+
+
+class TaskStats(BaseModel):
+    total: int
+    # open tasks past their due date
+    overdue: int
+    average_progress: float
+    by_status: Dict[StatusLiteral, int]
+    by_priority: Dict[PriorityLiteral, int]
+    by_assignee: List[AssigneeStats]
+    # one entry per (assignee, status, priority) with at least one task
+    groups: List[TaskStatGroup]
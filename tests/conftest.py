@@ -1,44 +1,72 @@
+import atexit
 import os
+import shutil
 import sys
+import tempfile
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool
 
 from task_manager_app.core import database
-from task_manager_app.core.database import Base, get_db
+from task_manager_app.core.database import Base, async_url, make_engine
+from task_manager_app.core.deps import get_db
+from task_manager_app.core.hashing import password_hasher
+from task_manager_app.core.revocation import revocation_store
+from task_manager_app.core.security import token_cache
 from task_manager_app.routers import auth, users, tasks, notifications
 
-# Set up in-memory SQLite database
-engine = create_engine(
-    "sqlite://",
-    connect_args={"check_same_thread": False},
-    poolclass=StaticPool,
-)
+# One SQLite file shared by the sync engine (tests, background jobs) and the
+# async one (request handlers); an in-memory database can't be opened twice
+_db_dir = tempfile.mkdtemp(prefix="task-manager-tests-")
+atexit.register(shutil.rmtree, _db_dir, ignore_errors=True)
+DATABASE_URL = f"sqlite:///{os.path.join(_db_dir, 'test.db')}"
+
+engine = make_engine(DATABASE_URL)
+# A connection per checkout: each TestClient runs its own event loop
+async_engine = create_async_engine(async_url(DATABASE_URL), poolclass=NullPool)
 TestingSessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+TestingAsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False,
+                                              expire_on_commit=False)
 
 # Override the application's database with the testing one
 
 database.engine = engine
 database.SessionLocal = TestingSessionLocal
+database.async_engine = async_engine
+database.AsyncSessionLocal = TestingAsyncSessionLocal
 Base.metadata.create_all(bind=engine)
 
+# Hash on a thread rather than spawning worker processes for every test run
+password_hasher.workers = 0
+
+
+@pytest.fixture(autouse=True)
+def clear_auth_caches():
+    # cached users, tokens and revocations would outlive the rows db_session deletes
+    yield
+    users.user_cache.clear()
+    token_cache.clear()
+    revocation_store.clear()
+
 
 @pytest.fixture
 def db_session():
-    connection = engine.connect()
-    transaction = connection.begin()
-    session = TestingSessionLocal(bind=connection)
+    session = TestingSessionLocal()
     try:
         yield session
     finally:
         session.close()
-        transaction.rollback()
-        connection.close()
+        # everything the test committed, through either engine, goes
+        with engine.begin() as conn:
+            for table in reversed(Base.metadata.sorted_tables):
+                conn.execute(table.delete())
+            conn.execute(text("DELETE FROM tasks_fts_deferred"))
 
 
 @pytest.fixture
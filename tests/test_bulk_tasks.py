@@ -0,0 +1,105 @@
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from task_manager_app.core import database
+from task_manager_app.models.task import Task, Status
+from task_manager_app.models.user import User, Role
+from task_manager_app.routers import tasks as tasks_router
+
+
+def auth_headers(client: TestClient):
+    payload = {
+        "email": "user@example.com",
+        "full_name": "Test User",
+        "password": "secret",
+    }
+    client.post("/auth/signup", json=payload)
+    res = client.post(
+        "/auth/login",
+        data={"username": payload["email"], "password": payload["password"]},
+    )
+    token = res.json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_bulk_create_reports_per_item_errors(client: TestClient, db_session):
+    headers = auth_headers(client)
+    items = [
+        {"title": "first", "due_date": "2026-03-01"},
+        {"title": ""},                           # fails validation
+        {"title": "assigned", "assignee_id": 99},  # regular users cannot assign
+        {"title": "last", "status": "completed"},
+    ]
+    res = client.post("/tasks/bulk", json=items, headers=headers)
+    assert res.status_code == 200
+    body = res.json()
+    assert len(body["ids"]) == 2
+    assert [(e["index"], e["status_code"]) for e in body["errors"]] == [(1, 422), (2, 403)]
+
+    titles = {t.id: t.title for t in db_session.query(Task)}
+    assert [titles[i] for i in body["ids"]] == ["first", "last"]
+
+
+def test_bulk_create_writes_in_chunks(client: TestClient, db_session, monkeypatch):
+    headers = auth_headers(client)
+    monkeypatch.setattr(tasks_router, "BULK_CHUNK_SIZE", 10)
+    inserts = []
+    listener = lambda conn, cursor, stmt, *args: inserts.append(stmt) if stmt.startswith("INSERT INTO tasks") else None  # noqa: E731
+    event.listen(database.async_engine.sync_engine, "before_cursor_execute", listener)
+    try:
+        res = client.post("/tasks/bulk", json=[{"title": f"t{i}"} for i in range(25)],
+                          headers=headers)
+    finally:
+        event.remove(database.async_engine.sync_engine, "before_cursor_execute", listener)
+    ids = res.json()["ids"]
+    assert len(ids) == 25 and ids == sorted(ids)
+    assert len(inserts) == 3  # one multi-row INSERT per chunk, not one per task
+
+
+def test_bulk_update_applies_role_checks(client: TestClient, db_session):
+    headers = auth_headers(client)
+    me = db_session.query(User).filter_by(email="user@example.com").one()
+    other = User(email="other@example.com", hashed_password="x", role=Role.user)
+    db_session.add(other)
+    db_session.commit()
+    mine = Task(title="mine", assignee_id=me.id)
+    theirs = Task(title="theirs", assignee_id=other.id)
+    db_session.add_all([mine, theirs])
+    db_session.commit()
+
+    res = client.patch("/tasks/bulk", json=[
+        {"id": mine.id, "status": "completed"},
+        {"id": theirs.id, "title": "stolen"},
+        {"id": 10_000, "title": "missing"},
+        {"id": mine.id, "assignee_id": other.id},
+        {"title": "no id"},
+    ], headers=headers)
+    assert res.status_code == 200
+    body = res.json()
+    assert body["ids"] == [mine.id]
+    assert [(e["index"], e["status_code"]) for e in body["errors"]] == [
+        (1, 403), (2, 404), (3, 403), (4, 422)]
+
+    db_session.expire_all()
+    assert db_session.get(Task, mine.id).status == Status.completed
+    assert db_session.get(Task, mine.id).progress == 100
+    assert db_session.get(Task, theirs.id).title == "theirs"
+
+
+def test_bulk_delete(client: TestClient, db_session):
+    headers = auth_headers(client)
+    ids = client.post("/tasks/bulk", json=[{"title": "a"}, {"title": "b"}],
+                      headers=headers).json()["ids"]
+
+    res = client.post("/tasks/bulk/delete", json=[ids[0], ids[0], ids[1], 10_000],
+                      headers=headers)
+    assert res.status_code == 200
+    body = res.json()
+    assert body["ids"] == ids
+    assert [(e["index"], e["status_code"]) for e in body["errors"]] == [(1, 404), (3, 404)]
+    assert db_session.query(Task).count() == 0
+
+
+def test_bulk_request_size_is_limited(client: TestClient):
+    headers = auth_headers(client)
+    assert client.post("/tasks/bulk", json=[], headers=headers).status_code == 422
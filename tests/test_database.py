@@ -0,0 +1,68 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import func, insert, select, text
+from sqlalchemy.orm import sessionmaker
+
+from task_manager_app.core.config import Settings
+from task_manager_app.core.database import Base, async_url, make_async_engine, make_engine
+from task_manager_app.models.task import Task
+
+
+def test_sqlite_connections_are_tuned_from_settings(tmp_path):
+    settings = Settings(db_pool_size=3, db_max_overflow=1, sqlite_busy_timeout_ms=1234,
+                        sqlite_cache_size_kib=2048)
+    engine = make_engine(f"sqlite:///{tmp_path / 'app.db'}", settings)
+    with engine.connect() as conn:
+        pragma = lambda name: conn.execute(text(f"PRAGMA {name}")).scalar()  # noqa: E731
+        assert pragma("journal_mode") == "wal"
+        assert pragma("synchronous") == 1  # NORMAL
+        assert pragma("busy_timeout") == 1234
+        assert pragma("cache_size") == -2048
+        assert pragma("mmap_size") == settings.sqlite_mmap_size
+    assert engine.pool.size() == 3
+    assert engine.pool._max_overflow == 1
+
+    # in-memory databases keep SQLAlchemy's defaults
+    memory = make_engine("sqlite://", settings)
+    with memory.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "memory"
+
+
+def test_concurrent_writers_do_not_hit_database_is_locked(tmp_path):
+    engine = make_engine(f"sqlite:///{tmp_path / 'app.db'}",
+                         Settings(db_pool_size=4, db_max_overflow=4))
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+
+    def writer(n: int) -> None:
+        for i in range(25):
+            with SessionLocal() as db:
+                db.scalar(select(func.count()).select_from(Task))
+                db.execute(insert(Task), {"title": f"writer {n} task {i}"})
+                db.commit()
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(writer, range(8)))
+
+    with SessionLocal() as db:
+        assert db.scalar(select(func.count()).select_from(Task)) == 200
+    engine.dispose()
+
+
+def test_async_engine_opens_the_same_database_with_an_async_driver(tmp_path):
+    assert async_url("postgresql://app@db/tasks").drivername == "postgresql+asyncpg"
+    assert async_url("sqlite:///./dev.db").drivername == "sqlite+aiosqlite"
+
+    url = f"sqlite:///{tmp_path / 'app.db'}"
+    Base.metadata.create_all(bind=make_engine(url))
+    engine = make_async_engine(url, Settings(sqlite_busy_timeout_ms=1234))
+
+    async def check():
+        async with engine.connect() as conn:
+            assert (await conn.execute(text("PRAGMA journal_mode"))).scalar() == "wal"
+            assert (await conn.execute(text("PRAGMA busy_timeout"))).scalar() == 1234
+            assert (await conn.execute(select(func.count()).select_from(Task))).scalar() == 0
+        await engine.dispose()
+
+    asyncio.run(check())
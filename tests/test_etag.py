@@ -0,0 +1,102 @@
+from contextlib import contextmanager
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event, select
+
+from task_manager_app.core import database
+from task_manager_app.models.notification import Notification
+from task_manager_app.models.user import User
+
+
+def auth_headers(client: TestClient):
+    payload = {"email": "user@example.com", "full_name": "Test User", "password": "secret"}
+    client.post("/auth/signup", json=payload)
+    res = client.post("/auth/login", data={"username": payload["email"], "password": "secret"})
+    return {"Authorization": f"Bearer {res.json()['access_token']}"}
+
+
+@contextmanager
+def capture_sql():
+    statements = []
+
+    def record(conn, cursor, sql, *args):
+        statements.append(sql)
+
+    # request handlers query through the async engine
+    event.listen(database.async_engine.sync_engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(database.async_engine.sync_engine, "before_cursor_execute", record)
+
+
+def test_get_task_conditional(client: TestClient):
+    headers = auth_headers(client)
+    task_id = client.post("/tasks/", json={"title": "Etag me"}, headers=headers).json()["id"]
+
+    res = client.get(f"/tasks/{task_id}", headers=headers)
+    etag = res.headers["ETag"]
+    assert etag.startswith('W/"')
+
+    with capture_sql() as statements:
+        res = client.get(f"/tasks/{task_id}", headers={**headers, "If-None-Match": etag})
+    assert res.status_code == 304
+    assert res.content == b""
+    assert res.headers["ETag"] == etag
+    # answered without loading the task itself
+    assert not any("tasks.description" in sql for sql in statements)
+
+    assert client.get(f"/tasks/{task_id}", headers={**headers, "If-None-Match": "*"}).status_code == 304
+    assert client.get(f"/tasks/{task_id}",
+                      headers={**headers, "If-None-Match": f'"other", {etag[2:]}'}).status_code == 304
+
+    client.patch(f"/tasks/{task_id}", json={"progress": 50}, headers=headers)
+    res = client.get(f"/tasks/{task_id}", headers={**headers, "If-None-Match": etag})
+    assert res.status_code == 200
+    assert res.json()["progress"] == 50
+    assert res.headers["ETag"] != etag
+
+
+def test_list_tasks_conditional(client: TestClient):
+    headers = auth_headers(client)
+    ids = [client.post("/tasks/", json={"title": f"Budget {i}"}, headers=headers).json()["id"]
+           for i in range(3)]
+
+    for params in ("?limit=2", "?sort=due_date", "?q=budget"):
+        res = client.get(f"/tasks/{params}", headers=headers)
+        etag = res.headers["ETag"]
+        res = client.get(f"/tasks/{params}", headers={**headers, "If-None-Match": etag})
+        assert res.status_code == 304, params
+
+    etag = client.get("/tasks/?limit=2", headers=headers).headers["ETag"]
+    # a change outside the page leaves it valid
+    client.patch(f"/tasks/{ids[2]}", json={"progress": 10}, headers=headers)
+    assert client.get("/tasks/?limit=2",
+                      headers={**headers, "If-None-Match": etag}).status_code == 304
+    client.patch(f"/tasks/{ids[0]}", json={"progress": 10}, headers=headers)
+    res = client.get("/tasks/?limit=2", headers={**headers, "If-None-Match": etag})
+    assert res.status_code == 200
+    assert len(res.json()) == 2
+
+    etag = res.headers["ETag"]
+    client.delete(f"/tasks/{ids[1]}", headers=headers)
+    assert client.get("/tasks/?limit=2",
+                      headers={**headers, "If-None-Match": etag}).status_code == 200
+
+
+def test_list_notifications_conditional(client: TestClient, db_session):
+    headers = auth_headers(client)
+    user = db_session.scalar(select(User).where(User.email == "user@example.com"))
+    note = Notification(user_id=user.id, message="hello")
+    db_session.add(note)
+    db_session.commit()
+    note_id = note.id
+
+    etag = client.get("/notifications/", headers=headers).headers["ETag"]
+    assert client.get("/notifications/",
+                      headers={**headers, "If-None-Match": etag}).status_code == 304
+
+    client.post(f"/notifications/{note_id}/read", headers=headers)
+    res = client.get("/notifications/", headers={**headers, "If-None-Match": etag})
+    assert res.status_code == 200
+    assert res.json()[0]["read_at"] is not None
@@ -0,0 +1,85 @@
+import asyncio
+import csv
+import io
+import json
+
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+
+from task_manager_app.core import database
+from task_manager_app.models.task import Task, Status
+from task_manager_app.models.user import User, Role
+from task_manager_app.routers import tasks as tasks_router
+
+
+def auth_headers(client: TestClient):
+    payload = {
+        "email": "user@example.com",
+        "full_name": "Test User",
+        "password": "secret",
+    }
+    client.post("/auth/signup", json=payload)
+    res = client.post(
+        "/auth/login",
+        data={"username": payload["email"], "password": payload["password"]},
+    )
+    token = res.json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+def seed(db_session):
+    me = db_session.scalar(select(User).where(User.email == "user@example.com"))
+    other = User(email="other@example.com", hashed_password="x", role=Role.user)
+    db_session.add(other)
+    db_session.flush()
+    db_session.add_all(
+        [Task(title=f"mine {i}", assignee_id=me.id,
+              status=Status.completed if i % 2 else Status.not_started) for i in range(5)]
+        + [Task(title="not mine", assignee_id=other.id)]
+    )
+    db_session.commit()
+
+
+def test_export_ndjson_applies_visibility_and_filters(client: TestClient, db_session):
+    headers = auth_headers(client)
+    seed(db_session)
+
+    res = client.get("/tasks/export", headers=headers)
+    assert res.status_code == 200
+    assert res.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in res.text.splitlines()]
+    assert [r["title"] for r in rows] == [f"mine {i}" for i in range(5)]
+    assert rows == client.get("/tasks/", headers=headers).json()
+
+    res = client.get("/tasks/export", params={"status": "completed"}, headers=headers)
+    assert [json.loads(line)["title"] for line in res.text.splitlines()] == ["mine 1", "mine 3"]
+
+
+def test_export_csv(client: TestClient, db_session):
+    headers = auth_headers(client)
+    seed(db_session)
+
+    res = client.get("/tasks/export", params={"format": "csv", "q": "mine"}, headers=headers)
+    assert res.status_code == 200
+    assert res.headers["content-type"].startswith("text/csv")
+    assert 'filename="tasks.csv"' in res.headers["content-disposition"]
+    rows = list(csv.DictReader(io.StringIO(res.text)))
+    assert len(rows) == 5
+    assert rows[1]["status"] == "completed" and rows[1]["due_date"] == ""
+
+    res = client.get("/tasks/export", params={"format": "csv", "q": "nothing"}, headers=headers)
+    assert res.text.strip() == ",".join(tasks_router.EXPORT_FIELDS)
+
+
+def test_export_reads_in_batches(client: TestClient, db_session, monkeypatch):
+    auth_headers(client)
+    seed(db_session)
+    monkeypatch.setattr(tasks_router, "EXPORT_BATCH_SIZE", 2)
+
+    stmt = select(*[getattr(Task, f) for f in tasks_router.EXPORT_FIELDS]).order_by(Task.id)
+
+    async def batch_sizes():
+        async with database.AsyncSessionLocal() as db:
+            return [len(batch) async for batch in tasks_router._export_rows(db, stmt)]
+
+    assert asyncio.run(batch_sizes()) == [2, 2, 2]
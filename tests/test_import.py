@@ -0,0 +1,171 @@
+import io
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, select, text
+from sqlalchemy.orm import sessionmaker
+
+from task_manager_app import cli
+from task_manager_app.core import database, stats
+from task_manager_app.core.database import Base
+from task_manager_app.core.importer import import_tasks, iter_records
+from task_manager_app.core.notifications import notification_broker
+from task_manager_app.models.notification import Notification, NotificationKind
+from task_manager_app.models.task import Task
+from task_manager_app.models.user import User, Role
+
+
+def auth_headers(client: TestClient):
+    payload = {
+        "email": "user@example.com",
+        "full_name": "Test User",
+        "password": "secret",
+    }
+    client.post("/auth/signup", json=payload)
+    res = client.post(
+        "/auth/login",
+        data={"username": payload["email"], "password": payload["password"]},
+    )
+    token = res.json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+def ndjson(rows) -> bytes:
+    return "".join((r if isinstance(r, str) else json.dumps(r)) + "\n" for r in rows).encode()
+
+
+def test_import_ndjson_reports_bad_rows(client: TestClient, db_session):
+    headers = auth_headers(client)
+    body = ndjson([
+        {"title": "Quarterly budget", "due_date": "2026-05-01"},
+        "{not json",
+        {"title": ""},
+        {"title": "Assigned", "assignee_id": 42},
+        {"title": "Roadmap review", "priority": "high"},
+    ])
+    res = client.post("/tasks/import", files={"file": ("tasks.ndjson", body)}, headers=headers)
+    assert res.status_code == 200
+    report = res.json()
+    assert (report["rows"], report["inserted"], report["checkpoint"]) == (5, 2, 5)
+    assert [e["row"] for e in report["errors"]] == [1, 2, 3]
+
+    # imported rows are searchable (the FTS index was filled in bulk)
+    res = client.get("/tasks/", params={"q": "budg"}, headers=headers)
+    assert [t["title"] for t in res.json()] == ["Quarterly budget"]
+    assert db_session.execute(text("SELECT count(*) FROM tasks_fts_deferred")).scalar() == 0
+
+
+def test_export_csv_round_trips_through_import(client: TestClient, db_session):
+    headers = auth_headers(client)
+    client.post("/tasks/bulk", json=[{"title": f"task {i}", "due_date": "2026-03-01"}
+                                     for i in range(3)], headers=headers)
+    exported = client.get("/tasks/export", params={"format": "csv"}, headers=headers).content
+
+    res = client.post("/tasks/import", files={"file": ("tasks.csv", exported)}, headers=headers)
+    assert res.json()["inserted"] == 3
+    titles = db_session.scalars(select(Task.title).order_by(Task.id)).all()
+    assert titles == ["task 0", "task 1", "task 2"] * 2
+
+
+def test_import_resumes_from_checkpoint(db_session):
+    user = User(email="importer@example.com", hashed_password="x", role=Role.user)
+    db_session.add(user)
+    db_session.commit()
+    body = ndjson([{"title": f"task {i}"} for i in range(5)])
+
+    checkpoints = []
+    records = iter_records(io.BytesIO(body), "ndjson")
+    with pytest.raises(RuntimeError):
+        def interrupted():
+            for i, record in enumerate(records):
+                if i == 3:
+                    raise RuntimeError("connection lost")
+                yield record
+        import_tasks(db_session, interrupted(), user, batch_size=2,
+                     on_checkpoint=checkpoints.append)
+    assert checkpoints == [2]
+
+    report = import_tasks(db_session, iter_records(io.BytesIO(body), "ndjson"), user,
+                          start_row=checkpoints[-1], batch_size=2)
+    assert (report.rows, report.inserted, report.checkpoint) == (5, 3, 5)
+    assert db_session.scalars(select(Task.title).order_by(Task.id)).all() == [
+        f"task {i}" for i in range(5)]
+
+
+def test_import_notifies_other_assignees(db_session, monkeypatch):
+    manager = User(email="manager@example.com", hashed_password="x", role=Role.manager)
+    member = User(email="member@example.com", hashed_password="x", role=Role.user)
+    db_session.add_all([manager, member])
+    db_session.commit()
+    published = []
+    monkeypatch.setattr(notification_broker, "publish", lambda key, message: published.append(key))
+
+    body = ndjson([{"title": "mine"}, {"title": "theirs", "assignee_id": member.id},
+                   {"title": "also theirs", "assignee_id": member.id}, {"title": "mine too"}])
+    for batch_size in (2, 10):
+        report = import_tasks(db_session, iter_records(io.BytesIO(body), "ndjson"), manager,
+                              batch_size=batch_size)
+        assert report.inserted == 4
+
+    notes = db_session.execute(
+        select(Notification.user_id, Notification.kind, Task.title)
+        .join(Task, Task.id == Notification.task_id).order_by(Notification.id)).all()
+    assert [tuple(n) for n in notes] == [
+        (member.id, NotificationKind.assigned, "theirs"),
+        (member.id, NotificationKind.assigned, "also theirs"),
+    ] * 2
+    assert published == [member.id] * 4
+
+
+def test_regular_user_reimports_own_export(db_session):
+    user = User(email="importer@example.com", hashed_password="x", role=Role.user)
+    db_session.add(user)
+    db_session.commit()
+    body = ndjson([{"title": "mine", "assignee_id": user.id},
+                   {"title": "someone else's", "assignee_id": user.id + 1}])
+    report = import_tasks(db_session, iter_records(io.BytesIO(body), "ndjson"), user)
+    assert report.inserted == 1
+    assert [(e.row, e.detail) for e in report.errors] == [(1, "Only managers/admins can assign tasks")]
+    assert db_session.execute(select(Task.title, Task.assignee_id)).all() == [("mine", user.id)]
+
+
+@pytest.fixture
+def cli_db(monkeypatch, tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'cli.db'}")
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+    monkeypatch.setattr(database, "SessionLocal", SessionLocal)
+    with SessionLocal() as db:
+        db.add(User(email="admin@example.com", hashed_password="x", role=Role.admin))
+        db.commit()
+    return SessionLocal
+
+
+def test_cli_import(cli_db, tmp_path, capsys):
+    path = tmp_path / "tasks.ndjson"
+    path.write_bytes(ndjson([{"title": f"task {i}"} for i in range(7)]))
+    checkpoint = tmp_path / "tasks.ndjson.checkpoint"
+    checkpoint.write_text('{"row": 4}')  # left behind by an interrupted run
+
+    assert cli.main(["import-tasks", str(path), "--user", "admin@example.com"]) == 0
+    assert "3 tasks imported" in capsys.readouterr().out
+    assert not checkpoint.exists()
+    with cli_db() as db:
+        assert db.scalars(select(Task.title)).all() == ["task 4", "task 5", "task 6"]
+
+    assert cli.main(["import-tasks", str(path), "--user", "nobody@example.com"]) == 2
+
+
+def test_import_batch_spanning_several_statements(db_session):
+    admin = User(email="admin@example.com", hashed_password="x", role=Role.admin)
+    db_session.add(admin)
+    db_session.commit()
+    rows = [{"title": f"task {i}", "priority": "high" if i % 2 else "low", "progress": i % 10}
+            for i in range(250)]
+    report = import_tasks(db_session, iter_records(io.BytesIO(ndjson(rows)), "ndjson"), admin)
+    assert report.inserted == 250
+
+    titles = db_session.scalars(select(Task.title).order_by(Task.id)).all()
+    assert titles == [r["title"] for r in rows]
+    assert sorted(stats.rollup_groups(db_session)) == sorted(stats.live_groups(db_session))
@@ -0,0 +1,84 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from task_manager_app.core import database
+from task_manager_app.core.database import Base
+from task_manager_app.core.leader import Lease
+from task_manager_app.core.scheduler import BackgroundScheduler
+
+
+@pytest.fixture
+def lease_db(monkeypatch, tmp_path):
+    # A file database, as separate worker processes would share
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'lease.db'}", connect_args={"check_same_thread": False}
+    )
+    Base.metadata.create_all(bind=engine)
+    monkeypatch.setattr(database, "SessionLocal",
+                        sessionmaker(bind=engine, autocommit=False, autoflush=False))
+    return engine
+
+
+def test_single_leader_and_takeover(lease_db):
+    now = datetime(2026, 1, 1, 12, 0)
+    a = Lease("reminders", ttl_seconds=30, holder="a")
+    b = Lease("reminders", ttl_seconds=30, holder="b")
+
+    assert a.acquire(now) is True
+    assert b.acquire(now) is False
+    # the leader renews
+    assert a.acquire(now + timedelta(seconds=20)) is True
+    assert b.acquire(now + timedelta(seconds=40)) is False
+    # leader stops renewing: follower takes over once the lease lapses
+    assert b.acquire(now + timedelta(seconds=51)) is True
+    assert a.acquire(now + timedelta(seconds=52)) is False
+
+
+def test_release_hands_over_immediately(lease_db):
+    a = Lease("reminders", ttl_seconds=300, holder="a")
+    b = Lease("reminders", ttl_seconds=300, holder="b")
+    assert a.acquire()
+    assert not b.acquire()
+    a.release()
+    assert b.acquire()
+
+
+def test_only_leader_runs_job_and_records_metrics(lease_db):
+    runs = {"a": 0, "b": 0}
+
+    def make_job(name):
+        def job():
+            runs[name] += 1
+            return 7
+        return job
+
+    schedulers = {}
+    for name in ("a", "b"):
+        s = BackgroundScheduler(max_workers=1)
+        s.add_job("reminders", make_job(name), interval_seconds=0.02,
+                  lease=Lease("reminders", ttl_seconds=60, holder=name))
+        schedulers[name] = s
+
+    async def scenario():
+        for s in schedulers.values():
+            s.start()
+        await asyncio.sleep(0.3)
+        snapshot = {n: s.metrics()["reminders"] for n, s in schedulers.items()}
+        counts = dict(runs)
+        # shutting the leader down releases the lease, so stop both at once
+        await asyncio.gather(*(s.shutdown() for s in schedulers.values()))
+        return snapshot, counts
+
+    metrics, runs = asyncio.run(scenario())
+    leaders = [n for n, m in metrics.items() if m["is_leader"]]
+    assert len(leaders) == 1
+    leader, follower = leaders[0], ({"a", "b"} - set(leaders)).pop()
+    assert runs[follower] == 0
+    assert runs[leader] >= metrics[leader]["runs"] > 0
+    assert metrics[leader]["total_rows"] > 0
+    assert metrics[leader]["total_rows"] % 7 == 0
+    assert metrics[leader]["last_duration_seconds"] >= 0
@@ -0,0 +1,79 @@
+import pstats
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from task_manager_app.core import metrics
+from task_manager_app.core.config import Settings
+from task_manager_app.routers import auth, tasks, users
+
+
+def auth_headers(client: TestClient):
+    payload = {"email": "user@example.com", "full_name": "Test User", "password": "secret"}
+    client.post("/auth/signup", json=payload)
+    res = client.post("/auth/login", data={"username": payload["email"], "password": "secret"})
+    return {"Authorization": f"Bearer {res.json()['access_token']}"}
+
+
+@pytest.fixture
+def instrumented(db_session, tmp_path):
+    for metric in metrics.REGISTRY:
+        metric.clear()
+    app = FastAPI()
+    app.include_router(auth.router)
+    app.include_router(users.router)
+    app.include_router(tasks.router)
+    metrics.install(app, Settings(metrics_enabled=True, profile_token="s3cret",
+                                  profile_dir=str(tmp_path / "profiles")))
+    with TestClient(app) as c:
+        yield c
+
+
+def test_requests_are_timed_per_route(instrumented: TestClient):
+    headers = auth_headers(instrumented)
+    task_id = instrumented.post("/tasks/", json={"title": "timed"}, headers=headers).json()["id"]
+    instrumented.get(f"/tasks/{task_id}", headers=headers)
+    instrumented.get(f"/tasks/{task_id}", headers=headers)
+
+    res = instrumented.get("/tasks/", headers=headers)
+    timing = res.headers["Server-Timing"]
+    assert timing.startswith("db;dur=")
+    assert '"1 statement"' in timing  # the page query; the user comes from the cache
+    assert "auth.token;dur=" in timing and "serialize;dur=" in timing
+
+    body = instrumented.get("/metrics").text
+    assert instrumented.get("/metrics").headers["content-type"].startswith("text/plain; version=0.0.4")
+    # ids in the path are folded into the route template
+    assert ('http_request_duration_seconds_count{method="GET",route="/tasks/{task_id}",'
+            'status="200"} 2') in body
+    assert 'http_request_duration_seconds_bucket{method="GET",route="/tasks/",status="200",le="+Inf"} 1' in body
+    assert 'http_request_db_statements_count{method="POST",route="/tasks/"}' in body
+    assert 'app_span_duration_seconds_count{span="serialize"} 1' in body
+
+
+def test_profile_is_dumped_only_with_the_token(instrumented: TestClient, tmp_path):
+    headers = auth_headers(instrumented)
+    res = instrumented.get("/tasks/", headers={**headers, "X-Profile": "wrong"})
+    assert metrics.PROFILE_DUMP_HEADER not in res.headers
+
+    res = instrumented.get("/tasks/", headers={**headers, "X-Profile": "s3cret"})
+    assert res.status_code == 200
+    dump = tmp_path / "profiles" / res.headers[metrics.PROFILE_DUMP_HEADER]
+    stats = pstats.Stats(str(dump))
+    assert any(name == "list_tasks" for _, _, name in stats.stats)
+
+
+def test_histogram_renders_cumulative_buckets():
+    histogram = metrics.Histogram("demo_seconds", "Demo.", ("path",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3):
+        histogram.observe(value, 'a"b')
+    assert histogram.render() == [
+        "# HELP demo_seconds Demo.",
+        "# TYPE demo_seconds histogram",
+        'demo_seconds_bucket{path="a\\"b",le="0.1"} 2',
+        'demo_seconds_bucket{path="a\\"b",le="1.0"} 3',
+        'demo_seconds_bucket{path="a\\"b",le="+Inf"} 4',
+        'demo_seconds_sum{path="a\\"b"} 3.65',
+        'demo_seconds_count{path="a\\"b"} 4',
+    ]
@@ -0,0 +1,214 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from task_manager_app.core import database, notifications as notification_core
+from task_manager_app.core.database import Base
+from task_manager_app.core.pubsub import Broker
+from task_manager_app.models.notification import Notification
+from task_manager_app.models.user import User, Role
+from task_manager_app.routers import notifications as notifications_router, users as users_router
+
+
+def auth_headers(client: TestClient, email: str = "user@example.com"):
+    payload = {"email": email, "full_name": "Test User", "password": "secret"}
+    client.post("/auth/signup", json=payload)
+    res = client.post("/auth/login", data={"username": email, "password": "secret"})
+    return {"Authorization": f"Bearer {res.json()['access_token']}"}
+
+
+class RecordingBroker(Broker):
+    def __init__(self):
+        super().__init__()
+        self.published = []
+
+    def publish(self, key, message):
+        self.published.append((key, message))
+
+
+@pytest.fixture
+def recorder(monkeypatch):
+    broker = RecordingBroker()
+    monkeypatch.setattr(notification_core, "notification_broker", broker)
+    return broker
+
+
+def test_broker_fans_out_per_key():
+    async def scenario():
+        broker = Broker(queue_size=10)
+        a1, a2, b = broker.subscribe(1), broker.subscribe(1), broker.subscribe(2)
+        broker.publish(1, "hello")
+        await asyncio.sleep(0)  # delivery is scheduled on the loop
+        assert [await a1.get(), await a2.get()] == ["hello", "hello"]
+        assert b._queue.empty()
+        a1.close()
+        assert await a1.get() is None
+        assert broker.stats() == {"subscribers": 2, "delivered": 2, "dropped": 0}
+
+    asyncio.run(scenario())
+
+
+def test_slow_subscriber_is_disconnected():
+    async def scenario():
+        broker = Broker(queue_size=2)
+        slow = broker.subscribe(1)
+        for i in range(3):
+            broker.publish(1, i)
+        await asyncio.sleep(0)
+        # the backlog is dropped, not delivered late
+        assert await slow.get() is None
+        assert slow.overflowed
+        assert broker.stats() == {"subscribers": 0, "delivered": 2, "dropped": 1}
+
+    asyncio.run(scenario())
+
+
+def test_assignment_publishes_after_commit(client: TestClient, db_session, recorder):
+    auth_headers(client, "other@example.com")
+    headers = auth_headers(client)
+    manager = db_session.scalar(select(User).where(User.email == "user@example.com"))
+    other = db_session.scalar(select(User).where(User.email == "other@example.com"))
+    manager.role = Role.manager
+    db_session.commit()
+
+    res = client.post("/tasks/", json={"title": "Ship it", "assignee_id": other.id}, headers=headers)
+    assert res.status_code == 201
+    # assigning to yourself is not news
+    client.post("/tasks/", json={"title": "Mine"}, headers=headers)
+
+    assert len(recorder.published) == 1
+    key, message = recorder.published[0]
+    assert key == other.id
+    assert message["kind"] == "assigned"
+    assert message["task_id"] == res.json()["id"]
+    assert message["message"] == "You were assigned task 'Ship it'."
+
+    # reassigning back and forth doesn't repeat the notification
+    task_id = res.json()["id"]
+    client.patch(f"/tasks/{task_id}", json={"assignee_id": manager.id}, headers=headers)
+    client.patch(f"/tasks/{task_id}", json={"assignee_id": other.id}, headers=headers)
+    assert len(recorder.published) == 1
+
+
+def test_rolled_back_notifications_are_not_published(recorder):
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    with sessionmaker(bind=engine)() as db:
+        user = User(email="user@example.com", hashed_password="x")
+        db.add(user)
+        db.flush()
+        note = Notification(user_id=user.id, message="hello", created_at=datetime(2026, 1, 1))
+        db.add(note)
+        db.flush()
+        notification_core.publish_on_commit(db, [note])
+        db.rollback()
+        db.commit()
+    assert recorder.published == []
+
+
+def test_sse_replays_backlog_then_streams_live():
+    async def scenario():
+        broker = Broker(queue_size=2)
+        subscription = broker.subscribe(1)
+        backlog = [{"id": 1, "message": "a"}, {"id": 2, "message": "b"}]
+        events = notifications_router.sse_events(subscription, backlog, keepalive=0.01)
+        chunks = [await events.__anext__() for _ in range(3)]
+        assert chunks[0].startswith("retry:")
+        assert chunks[1].startswith("id: 1\nevent: notification\ndata: ")
+
+        assert await events.__anext__() == ": keepalive\n\n"
+        broker.publish(1, {"id": 2, "message": "b"})  # also in the backlog
+        broker.publish(1, {"id": 3, "message": "c"})
+        assert (await events.__anext__()).startswith("id: 3\n")
+
+        for i in range(4, 7):
+            broker.publish(1, {"id": i})
+        await asyncio.sleep(0)
+        assert await events.__anext__() == "event: overflow\ndata: {}\n\n"
+        with pytest.raises(StopAsyncIteration):
+            await events.__anext__()
+        assert broker.stats()["subscribers"] == 0
+
+    asyncio.run(scenario())
+
+
+def test_stream_replays_after_last_event_id(client: TestClient, db_session, monkeypatch):
+    headers = auth_headers(client)
+    user = db_session.scalar(select(User).where(User.email == "user@example.com"))
+    notes = [Notification(user_id=user.id, message=f"n{i}") for i in range(3)]
+    db_session.add_all(notes)
+    db_session.commit()
+    note_ids = [str(n.id) for n in notes]
+
+    class ClosedBroker(Broker):
+        # end the stream after the replay so the test client can read it whole
+        def subscribe(self, key):
+            subscription = super().subscribe(key)
+            subscription.close()
+            return subscription
+
+    monkeypatch.setattr(notifications_router, "notification_broker", ClosedBroker())
+    res = client.get("/notifications/stream",
+                     headers={**headers, "Last-Event-ID": note_ids[0]})
+    assert res.status_code == 200
+    assert res.headers["content-type"].startswith("text/event-stream")
+    ids = [line[4:] for line in res.text.splitlines() if line.startswith("id: ")]
+    assert ids == note_ids[1:]
+
+
+def test_table_tail_sees_rows_committed_elsewhere(monkeypatch, tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'tail.db'}")
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+    monkeypatch.setattr(database, "SessionLocal", SessionLocal)
+
+    with SessionLocal() as db:
+        user = User(email="user@example.com", hashed_password="x")
+        db.add(user)
+        db.flush()
+        db.add(Notification(user_id=user.id, message="before"))
+        db.commit()
+        user_id = user.id
+
+    broker = notification_core.TableTailBroker(queue_size=10, poll_seconds=1)
+    assert broker.poll_once() == []  # starts from the newest row
+    with SessionLocal() as db:
+        db.add_all([Notification(user_id=user_id, message=m) for m in ("one", "two")])
+        db.commit()
+    assert [e["message"] for e in broker.poll_once()] == ["one", "two"]
+    # already-delivered rows inside the overlap window are not sent again
+    assert broker.poll_once() == []
+
+
+def test_stream_holds_no_pooled_connection(client: TestClient, monkeypatch):
+    headers = auth_headers(client)
+    users_router.user_cache.clear()  # the first request looks the user up
+    # the test database, behind a real pool rather than NullPool
+    pooled = create_async_engine(database.async_engine.url)
+    monkeypatch.setattr(database, "AsyncSessionLocal",
+                        async_sessionmaker(bind=pooled, expire_on_commit=False))
+    checked_out = []
+
+    class ProbeBroker(Broker):
+        # note the pool while the stream is open, then end it
+        def subscribe(self, key):
+            subscription = super().subscribe(key)
+            get = subscription.get
+
+            async def probe():
+                checked_out.append(pooled.pool.checkedout())
+                subscription.close()
+                return await get()
+
+            subscription.get = probe
+            return subscription
+
+    monkeypatch.setattr(notifications_router, "notification_broker", ProbeBroker())
+    res = client.get("/notifications/stream", headers=headers)
+    assert res.status_code == 200
+    assert checked_out == [0]
@@ -40,3 +40,27 @@ def test_notification_read_flow(client: TestClient, db_session):
     res = client.get("/notifications/", headers=headers)
     assert res.status_code == 200
     assert res.json()[0]["read_at"] is not None
+
+
+def test_unread_count_and_batch_read(client: TestClient, db_session):
+    headers = auth_headers(client)
+    user = db_session.scalar(select(User).where(User.email == "user@example.com"))
+    notes = [Notification(user_id=user.id, message=f"n{i}") for i in range(5)]
+    db_session.add_all(notes)
+    db_session.commit()
+    ids = [n.id for n in notes]
+
+    assert client.get("/notifications/unread_count", headers=headers).json() == {"unread": 5}
+
+    res = client.post("/notifications/read", json={"ids": ids[:2]}, headers=headers)
+    assert res.status_code == 200
+    assert res.json() == {"updated": 2}
+    assert client.get("/notifications/unread_count", headers=headers).json() == {"unread": 3}
+
+    # already-read rows are not counted again
+    res = client.post("/notifications/read", json={"up_to_id": ids[3]}, headers=headers)
+    assert res.json() == {"updated": 2}
+    assert client.get("/notifications/unread_count", headers=headers).json() == {"unread": 1}
+
+    res = client.post("/notifications/read", json={"ids": ids, "up_to_id": ids[-1]}, headers=headers)
+    assert res.status_code == 422
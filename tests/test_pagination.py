@@ -1,13 +1,22 @@
+import asyncio
+import json
 import os
 import sys
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool
 
 # Ensure the task_manager_app package is on the import path
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
-from task_manager_app.core.database import Base
+from task_manager_app.core.database import Base, async_url
+from task_manager_app.core.pagination import NEXT_CURSOR_HEADER, encode_cursor
 from task_manager_app.core.security import hash_password
 from task_manager_app.models.user import User, Role
 from task_manager_app.models.task import Task
@@ -16,17 +25,34 @@ from task_manager_app.routers.tasks import list_tasks
 from task_manager_app.routers.notifications import list_my_notifications
 
 
-def setup_session():
+def setup_session(tmp_path):
     engine = create_engine(
-        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+        f"sqlite:///{tmp_path / 'pagination.db'}", connect_args={"check_same_thread": False}
     )
     TestingSessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False, future=True)
     Base.metadata.create_all(bind=engine)
     return TestingSessionLocal
 
 
-def test_task_pagination():
-    SessionLocal = setup_session()
+def run(handler, db, **kwargs):
+    """Call an async endpoint with an AsyncSession on ``db``'s database."""
+    async def call():
+        engine = create_async_engine(async_url(db.get_bind().url), poolclass=NullPool)
+        try:
+            async with AsyncSession(engine) as async_db:
+                return await handler(db=async_db, **kwargs)
+        finally:
+            await engine.dispose()
+    return asyncio.run(call())
+
+
+def page(response) -> list:
+    """The items of a list endpoint's pre-encoded JSON response."""
+    return [SimpleNamespace(**item) for item in json.loads(response.body)]
+
+
+def test_task_pagination(tmp_path):
+    SessionLocal = setup_session(tmp_path)
     with SessionLocal() as db:
         user = User(
             email="user@example.com",
@@ -41,19 +67,19 @@ def test_task_pagination():
             db.add(Task(title=f"task-{i}", assignee_id=user.id))
         db.commit()
 
-        res = list_tasks(db=db, current=user, limit=2)
+        res = page(run(list_tasks, db, current=user, limit=2))
         assert len(res) == 2
         assert res[0].title == "task-0"
         assert res[1].title == "task-1"
 
-        res = list_tasks(db=db, current=user, limit=2, offset=1)
+        res = page(run(list_tasks, db, current=user, limit=2, offset=1))
         assert len(res) == 2
         assert res[0].title == "task-1"
         assert res[1].title == "task-2"
 
 
-def test_notification_pagination():
-    SessionLocal = setup_session()
+def test_notification_pagination(tmp_path):
+    SessionLocal = setup_session(tmp_path)
     with SessionLocal() as db:
         user = User(
             email="user@example.com",
@@ -68,9 +94,91 @@ def test_notification_pagination():
             db.add(Notification(user_id=user.id, message=f"note-{i}"))
         db.commit()
 
-        res = list_my_notifications(db=db, current=user, limit=2)
+        res = page(run(list_my_notifications, db, current=user, limit=2))
         assert [n.message for n in res] == ["note-2", "note-1"]
 
-        res = list_my_notifications(db=db, current=user, limit=1, offset=2)
+        res = page(run(list_my_notifications, db, current=user, limit=1, offset=2))
         assert len(res) == 1
         assert res[0].message == "note-0"
+
+
+def test_task_keyset_pagination(tmp_path):
+    SessionLocal = setup_session(tmp_path)
+    with SessionLocal() as db:
+        user = User(
+            email="user@example.com",
+            full_name="Test User",
+            hashed_password=hash_password("pass"),
+            role=Role.user,
+        )
+        db.add(user)
+        db.commit()
+        db.refresh(user)
+        for i in range(5):
+            db.add(Task(title=f"task-{i}", assignee_id=user.id))
+        db.commit()
+
+        seen = []
+        cursor = None
+        while True:
+            response = run(list_tasks, db, current=user, limit=2, cursor=cursor)
+            seen.extend(t.title for t in page(response))
+            cursor = response.headers.get(NEXT_CURSOR_HEADER)
+            if cursor is None:
+                break
+        assert seen == [f"task-{i}" for i in range(5)]
+
+
+def test_task_keyset_by_due_date_puts_undated_last(tmp_path):
+    SessionLocal = setup_session(tmp_path)
+    with SessionLocal() as db:
+        user = User(email="user@example.com", hashed_password="x", role=Role.user)
+        db.add(user)
+        db.commit()
+        db.refresh(user)
+        dues = [date(2026, 1, 3), None, date(2026, 1, 1), date(2026, 1, 3), None, date(2026, 1, 2)]
+        for i, due in enumerate(dues):
+            db.add(Task(title=f"task-{i}", assignee_id=user.id, due_date=due))
+        db.commit()
+
+        seen = []
+        cursor = None
+        while True:
+            response = run(list_tasks, db, current=user, sort="due_date", limit=1, cursor=cursor)
+            seen.extend(t.title for t in page(response))
+            cursor = response.headers.get(NEXT_CURSOR_HEADER)
+            if cursor is None:
+                break
+        assert seen == ["task-2", "task-5", "task-0", "task-3", "task-1", "task-4"]
+
+
+def test_notification_keyset_pagination(tmp_path):
+    SessionLocal = setup_session(tmp_path)
+    with SessionLocal() as db:
+        user = User(email="user@example.com", hashed_password="x", role=Role.user)
+        db.add(user)
+        db.commit()
+        db.refresh(user)
+        for i in range(3):
+            db.add(Notification(user_id=user.id, message=f"note-{i}"))
+        db.commit()
+
+        response = run(list_my_notifications, db, current=user, limit=2)
+        assert [n.message for n in page(response)] == ["note-2", "note-1"]
+        cursor = response.headers[NEXT_CURSOR_HEADER]
+
+        response = run(list_my_notifications, db, current=user, limit=2, cursor=cursor)
+        assert [n.message for n in page(response)] == ["note-0"]
+        assert NEXT_CURSOR_HEADER not in response.headers
+
+
+def test_invalid_cursor_is_rejected(tmp_path):
+    SessionLocal = setup_session(tmp_path)
+    with SessionLocal() as db:
+        user = User(email="user@example.com", hashed_password="x", role=Role.user)
+        db.add(user)
+        db.commit()
+        for bad in ["not-a-cursor", encode_cursor({"sort": "due_date", "id": 1})]:
+            with pytest.raises(HTTPException) as exc:
+                run(list_tasks, db, current=user, cursor=bad)
+            assert exc.value.status_code == 400
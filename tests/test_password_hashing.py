@@ -0,0 +1,63 @@
+import asyncio
+
+from fastapi.testclient import TestClient
+from passlib.context import CryptContext
+from sqlalchemy import select
+
+from task_manager_app.core.hashing import PasswordHasher, HasherBusy, password_hasher, pwd_context
+from task_manager_app.models.user import User, Role
+
+
+def test_process_pool_hashes_and_verifies():
+    hasher = PasswordHasher(workers=1, max_pending=4)
+    try:
+        async def scenario():
+            hashed = await hasher.hash("secret")
+            return hashed, await hasher.verify_and_update("secret", hashed), \
+                await hasher.verify_and_update("wrong", hashed)
+        hashed, good, bad = asyncio.run(scenario())
+    finally:
+        hasher.shutdown()
+    assert pwd_context.identify(hashed) == "bcrypt"
+    assert good == (True, None)
+    assert bad == (False, None)
+    assert hasher.pending == 0
+
+
+def test_hasher_rejects_when_queue_is_full():
+    hasher = PasswordHasher(workers=0, max_pending=2)
+
+    async def scenario():
+        return await asyncio.gather(*(hasher.hash("secret") for _ in range(3)),
+                                    return_exceptions=True)
+
+    results = asyncio.run(scenario())
+    assert sum(isinstance(r, HasherBusy) for r in results) == 1
+    assert hasher.rejected == 1
+    assert hasher.pending == 0
+
+
+def test_login_rehashes_outdated_cost(client: TestClient, db_session):
+    weak = CryptContext(schemes=["bcrypt"], bcrypt__rounds=4).hash("secret")
+    db_session.add(User(email="old@example.com", hashed_password=weak, role=Role.user))
+    db_session.commit()
+
+    res = client.post("/auth/login", data={"username": "old@example.com", "password": "secret"})
+    assert res.status_code == 200
+    stored = db_session.scalar(select(User.hashed_password).where(User.email == "old@example.com"))
+    assert stored != weak
+    assert not pwd_context.needs_update(stored)
+    assert pwd_context.verify("secret", stored)
+
+    # a second login finds nothing to upgrade
+    res = client.post("/auth/login", data={"username": "old@example.com", "password": "secret"})
+    assert res.status_code == 200
+    assert db_session.scalar(
+        select(User.hashed_password).where(User.email == "old@example.com")) == stored
+
+
+def test_auth_returns_503_when_hasher_saturated(client: TestClient, monkeypatch):
+    monkeypatch.setattr(password_hasher, "max_pending", 0)
+    res = client.post("/auth/signup", json={"email": "busy@example.com", "password": "secret"})
+    assert res.status_code == 503
+    assert res.headers["Retry-After"] == "1"
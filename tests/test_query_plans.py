@@ -0,0 +1,161 @@
+"""
+Guard the task filter indexes: every supported filter combination of
+GET /tasks must be answered from an index, never a full table scan.
+
+Runs against in-memory SQLite (EXPLAIN QUERY PLAN). Set TEST_POSTGRES_URL to
+also check the plans on Postgres (EXPLAIN with sequential scans disabled).
+"""
+import itertools
+import os
+import sys
+from datetime import date, datetime
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine, func, select, text
+
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from task_manager_app.core import retention
+from task_manager_app.core.database import Base
+from task_manager_app.core.search import get_search_backend
+from task_manager_app.models.user import Role
+from task_manager_app.models.notification import Notification
+from task_manager_app.models.task import Task
+from task_manager_app.routers.tasks import _visible_to, _apply_filters, _apply_sort
+
+FILTER_VALUES = {
+    "status_": "in_progress",
+    "priority": "high",
+    "assignee_id": 3,
+    "due_before": date(2026, 1, 31),
+    "due_after": date(2026, 1, 1),
+}
+
+USER = SimpleNamespace(id=1, role=Role.user)
+ADMIN = SimpleNamespace(id=2, role=Role.admin)
+
+# An open-ended date range ordered by id: the planner may instead walk the
+# primary key in order and stop at LIMIT, which is also index-backed.
+PK_WALK_ALLOWED = {("due_after",)}
+
+
+def filter_combinations():
+    keys = list(FILTER_VALUES)
+    for r in range(len(keys) + 1):
+        yield from itertools.combinations(keys, r)
+
+
+def build_stmt(current, combo, sort):
+    filters = {k: (FILTER_VALUES[k] if k in combo else None) for k in FILTER_VALUES}
+    stmt = _visible_to(select(Task), current)
+    stmt = _apply_filters(stmt, q=None, **filters)
+    return _apply_sort(stmt, sort, None).limit(100)
+
+
+def cases():
+    for current, sort, combo in itertools.product((USER, ADMIN), ("id", "due_date"),
+                                                  filter_combinations()):
+        if current is ADMIN and not combo:
+            continue  # listing everything is a scan by definition
+        yield pytest.param(current, sort, combo,
+                           id=f"{current.role.value}-{sort}-{'+'.join(combo) or 'none'}")
+
+
+CASES = list(cases())
+
+
+@pytest.fixture(scope="module")
+def sqlite_engine():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    return engine
+
+
+def sqlite_plan(engine, stmt) -> list[str]:
+    sql = str(stmt.compile(dialect=engine.dialect, compile_kwargs={"literal_binds": True}))
+    with engine.connect() as conn:
+        return [row[3] for row in conn.execute(text("EXPLAIN QUERY PLAN " + sql))]
+
+
+@pytest.mark.parametrize("current,sort,combo", CASES)
+def test_sqlite_task_filters_use_an_index(sqlite_engine, current, sort, combo):
+    plan = sqlite_plan(sqlite_engine, build_stmt(current, combo, sort))
+    table_steps = [step for step in plan if "tasks" in step]
+    assert table_steps, plan
+    for step in table_steps:
+        if step.startswith("SEARCH") or "USING INDEX" in step or "USING COVERING INDEX" in step:
+            continue
+        if (current is ADMIN and sort == "id" and combo in PK_WALK_ALLOWED
+                and step == "SCAN tasks" and not any("TEMP B-TREE" in s for s in plan)):
+            continue
+        pytest.fail(f"full table scan for {combo} (sort={sort}): {plan}")
+
+
+def test_sqlite_unread_count_uses_partial_index(sqlite_engine):
+    stmt = (select(func.count()).select_from(Notification)
+            .where(Notification.user_id == 1, Notification.read_at.is_(None)))
+    plan = sqlite_plan(sqlite_engine, stmt)
+    assert any("ix_notifications_user_unread" in step for step in plan), plan
+
+
+def test_sqlite_retention_batches_use_created_at_index(sqlite_engine):
+    old = (Notification.read_at.is_not(None) & (Notification.created_at < datetime(2026, 1, 1))
+           & ~retention._DEDUPE_KEY_IN_USE)
+    for after in (None, (datetime(2025, 6, 1), 10)):
+        plan = sqlite_plan(sqlite_engine, retention._batch_query(old, after, 1000))
+        assert any("ix_notifications_created_at" in step for step in plan), plan
+        assert not any("TEMP B-TREE" in step for step in plan), plan
+
+
+@pytest.fixture(scope="module")
+def large_sqlite_engine():
+    # Statistics of a 100k-row table where every index looks selective
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(text("ANALYZE"))
+        conn.execute(text("DELETE FROM sqlite_stat1 WHERE tbl = 'tasks'"))
+        conn.execute(text("INSERT INTO sqlite_stat1 VALUES ('tasks', NULL, '100000')"))
+        for index in Task.__table__.indexes:
+            conn.execute(text("INSERT INTO sqlite_stat1 VALUES ('tasks', :idx, :stat)"),
+                         {"idx": index.name, "stat": " ".join(["100000"] + ["25"] * len(index.columns))})
+        conn.execute(text("ANALYZE sqlite_schema"))  # reload the statistics
+    return engine
+
+
+def test_sqlite_search_runs_the_fts_match_once(large_sqlite_engine):
+    # The planner would rather drive from ix_tasks_status_due, and a tasks_fts
+    # join nested inside that loop reruns the whole MATCH for each candidate row.
+    stmt = _apply_filters(_visible_to(select(Task), ADMIN), q="report", status_="in_progress",
+                          priority=None, assignee_id=None,
+                          due_before=date(2026, 1, 31), due_after=date(2026, 1, 1), ranked=True)
+    stmt = stmt.order_by(get_search_backend("sqlite").rank("report"), Task.id).limit(100)
+    plan = sqlite_plan(large_sqlite_engine, stmt)
+    # tasks_fts is the outer loop; tasks is looked up per match
+    assert "tasks_fts" in plan[0], plan
+    assert any(step.startswith("SEARCH tasks USING") for step in plan), plan
+
+
+def test_sqlite_unranked_search_runs_the_fts_match_once(large_sqlite_engine):
+    stmt = _apply_filters(_visible_to(select(Task), USER), q="report", status_=None,
+                          priority=None, assignee_id=1, due_before=None, due_after=None)
+    plan = sqlite_plan(large_sqlite_engine, _apply_sort(stmt, "id", None).limit(100))
+    # the matches are a list built once and probed per task, whichever index drives
+    fts_steps = [step for step in plan if "tasks_fts" in step]
+    assert any(step.startswith("LIST SUBQUERY") for step in plan), plan
+    assert fts_steps and not any(":=M" in step for step in fts_steps), plan
+
+
+@pytest.mark.skipif(not os.getenv("TEST_POSTGRES_URL"), reason="TEST_POSTGRES_URL not set")
+@pytest.mark.parametrize("current,sort,combo", CASES)
+def test_postgres_task_filters_use_an_index(current, sort, combo):
+    engine = create_engine(os.environ["TEST_POSTGRES_URL"])
+    Base.metadata.create_all(bind=engine)
+    stmt = build_stmt(current, combo, sort)
+    sql = str(stmt.compile(dialect=engine.dialect, compile_kwargs={"literal_binds": True}))
+    with engine.begin() as conn:
+        # tiny test tables would always be seq-scanned; ask whether an index *can* be used
+        conn.execute(text("SET LOCAL enable_seqscan = off"))
+        plan = "\n".join(row[0] for row in conn.execute(text("EXPLAIN " + sql)))
+    assert "Seq Scan on tasks" not in plan, plan
@@ -0,0 +1,221 @@
+import os
+import sys
+import time
+from datetime import datetime, date, timedelta
+from sqlalchemy import create_engine, select, func, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from task_manager_app.core.database import Base
+from task_manager_app.core.reminders import (
+    DueDateIndex,
+    ReminderEngine,
+    reminder_engine,
+    sweep_due_reminders,
+)
+from task_manager_app.models.user import User, Role
+from task_manager_app.models.task import Task, Status
+from task_manager_app.models.notification import Notification, NotificationKind
+
+
+def setup_session():
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    TestingSessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False, future=True)
+    Base.metadata.create_all(bind=engine)
+    return engine, TestingSessionLocal
+
+
+def seed_user(db):
+    user = User(email="user@example.com", hashed_password="x", role=Role.user)
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+    return user
+
+
+def test_sweep_creates_one_reminder_per_due_task():
+    _, SessionLocal = setup_session()
+    now = datetime(2026, 1, 10, 12, 0)
+    with SessionLocal() as db:
+        user = seed_user(db)
+        db.add_all([
+            Task(title="due-tomorrow", assignee_id=user.id, due_date=date(2026, 1, 11)),
+            Task(title="overdue", assignee_id=user.id, due_date=date(2026, 1, 1)),
+            Task(title="far", assignee_id=user.id, due_date=date(2026, 2, 1)),
+            Task(title="done", assignee_id=user.id, due_date=date(2026, 1, 11),
+                 status=Status.completed),
+            Task(title="unassigned", due_date=date(2026, 1, 11)),
+            Task(title="no-due", assignee_id=user.id),
+        ])
+        db.commit()
+
+        assert sweep_due_reminders(db, now=now) == 2
+        notes = db.execute(select(Notification).order_by(Notification.id)).scalars().all()
+        assert {n.message for n in notes} == {
+            "Task 'due-tomorrow' is due within 24h (due: 2026-01-11).",
+            "Task 'overdue' is due within 24h (due: 2026-01-01).",
+        }
+        assert all(n.kind == NotificationKind.due_soon for n in notes)
+
+        # A second sweep must not duplicate anything
+        assert sweep_due_reminders(db, now=now + timedelta(hours=1)) == 0
+        assert db.scalar(select(func.count(Notification.id))) == 2
+
+
+def test_dedupe_ignores_free_text_notifications():
+    _, SessionLocal = setup_session()
+    with SessionLocal() as db:
+        user = seed_user(db)
+        task = Task(title="t", assignee_id=user.id, due_date=date(2026, 1, 11))
+        db.add(task)
+        db.commit()
+        # A hand-written message mentioning the phrase is not a reminder
+        db.add(Notification(user_id=user.id, task_id=task.id, message="due within 24h?"))
+        db.commit()
+
+        assert sweep_due_reminders(db, now=datetime(2026, 1, 10, 12, 0)) == 1
+
+
+def test_sweep_is_constant_number_of_statements():
+    engine, SessionLocal = setup_session()
+    with SessionLocal() as db:
+        user = seed_user(db)
+        db.add_all([
+            Task(title=f"t{i}", assignee_id=user.id, due_date=date(2026, 1, 11))
+            for i in range(50)
+        ])
+        db.commit()
+
+        statements = []
+        event.listen(engine, "before_cursor_execute",
+                     lambda *args: statements.append(args[2]))
+        assert sweep_due_reminders(db, now=datetime(2026, 1, 10, 12, 0)) == 50
+        # one candidate SELECT + one executemany INSERT
+        assert len([s for s in statements if s.lstrip().upper().startswith(("SELECT", "INSERT"))]) == 2
+
+
+def test_due_date_index_orders_and_reschedules():
+    index = DueDateIndex()
+    t0 = datetime(2026, 1, 1)
+    index.schedule(1, t0 + timedelta(hours=3))
+    index.schedule(2, t0 + timedelta(hours=1))
+    index.schedule(3, t0 + timedelta(hours=2))
+    index.schedule(2, t0 + timedelta(hours=5))  # moved later
+    index.discard(3)
+
+    assert index.next_fire_at() == t0 + timedelta(hours=3)
+    assert index.pop_due(t0 + timedelta(hours=4)) == [1]
+    assert index.pop_due(t0 + timedelta(hours=4)) == []
+    assert index.pop_due(t0 + timedelta(hours=6)) == [2]
+    assert len(index) == 0
+
+
+def test_engine_fires_when_task_enters_window():
+    _, SessionLocal = setup_session()
+    engine = ReminderEngine()
+    with SessionLocal() as db:
+        user = seed_user(db)
+        task = Task(title="t", assignee_id=user.id, due_date=date(2026, 1, 11))
+        db.add(task)
+        db.commit()
+
+        # rebuilt from the DB on the first tick
+        assert engine.run(db, now=datetime(2026, 1, 9, 23, 59)) == 0
+        assert engine.next_fire_at() == datetime(2026, 1, 10, 0, 0)
+        assert engine.run(db, now=datetime(2026, 1, 10, 0, 0)) == 1
+        assert len(engine.index) == 0
+        assert engine.run(db, now=datetime(2026, 1, 10, 1, 0)) == 0
+
+
+def test_engine_catches_up_on_changes_from_other_processes():
+    _, SessionLocal = setup_session()
+    engine = ReminderEngine()
+    with SessionLocal() as db:
+        user = seed_user(db)
+        engine.run(db, now=datetime(2026, 1, 1))
+        assert len(engine.index) == 0
+
+        # written without engine.track(), as another worker would
+        db.add(Task(title="later", assignee_id=user.id, due_date=date(2026, 1, 11)))
+        db.commit()
+        assert engine.run(db, now=datetime(2026, 1, 10, 12, 0)) == 1
+
+
+def test_engine_rebuild_catches_rows_committed_behind_the_watermark(monkeypatch):
+    _, SessionLocal = setup_session()
+    engine = ReminderEngine(rebuild_seconds=3600)
+    with SessionLocal() as db:
+        user = seed_user(db)
+        engine.run(db, now=datetime(2026, 1, 1))
+
+        # stamped long before it committed, as by a transaction held open
+        stale = datetime.utcnow() - timedelta(minutes=10)
+        db.add(Task(title="late", assignee_id=user.id, due_date=date(2026, 1, 11),
+                    created_at=stale, updated_at=stale))
+        db.commit()
+        assert engine.run(db, now=datetime(2026, 1, 10, 12, 0)) == 0
+
+        real = time.monotonic
+        monkeypatch.setattr("task_manager_app.core.reminders.clock.monotonic", lambda: real() + 3600)
+        assert engine.run(db, now=datetime(2026, 1, 10, 12, 1)) == 1
+
+
+def test_engine_sweeps_only_tasks_becoming_due():
+    sql_engine, SessionLocal = setup_session()
+    engine = ReminderEngine()
+    with SessionLocal() as db:
+        user = seed_user(db)
+        db.add_all([
+            Task(title=f"far-{i}", assignee_id=user.id, due_date=date(2026, 6, 1))
+            for i in range(200)
+        ])
+        db.add(Task(title="soon", assignee_id=user.id, due_date=date(2026, 1, 11)))
+        db.commit()
+        engine.run(db, now=datetime(2026, 1, 1))
+
+        params = []
+        event.listen(sql_engine, "before_cursor_execute",
+                     lambda conn, cursor, stmt, parameters, *rest: params.append((stmt, parameters)))
+        assert engine.run(db, now=datetime(2026, 1, 10, 12, 0)) == 1
+        selects = [p for s, p in params if "NOT (EXISTS" in s]
+        assert len(selects) == 1
+        assert len([p for p in selects[0] if isinstance(p, int)]) < 5
+
+
+def auth_headers(client):
+    payload = {
+        "email": "user@example.com",
+        "full_name": "Test User",
+        "password": "secret",
+    }
+    client.post("/auth/signup", json=payload)
+    res = client.post(
+        "/auth/login",
+        data={"username": payload["email"], "password": payload["password"]},
+    )
+    token = res.json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_task_mutations_update_the_index(client, db_session):
+    reminder_engine.rebuild(db_session)
+    try:
+        headers = auth_headers(client)
+        res = client.post("/tasks/", json={"title": "T", "due_date": "2026-01-11"}, headers=headers)
+        task_id = res.json()["id"]
+        assert task_id in reminder_engine.index
+
+        client.patch(f"/tasks/{task_id}", json={"status": "completed"}, headers=headers)
+        assert task_id not in reminder_engine.index
+
+        client.patch(f"/tasks/{task_id}", json={"status": "in_progress"}, headers=headers)
+        assert task_id in reminder_engine.index
+
+        client.delete(f"/tasks/{task_id}", headers=headers)
+        assert task_id not in reminder_engine.index
+    finally:
+        reminder_engine.deactivate()
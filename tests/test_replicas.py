@@ -0,0 +1,102 @@
+import asyncio
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+
+from task_manager_app.core import database, replicas
+from task_manager_app.core.database import Base, async_url, make_engine
+from task_manager_app.core.replicas import Replica, ReplicaRouter
+from task_manager_app.models.task import Task
+from task_manager_app.models.user import User
+
+
+def auth_headers(client: TestClient):
+    payload = {"email": "user@example.com", "full_name": "Test User", "password": "secret"}
+    client.post("/auth/signup", json=payload)
+    res = client.post("/auth/login", data={"username": payload["email"], "password": "secret"})
+    return {"Authorization": f"Bearer {res.json()['access_token']}"}
+
+
+def make_replica(url: str, name: str = "replica") -> Replica:
+    engine = create_async_engine(async_url(url), poolclass=NullPool)
+    return Replica(name, async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False))
+
+
+def make_router(*replica_list: Replica) -> ReplicaRouter:
+    return ReplicaRouter(list(replica_list), max_lag_seconds=5,
+                         check_seconds=0, sticky_seconds=10)
+
+
+@pytest.fixture
+def replica_db(tmp_path, monkeypatch):
+    """A second SQLite file standing in for a replica of the test database."""
+    url = f"sqlite:///{tmp_path / 'replica.db'}"
+    Base.metadata.create_all(bind=make_engine(url))
+    router = make_router(make_replica(url))
+    monkeypatch.setattr(database, "replica_router", router)
+    return sessionmaker(bind=make_engine(url))
+
+
+def titles(client: TestClient, headers) -> list[str]:
+    return [t["title"] for t in client.get("/tasks/", headers=headers).json()]
+
+
+def test_reads_use_the_replica_except_right_after_own_writes(client: TestClient, db_session,
+                                                             replica_db, monkeypatch):
+    headers = auth_headers(client)
+    # the replica hasn't received the account yet: auth falls back to the primary
+    assert client.get("/users/me", headers=headers).status_code == 200
+
+    user = db_session.scalar(select(User))
+    with replica_db() as replica:
+        replica.execute(insert(User), [{"id": user.id, "email": user.email,
+                                        "hashed_password": "x", "role": user.role}])
+        replica.execute(insert(Task), [{"title": "replicated", "assignee_id": user.id}])
+        replica.commit()
+
+    assert titles(client, headers) == ["replicated"]
+
+    assert client.post("/tasks/", json={"title": "mine"}, headers=headers).status_code == 201
+    assert titles(client, headers) == ["mine"]  # read-your-writes: the primary
+
+    real = time.monotonic
+    monkeypatch.setattr("task_manager_app.core.cache.time.monotonic", lambda: real() + 11)
+    assert titles(client, headers) == ["replicated"]
+
+
+def test_lagging_or_unreachable_replicas_fall_back_to_the_primary(tmp_path, monkeypatch):
+    url = f"sqlite:///{tmp_path / 'replica.db'}"
+    Base.metadata.create_all(bind=make_engine(url))
+    first, second = make_replica(url, "first"), make_replica(url, "second")
+    router = make_router(first, second)
+    (tmp_path / "broken.db").write_bytes(b"not a database" * 100)
+    down = make_replica(f"sqlite:///{tmp_path / 'broken.db'}").sessionmaker
+    real_lag = replicas.replication_lag
+
+    async def fake_lag(replica: Replica) -> float:
+        return 60.0 if replica is second else await real_lag(replica)
+
+    async def pick(n: int) -> list:
+        return [await router.sessionmaker_for(None) for _ in range(n)]
+
+    async def scenario():
+        assert await pick(4) == [first.sessionmaker, second.sessionmaker] * 2
+
+        monkeypatch.setattr(replicas, "replication_lag", fake_lag)
+        assert await pick(3) == [first.sessionmaker] * 3
+        monkeypatch.undo()
+
+        first.sessionmaker = down
+        assert await pick(3) == [second.sessionmaker] * 3
+        assert not first.healthy
+
+        second.sessionmaker = down
+        assert await pick(2) == [None, None]  # the primary
+
+    # one loop throughout: aiosqlite threads answer on the loop that opened them
+    asyncio.run(scenario())
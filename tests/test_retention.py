@@ -0,0 +1,122 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+
+from task_manager_app.core import database, retention
+from task_manager_app.core.database import Base
+from task_manager_app.core.reminders import ReminderEngine
+from task_manager_app.core.retention import apply_retention, compact, run_retention
+from task_manager_app.models.notification import Notification, NotificationArchive, NotificationKind
+from task_manager_app.models.task import Status, Task
+from task_manager_app.models.user import User
+
+NOW = datetime(2026, 6, 1, 12, 0)
+
+
+@pytest.fixture
+def retention_db(monkeypatch, tmp_path):
+    # a file database, so VACUUM has a file to rewrite
+    engine = create_engine(f"sqlite:///{tmp_path / 'retention.db'}")
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+    monkeypatch.setattr(database, "SessionLocal", SessionLocal)
+    with SessionLocal() as db:
+        user = User(email="user@example.com", hashed_password="x")
+        db.add(user)
+        db.commit()
+    return engine, SessionLocal
+
+
+def seed(db, count, *, age_days, read, now=NOW):
+    created = now - timedelta(days=age_days)
+    db.add_all(Notification(user_id=1, message=f"{age_days}d #{i}", created_at=created,
+                            read_at=created if read else None)
+               for i in range(count))
+    db.commit()
+
+
+def test_deletes_old_read_and_archives_old_unread(retention_db):
+    _, SessionLocal = retention_db
+    with SessionLocal() as db:
+        seed(db, 5, age_days=200, read=True)   # deleted
+        seed(db, 3, age_days=400, read=False)  # archived
+        seed(db, 4, age_days=10, read=True)    # kept: too recent
+        seed(db, 2, age_days=200, read=False)  # kept: unread, not old enough to archive
+
+        report = apply_retention(db, NOW, retention_days=90, archive_days=365, batch_size=2)
+        assert (report.deleted, report.archived) == (5, 3)
+
+        assert db.scalar(select(func.count()).select_from(Notification)) == 6
+        archived = db.scalars(select(NotificationArchive)).all()
+        assert [a.message for a in archived] == ["400d #0", "400d #1", "400d #2"]
+        assert all(a.read_at is None and a.archived_at == NOW for a in archived)
+
+        # nothing left to do
+        report = apply_retention(db, NOW, retention_days=90, archive_days=365)
+        assert report.rows == 0
+
+
+def test_run_is_capped_and_resumes(retention_db):
+    _, SessionLocal = retention_db
+    with SessionLocal() as db:
+        seed(db, 7, age_days=200, read=True)
+        assert apply_retention(db, NOW, retention_days=90, archive_days=0,
+                               batch_size=2, max_rows=5).deleted == 5
+        assert apply_retention(db, NOW, retention_days=90, archive_days=0,
+                               batch_size=2, max_rows=5).deleted == 2
+
+
+def test_retention_disabled(retention_db):
+    _, SessionLocal = retention_db
+    with SessionLocal() as db:
+        seed(db, 3, age_days=1000, read=True)
+        seed(db, 3, age_days=1000, read=False)
+        assert apply_retention(db, NOW, retention_days=0, archive_days=0).rows == 0
+
+
+def test_reminders_are_not_resent_after_retention(retention_db):
+    _, SessionLocal = retention_db
+    with SessionLocal() as db:
+        due_soon = Task(title="due soon", assignee_id=1, due_date=(NOW + timedelta(hours=12)).date())
+        overdue = Task(title="overdue", assignee_id=1, due_date=(NOW - timedelta(days=100)).date(),
+                       status=Status.completed)
+        db.add_all([due_soon, overdue])
+        db.commit()
+        old = NOW - timedelta(days=400)
+        db.add_all([
+            Notification(user_id=1, task_id=due_soon.id, kind=NotificationKind.due_soon,
+                         message="reminder", created_at=old, read_at=old),
+            Notification(user_id=1, task_id=due_soon.id, kind=NotificationKind.assigned,
+                         message="assigned", created_at=old),
+            Notification(user_id=1, task_id=overdue.id, kind=NotificationKind.due_soon,
+                         message="reminder", created_at=old, read_at=old),
+        ])
+        db.commit()
+
+        # only the completed task's reminder goes; the open task's rows are its dedupe keys
+        report = apply_retention(db, NOW, retention_days=90, archive_days=365)
+        assert (report.deleted, report.archived) == (1, 0)
+
+        # a freshly rebuilt engine, as in a worker that just took the lease
+        assert ReminderEngine().run(db, now=NOW) == 0
+        assert db.scalar(select(func.count()).select_from(Notification)) == 2
+
+
+def test_compact_vacuums_once_enough_pages_are_free(retention_db, monkeypatch):
+    engine, SessionLocal = retention_db
+    with SessionLocal() as db:
+        # run_retention works from the current time
+        seed(db, 2000, age_days=200, read=True, now=datetime.utcnow())
+        seed(db, 10, age_days=1, read=True, now=datetime.utcnow())
+    assert compact(engine) is False  # nothing free yet
+
+    monkeypatch.setattr(retention.settings, "notification_archive_days", 0)
+    monkeypatch.setattr(retention.settings, "retention_batch_pause_seconds", 0)
+    assert run_retention() == 2000
+    with engine.connect() as conn:
+        assert conn.exec_driver_sql("PRAGMA freelist_count").scalar() == 0
+        # ANALYZE ran too
+        assert conn.exec_driver_sql(
+            "SELECT count(*) FROM sqlite_stat1 WHERE tbl = 'notifications'").scalar()
@@ -0,0 +1,81 @@
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from jose import jwt, JWTError
+from sqlalchemy import event, select
+
+from task_manager_app.core.config import get_settings
+from task_manager_app.core.revocation import revocation_store, purge_expired_revocations
+from task_manager_app.core.security import verify_refresh_token, revoke_refresh_token
+from task_manager_app.models.revoked_token import RevokedToken
+
+settings = get_settings()
+
+
+def login(client: TestClient) -> dict:
+    payload = {"email": "user@example.com", "full_name": "Test User", "password": "secret"}
+    client.post("/auth/signup", json=payload)
+    res = client.post("/auth/login",
+                      data={"username": payload["email"], "password": payload["password"]})
+    return res.json()
+
+
+def test_refresh_token_works_once(client: TestClient, db_session):
+    old = login(client)["refresh_token"]
+
+    res = client.post("/auth/refresh", json={"refresh_token": old})
+    assert res.status_code == 200
+    new = res.json()["refresh_token"]
+
+    assert client.post("/auth/refresh", json={"refresh_token": old}).status_code == 401
+    assert client.post("/auth/refresh", json={"refresh_token": new}).status_code == 200
+    assert db_session.query(RevokedToken).count() == 2
+
+
+def test_revocation_is_seen_by_other_workers(client: TestClient):
+    old = login(client)["refresh_token"]
+    assert client.post("/auth/refresh", json={"refresh_token": old}).status_code == 200
+
+    # another worker starts with an empty in-process cache
+    revocation_store.clear()
+    assert client.post("/auth/refresh", json={"refresh_token": old}).status_code == 401
+
+
+def test_revoked_tokens_are_answered_from_cache(client: TestClient, db_session):
+    token = login(client)["refresh_token"]
+    assert revoke_refresh_token(token, db_session) is True
+    assert revoke_refresh_token(token, db_session) is False
+
+    statements = []
+    listener = lambda conn, cursor, stmt, *args: statements.append(stmt)  # noqa: E731
+    event.listen(db_session.bind, "before_cursor_execute", listener)
+    try:
+        for _ in range(3):
+            with pytest.raises(JWTError):
+                verify_refresh_token(token, db_session)
+    finally:
+        event.remove(db_session.bind, "before_cursor_execute", listener)
+    assert statements == []
+
+
+def test_legacy_token_without_jti_can_be_revoked(db_session):
+    legacy = jwt.encode({"sub": "1", "type": "refresh",
+                         "exp": datetime.utcnow() + timedelta(days=1)},
+                        settings.secret_key, algorithm=settings.algorithm)
+    assert verify_refresh_token(legacy, db_session) == "1"
+    assert revoke_refresh_token(legacy, db_session) is True
+    revocation_store.clear()
+    assert revocation_store.is_revoked(db_session, db_session.scalar(select(RevokedToken.jti)))
+
+
+def test_purge_drops_only_expired_revocations(db_session):
+    now = datetime(2026, 1, 10, 12, 0)
+    db_session.add_all([
+        RevokedToken(jti="expired", expires_at=now - timedelta(seconds=1), revoked_at=now),
+        RevokedToken(jti="live", expires_at=now + timedelta(days=1), revoked_at=now),
+    ])
+    db_session.commit()
+
+    assert purge_expired_revocations(db_session, now=now) == 1
+    assert db_session.scalars(select(RevokedToken.jti)).all() == ["live"]
@@ -0,0 +1,91 @@
+import asyncio
+import threading
+import time
+
+import httpx
+from fastapi import FastAPI
+
+from task_manager_app.core.scheduler import BackgroundScheduler
+
+
+def test_health_latency_flat_during_blocking_sweep():
+    app = FastAPI()
+
+    @app.get("/health")
+    async def health():
+        return {"status": "ok"}
+
+    sweep_started = threading.Event()
+
+    def large_sweep():
+        sweep_started.set()
+        time.sleep(1.0)  # a slow, fully blocking DB sweep
+
+    scheduler = BackgroundScheduler(max_workers=1)
+    scheduler.add_job("sweep", large_sweep, interval_seconds=0.01)
+
+    async def scenario():
+        scheduler.start()
+        while not sweep_started.is_set():
+            await asyncio.sleep(0.01)
+
+        latencies = []
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            for _ in range(20):
+                start = time.perf_counter()
+                res = await client.get("/health")
+                latencies.append(time.perf_counter() - start)
+                assert res.status_code == 200
+        await scheduler.shutdown()
+        return latencies
+
+    latencies = asyncio.run(scenario())
+    # Had the sweep run on the loop, the first request would wait ~1s
+    assert max(latencies) < 0.2
+    assert not scheduler.running
+
+
+def test_shutdown_waits_for_in_flight_run_and_stops():
+    calls = []
+    running = threading.Event()
+
+    def job():
+        running.set()
+        time.sleep(0.2)
+        calls.append(time.perf_counter())
+
+    scheduler = BackgroundScheduler(max_workers=1)
+    scheduler.add_job("job", job, interval_seconds=0.01)
+
+    async def scenario():
+        scheduler.start()
+        while not running.is_set():
+            await asyncio.sleep(0.01)
+        await scheduler.shutdown()
+        finished = len(calls)
+        await asyncio.sleep(0.1)
+        return finished
+
+    finished = asyncio.run(scenario())
+    assert finished >= 1          # the in-flight run completed
+    assert len(calls) == finished  # nothing ran after shutdown
+
+
+def test_failing_job_keeps_running():
+    attempts = []
+
+    def flaky():
+        attempts.append(1)
+        raise RuntimeError("boom")
+
+    scheduler = BackgroundScheduler(max_workers=1)
+    scheduler.add_job("flaky", flaky, interval_seconds=0.01)
+
+    async def scenario():
+        scheduler.start()
+        await asyncio.sleep(0.2)
+        await scheduler.shutdown()
+
+    asyncio.run(scenario())
+    assert len(attempts) > 1
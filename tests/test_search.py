@@ -0,0 +1,91 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+
+from task_manager_app.core.search import (
+    LikeSearch, SearchBackend, SqliteFtsSearch, get_search_backend, search_terms,
+)
+from task_manager_app.models.task import Task
+
+
+def auth_headers(client: TestClient):
+    payload = {
+        "email": "user@example.com",
+        "full_name": "Test User",
+        "password": "secret",
+    }
+    client.post("/auth/signup", json=payload)
+    res = client.post(
+        "/auth/login",
+        data={"username": payload["email"], "password": payload["password"]},
+    )
+    token = res.json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+def create(client, headers, title, description=None):
+    res = client.post("/tasks/", json={"title": title, "description": description}, headers=headers)
+    assert res.status_code == 201
+    return res.json()["id"]
+
+
+def test_backend_follows_dialect():
+    assert isinstance(get_search_backend("sqlite"), SqliteFtsSearch)
+    assert isinstance(get_search_backend("mysql"), LikeSearch)
+    assert search_terms('Report "Q3"* OR -x') == ["report", "q3", "or", "x"]
+
+
+def test_backend_without_apply_fails_on_construction():
+    class RankOnly(SearchBackend):
+        def rank(self, q):
+            return None
+
+    with pytest.raises(TypeError):
+        RankOnly()
+
+
+def test_search_is_ranked_and_prefix_matched(client: TestClient):
+    headers = auth_headers(client)
+    weak = create(client, headers, "Plan offsite", "book a room for the budget review")
+    strong = create(client, headers, "Budget review", "budget numbers for the budget review")
+    create(client, headers, "Unrelated", "nothing to see")
+
+    res = client.get("/tasks/", params={"q": "budg rev"}, headers=headers)
+    assert res.status_code == 200
+    assert [t["id"] for t in res.json()] == [strong, weak]
+
+
+def test_search_tracks_updates_and_deletes(client: TestClient):
+    headers = auth_headers(client)
+    task_id = create(client, headers, "Draft launch email")
+
+    client.patch(f"/tasks/{task_id}", json={"title": "Draft press release"}, headers=headers)
+    assert client.get("/tasks/", params={"q": "launch"}, headers=headers).json() == []
+    assert [t["id"] for t in client.get("/tasks/", params={"q": "press"}, headers=headers).json()] == [task_id]
+
+    client.delete(f"/tasks/{task_id}", headers=headers)
+    assert client.get("/tasks/", params={"q": "press"}, headers=headers).json() == []
+
+
+def test_search_combines_with_filters_and_sorts(client: TestClient):
+    headers = auth_headers(client)
+    a = create(client, headers, "Fix login bug")
+    b = create(client, headers, "Fix signup bug")
+    client.patch(f"/tasks/{b}", json={"status": "completed"}, headers=headers)
+
+    res = client.get("/tasks/", params={"q": "fix", "status": "completed"}, headers=headers)
+    assert [t["id"] for t in res.json()] == [b]
+
+    res = client.get("/tasks/", params={"q": "bug", "sort": "id"}, headers=headers)
+    assert [t["id"] for t in res.json()] == [a, b]
+
+    # punctuation-only input matches nothing rather than erroring
+    assert client.get("/tasks/", params={"q": '"*'}, headers=headers).json() == []
+    assert client.get("/tasks/", params={"sort": "relevance"}, headers=headers).status_code == 400
+
+
+def test_sqlite_search_uses_fts_index(db_session):
+    stmt = get_search_backend("sqlite").apply(select(Task), "report")
+    sql = str(stmt.compile(dialect=db_session.bind.dialect, compile_kwargs={"literal_binds": True}))
+    plan = [row[3] for row in db_session.connection().exec_driver_sql("EXPLAIN QUERY PLAN " + sql)]
+    assert any("VIRTUAL TABLE INDEX" in step for step in plan), plan
@@ -0,0 +1,65 @@
+import json
+from datetime import date, datetime
+from typing import List
+
+import pytest
+from fastapi.testclient import TestClient
+from pydantic import TypeAdapter
+from sqlalchemy import select
+
+from task_manager_app.core import serialization
+from task_manager_app.models.notification import Notification
+from task_manager_app.models.task import Task
+from task_manager_app.models.user import User
+from task_manager_app.schemas.notification import NotificationOut
+from task_manager_app.schemas.task import TaskOut
+
+
+def auth_headers(client: TestClient):
+    payload = {"email": "user@example.com", "full_name": "Test User", "password": "secret"}
+    client.post("/auth/signup", json=payload)
+    res = client.post("/auth/login", data={"username": payload["email"], "password": "secret"})
+    return {"Authorization": f"Bearer {res.json()['access_token']}"}
+
+
+@pytest.fixture(params=["orjson", "json"])
+def encoder(request, monkeypatch):
+    if request.param == "orjson":
+        if serialization.orjson is None:
+            pytest.skip("orjson not installed")
+    else:
+        monkeypatch.setattr(serialization, "orjson", None)
+    return request.param
+
+
+def test_list_endpoints_match_the_response_models(client: TestClient, db_session, encoder):
+    headers = auth_headers(client)
+    client.post("/tasks/", json={"title": "Ünïcode \"quoted\"", "description": "line\nbreak",
+                                 "priority": "critical", "due_date": "2026-03-01"}, headers=headers)
+    client.post("/tasks/", json={"title": "plain"}, headers=headers)
+    user = db_session.scalar(select(User).where(User.email == "user@example.com"))
+    db_session.add_all([
+        Notification(user_id=user.id, message="hello", created_at=datetime(2026, 1, 1, 12)),
+        Notification(user_id=user.id, message="read", created_at=datetime(2026, 1, 2, 8, 30, 0, 5),
+                     read_at=datetime(2026, 1, 3)),
+    ])
+    db_session.commit()
+
+    res = client.get("/tasks/", headers=headers)
+    assert res.headers["content-type"] == "application/json"
+    tasks = db_session.scalars(select(Task).order_by(Task.id)).all()
+    expected = TypeAdapter(List[TaskOut]).dump_json([TaskOut.model_validate(t) for t in tasks])
+    assert res.content == expected
+
+    res = client.get("/notifications/", headers=headers)
+    rows = db_session.scalars(select(Notification).order_by(Notification.id.desc())).all()
+    expected = TypeAdapter(List[NotificationOut]).dump_json(
+        [NotificationOut.model_validate(n) for n in rows])
+    assert res.content == expected
+
+
+def test_fallback_encodes_dates(monkeypatch):
+    monkeypatch.setattr(serialization, "orjson", None)
+    body = serialization.rows_to_json([(1, date(2026, 1, 2), datetime(2026, 1, 2, 3, 4, 5))],
+                                      ["id", "due", "at"])
+    assert json.loads(body) == [{"id": 1, "due": "2026-01-02", "at": "2026-01-02T03:04:05"}]
@@ -0,0 +1,24 @@
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# run in a fresh interpreter: this one has long since imported everything
+PROBE = """
+import json, sys
+import main
+heavy = sorted({m.split(".")[0] for m in sys.modules} & {"passlib", "bcrypt", "cryptography"})
+print(json.dumps({"heavy": heavy, "jose.jwt": "jose.jwt" in sys.modules}))
+"""
+
+
+def test_app_starts_without_ddl_or_crypto_imports(tmp_path):
+    db = tmp_path / "app.db"
+    env = dict(os.environ, DATABASE_URL=f"sqlite:///{db}", CREATE_TABLES_ON_STARTUP="false")
+    env.pop("ADMIN_EMAIL", None)
+    out = subprocess.run([sys.executable, "-c", PROBE], cwd=ROOT, env=env,
+                         capture_output=True, text=True, check=True).stdout
+    assert json.loads(out) == {"heavy": [], "jose.jwt": False}
+    assert not db.exists()  # no connection was even opened
@@ -0,0 +1,119 @@
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, delete, select
+from sqlalchemy.orm import sessionmaker
+
+from task_manager_app.core import stats
+from task_manager_app.core.database import Base
+from task_manager_app.models.task import Priority, Status, Task
+from task_manager_app.models.task_stat import TaskStat, UNASSIGNED
+from task_manager_app.models.user import User, Role
+
+
+def auth_headers(client: TestClient, email: str = "user@example.com"):
+    payload = {"email": email, "full_name": "Test User", "password": "secret"}
+    client.post("/auth/signup", json=payload)
+    res = client.post("/auth/login", data={"username": email, "password": "secret"})
+    return {"Authorization": f"Bearer {res.json()['access_token']}"}
+
+
+def make_manager(db_session, email="user@example.com"):
+    user = db_session.scalar(select(User).where(User.email == email))
+    user.role = Role.manager
+    db_session.commit()
+    return user
+
+
+def test_rollup_tracks_every_write_path(client: TestClient, db_session):
+    other_headers = auth_headers(client, "other@example.com")
+    headers = auth_headers(client)
+    manager = make_manager(db_session)
+    other = db_session.scalar(select(User).where(User.email == "other@example.com"))
+    yesterday = (date.today() - timedelta(days=1)).isoformat()
+
+    a = client.post("/tasks/", json={"title": "a", "priority": "high", "progress": 40,
+                                     "due_date": yesterday}, headers=headers).json()["id"]
+    b = client.post("/tasks/", json={"title": "b", "assignee_id": other.id},
+                    headers=headers).json()["id"]
+    client.patch(f"/tasks/{b}", json={"status": "completed"}, headers=other_headers)
+    client.patch(f"/tasks/{a}", json={"assignee_id": other.id, "progress": 60}, headers=headers)
+    bulk = client.post("/tasks/bulk", json=[{"title": f"bulk {i}", "due_date": yesterday}
+                                            for i in range(4)], headers=headers).json()["ids"]
+    client.patch("/tasks/bulk", json=[{"id": bulk[0], "status": "in_progress", "progress": 10},
+                                      {"id": bulk[1], "priority": "low"}], headers=headers)
+    client.post("/tasks/bulk/delete", json=[bulk[2], bulk[2]], headers=headers)
+    c = client.post("/tasks/", json={"title": "c"}, headers=headers).json()["id"]
+    client.delete(f"/tasks/{c}", headers=headers)
+    client.post("/tasks/import", files={"file": ("t.ndjson", b'{"title": "imported"}\n')},
+                headers=headers)
+
+    rollup = client.get("/tasks/stats", headers=headers).json()
+    assert rollup == client.get("/tasks/stats?source=live", headers=headers).json()
+    assert rollup["total"] == 6
+    assert rollup["by_status"] == {"not_started": 4, "in_progress": 1, "completed": 1}
+    assert rollup["by_priority"] == {"medium": 4, "high": 1, "low": 1}
+    # a (now other's) and the three remaining bulk tasks were due yesterday
+    assert rollup["overdue"] == 4
+    by_assignee = {s["assignee_id"]: s for s in rollup["by_assignee"]}
+    assert by_assignee[other.id]["count"] == 2
+    assert by_assignee[other.id]["overdue"] == 1
+    assert by_assignee[other.id]["average_progress"] == 80.0
+    assert by_assignee[manager.id]["count"] == 4
+
+    # a rebuild from the tasks table agrees with the incremental rollup
+    before = sorted(stats.rollup_groups(db_session))
+    stats.rebuild(db_session)
+    assert sorted(stats.rollup_groups(db_session)) == before
+
+
+def test_deltas_are_written_on_commit_only():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    task = SimpleNamespace(assignee_id=None, status=Status.blocked, priority="low", progress=30)
+    with sessionmaker(bind=engine)() as db:
+        assert stats.rollup_groups(db) == []
+        stats.record(db, task)
+        db.rollback()
+        db.commit()
+        assert stats.rollup_groups(db) == []
+
+        stats.record(db, task)
+        stats.record(db, task)
+        db.commit()
+        assert stats.rollup_groups(db) == [(UNASSIGNED, "blocked", "low", 2, 60)]
+        stats.record(db, task, -1)
+        db.commit()
+        assert stats.rollup_groups(db) == [(UNASSIGNED, "blocked", "low", 1, 30)]
+
+
+def test_users_only_see_their_own_stats(client: TestClient, db_session):
+    other_headers = auth_headers(client, "other@example.com")
+    headers = auth_headers(client)
+    client.post("/tasks/", json={"title": "mine"}, headers=headers)
+    client.post("/tasks/", json={"title": "theirs"}, headers=other_headers)
+
+    res = client.get("/tasks/stats", headers=headers)
+    assert res.status_code == 200
+    assert res.json()["total"] == 1
+    # asking for someone else's is ignored
+    other = db_session.scalar(select(User).where(User.email == "other@example.com"))
+    assert client.get(f"/tasks/stats?assignee_id={other.id}", headers=headers).json()["total"] == 1
+
+
+def test_backfill_fills_a_rollup_created_next_to_existing_tasks():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    with sessionmaker(bind=engine)() as db:
+        assert stats.backfill(db) is False  # no tasks: nothing to count
+        db.add_all([Task(title="a", priority=Priority.high, progress=20),
+                    Task(title="b", status=Status.completed, progress=100)])
+        db.commit()
+        # as if create_all had only just added task_stats
+        db.execute(delete(TaskStat))
+        db.commit()
+
+        assert stats.backfill(db) is True
+        assert sorted(stats.rollup_groups(db)) == sorted(stats.live_groups(db))
+        assert stats.backfill(db) is False  # already filled
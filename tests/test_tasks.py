@@ -1,4 +1,8 @@
 from fastapi.testclient import TestClient
+from sqlalchemy import select, update
+
+from task_manager_app.models.user import Role, User
+from task_manager_app.routers.users import user_cache
 
 
 def auth_headers(client: TestClient):
@@ -47,3 +51,28 @@ def test_task_crud_flow(client: TestClient):
     # Confirm deletion
     res = client.get(f"/tasks/{task_id}", headers=headers)
     assert res.status_code == 404
+
+
+
+def test_only_managers_and_admins_set_an_assignee(client: TestClient, db_session):
+    client.post("/auth/signup", json={"email": "other@example.com", "full_name": "Other",
+                                      "password": "secret"})
+    other = db_session.scalar(select(User.id).where(User.email == "other@example.com"))
+    headers = auth_headers(client)
+    me = client.get("/users/me", headers=headers).json()["id"]
+
+    # a regular user may not name an assignee, not even themselves
+    for assignee_id in (me, other):
+        res = client.post("/tasks/", json={"title": "T", "assignee_id": assignee_id}, headers=headers)
+        assert res.status_code == 403
+    res = client.post("/tasks/", json={"title": "T", "assignee_id": 0}, headers=headers)
+    assert (res.status_code, res.json()["assignee_id"]) == (201, me)
+
+    for role in (Role.manager, Role.admin):
+        db_session.execute(update(User).where(User.id == me).values(role=role))
+        db_session.commit()
+        user_cache.clear()
+        for assignee_id in (me, other):
+            res = client.post("/tasks/", json={"title": "T", "assignee_id": assignee_id},
+                              headers=headers)
+            assert (res.status_code, res.json()["assignee_id"]) == (201, assignee_id)
@@ -0,0 +1,114 @@
+from contextlib import contextmanager
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event, select
+
+from task_manager_app.core import database
+from task_manager_app.core.cache import TTLCache
+from task_manager_app.core.security import token_cache
+from task_manager_app.models.user import User, Role
+from task_manager_app.routers.users import user_cache
+
+
+def auth_headers(client: TestClient):
+    payload = {
+        "email": "user@example.com",
+        "full_name": "Test User",
+        "password": "secret",
+    }
+    client.post("/auth/signup", json=payload)
+    res = client.post(
+        "/auth/login",
+        data={"username": payload["email"], "password": payload["password"]},
+    )
+    token = res.json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+@contextmanager
+def count_queries():
+    statements = []
+
+    def record(conn, cursor, stmt, *args):
+        statements.append(stmt)
+
+    # request handlers query through the async engine
+    event.listen(database.async_engine.sync_engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(database.async_engine.sync_engine, "before_cursor_execute", record)
+
+
+def test_ttl_cache_expires_and_evicts(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr("task_manager_app.core.cache.time.monotonic", lambda: clock[0])
+    cache = TTLCache(maxsize=2, ttl_seconds=10)
+    cache.set("a", 1)
+    cache.set("b", 2, ttl_seconds=1)
+    assert cache.get("a") == 1
+    cache.set("c", 3)  # evicts least recently used: "b"
+    assert cache.get("b") is None
+    clock[0] += 11
+    assert cache.get("a") is None
+    assert cache.stats() == {"size": 1, "hits": 1, "misses": 2, "evictions": 1}
+
+    disabled = TTLCache(maxsize=0, ttl_seconds=10)
+    disabled.set("a", 1)
+    assert disabled.get("a") is None
+
+
+def test_repeat_requests_skip_user_lookup(client: TestClient, db_session):
+    headers = auth_headers(client)
+    with count_queries() as statements:
+        assert client.get("/users/me", headers=headers).status_code == 200
+        first = len(statements)
+        for _ in range(5):
+            assert client.get("/users/me", headers=headers).status_code == 200
+
+    assert first == 1            # the user lookup
+    assert len(statements) == 1  # nothing after that
+    assert user_cache.stats()["hits"] >= 5
+    assert token_cache.stats()["hits"] >= 5
+
+
+def test_role_change_and_delete_evict(client: TestClient, db_session):
+    headers = auth_headers(client)
+    assert client.get("/users/me", headers=headers).json()["role"] == "user"
+
+    user = db_session.scalar(select(User).where(User.email == "user@example.com"))
+    user.role = Role.manager
+    db_session.commit()
+    assert client.get("/users/me", headers=headers).json()["role"] == "manager"
+
+    db_session.delete(user)
+    db_session.commit()
+    assert client.get("/users/me", headers=headers).status_code == 401
+
+
+def test_eviction_waits_for_the_commit(client: TestClient, db_session):
+    headers = auth_headers(client)
+    client.get("/users/me", headers=headers)
+    user = db_session.scalar(select(User).where(User.email == "user@example.com"))
+
+    user.role = Role.manager
+    db_session.flush()
+    # a concurrent request still sees the committed row and caches it
+    assert client.get("/users/me", headers=headers).json()["role"] == "user"
+    db_session.commit()
+    assert client.get("/users/me", headers=headers).json()["role"] == "manager"
+
+    user.role = Role.admin
+    db_session.flush()
+    db_session.rollback()
+    assert client.get("/users/me", headers=headers).json()["role"] == "manager"
+    assert user_cache.get(user.id) is not None  # rolled back: nothing to evict
+
+
+def test_tampered_token_is_rejected(client: TestClient):
+    headers = auth_headers(client)
+    assert client.get("/users/me", headers=headers).status_code == 200
+    header, payload, signature = headers["Authorization"].split(".")
+    flipped = "A" if signature[5] != "A" else "B"
+    bad = {"Authorization": f"{header}.{payload}.{signature[:5]}{flipped}{signature[6:]}"}
+    assert client.get("/users/me", headers=bad).status_code == 401